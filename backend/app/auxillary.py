@@ -41,122 +41,91 @@ def check_flow_investment(flow_data):
         return flow_data["nominal_value"]
 
 
-def create_io_data(flowchart_data, flowchart_component) -> tuple[dict, dict]:
-    """Build input/output flow mappings for a flowchart component.
+def _port_targets(node_labels: dict, ports: dict) -> dict[str, str]:
+    """Map the connected drawflow ports of a node to the label of their target.
 
-    - param flowchart_data: full flowchart node/connection map
-    - param flowchart_component: component node with input/output ports
-    - returns: tuple of input_data, output_data keyed by bus name
+    - param node_labels: node name by drawflow node id
+    - param ports: drawflow inputs or outputs of the node, keyed by port code
+    - returns: mapping of port code to the label of the first connected node
     """
-    # build component_data["inputs"]
-    component_data = flowchart_component["data"]
-
-    input_data = {}
-    output_data = {}
-
-    if component_data["connections"] is not None:
-        # build component_data["inputs"]
-        for input_name in flowchart_component["inputs"]:
-            print(len(flowchart_component["inputs"][input_name]['connections']))
-            if len(flowchart_component["inputs"][input_name]['connections']) > 0:
-                target_bus_id = flowchart_component["inputs"][input_name]['connections'][0]["node"]
-                target_bus_name = flowchart_data[target_bus_id]["name"]
+    return {
+        port_code: node_labels[port["connections"][0]["node"]]
+        for port_code, port in ports.items()
+        if len(port["connections"]) > 0
+    }
 
-                # flow_data = component_data["connections"]["inputs"][input_name]["formInfo"]
-                for node_input in component_data["connections"]["inputs"]:
-                    flow_data = node_input["formInfo"]
-                    flow_data["custom_properties"] = {}
 
-                    print(flow_data.keys())
+def build_flow(form_info: dict) -> EnFlow:
+    """Create an `EnFlow` from the form of a flowchart connection.
 
-                    flow_data["nominal_value"] = check_flow_investment(flow_data)
+    `constraint_*` values become custom properties of the flow. The form
+    itself is left unchanged.
 
-                    # Replace constraint shit with custom_attributes
-                    del_list = []
-                    constraint_filter_flow_data_keys = [key for key in flow_data.keys() if key.startswith("constraint_")]
-                    for key in constraint_filter_flow_data_keys:
-                        print(f"Check {key} for constraint.")
-                        if key.startswith("constraint_") and flow_data[key] is not None:
-                            flow_data["custom_properties"][key.replace("constraint_", "")] = float(flow_data[key])
-                        del_list.append(key)
-
-                    if flow_data["custom_properties"] == {}:
-                        del_list.append("custom_properties")
+    - param form_info: flow form of the connection
+    - returns: EnFlow
+    """
+    flow_data = {}
+    custom_properties = {}
 
-                    for key in del_list:
-                        del flow_data[key]
+    for key, value in form_info.items():
+        if key.startswith("constraint_"):
+            if value is not None:
+                custom_properties[key.replace("constraint_", "")] = float(value)
+        elif key != "custom_properties":
+            flow_data[key] = value
 
-                    input_data[target_bus_name] = EnFlow(**flow_data)
+    if custom_properties:
+        flow_data["custom_properties"] = custom_properties
 
-        # build component_data["outputs"]
-        for output_name in flowchart_component["outputs"]:
-            if len(flowchart_component["outputs"][output_name]['connections']) > 0:
-                target_bus_id = flowchart_component["outputs"][output_name]['connections'][0]["node"]
-                target_bus_name = flowchart_data[target_bus_id]["name"]
+    flow_data["nominal_value"] = check_flow_investment(flow_data)
 
-                for output in component_data["connections"]["outputs"]:
-                    flow_data: dict = output["formInfo"]
-                    flow_data["custom_properties"] = {}
+    return EnFlow(**flow_data)
 
-                    print(flow_data.keys())
 
-                    # Replace constraint shit with custom_attributes
-                    del_list = []
-                    constraint_filter_flow_data_keys = [key for key in flow_data.keys() if key.startswith("constraint_")]
-                    for key in constraint_filter_flow_data_keys:
-                        print(f"Check {key} for constraint.")
-                        if key.startswith("constraint_") and flow_data[key] is not None:
-                            flow_data["custom_properties"][key.replace("constraint_", "")] = float(flow_data[key])
-                        del_list.append(key)
+def create_io_data(port_targets, flowchart_component) -> tuple[dict, dict]:
+    """Build input/output flow mappings for a flowchart component.
 
-                    if flow_data["custom_properties"] == {}:
-                        del_list.append("custom_properties")
+    The flow forms stored on the component are indexed by the code of their
+    port, so every connected port yields exactly one flow.
 
-                    for key in del_list:
-                        del flow_data[key]
+    - param port_targets: bus label by port code, for "inputs" and "outputs"
+    - param flowchart_component: component node with input/output ports
+    - returns: tuple of input_data, output_data keyed by bus name
+    """
+    connections = flowchart_component["data"]["connections"]
+    io_data = {}
 
-                    flow_data["nominal_value"] = check_flow_investment(flow_data)
+    for direction, port_key in (("inputs", "input_port"), ("outputs", "output_port")):
+        io_data[direction] = {}
+        if connections is None or not port_targets[direction]:
+            continue
 
-                    output_data[target_bus_name] = EnFlow(**flow_data)
+        forms = {
+            connection["baseInfo"][port_key]: connection["formInfo"]
+            for connection in connections[direction]
+        }
+        for port_code, bus_label in port_targets[direction].items():
+            if port_code in forms:
+                io_data[direction][bus_label] = build_flow(forms[port_code])
 
-    return input_data, output_data
+    return io_data["inputs"], io_data["outputs"]
 
 
-def build_conversion_factors(flowchart_data, flowchart_component) -> dict:
+def build_conversion_factors(port_targets, flowchart_component) -> dict:
     """Compute conversion factors per bus for a component's ports.
 
-    - param flowchart_data: flowchart metadata indexed by node id
+    - param port_targets: bus label by port code, for "inputs" and "outputs"
     - param flowchart_component: component node with port definitions
     - returns: mapping of bus name to conversion factor
     """
     component_ports = flowchart_component["data"]["ports"]
     conversion_factors = {}
 
-    print(component_ports)
-
-    # build conversion_factors
-    for input_port in component_ports["inputs"]:
-        input_name = component_ports["inputs"][input_port["id"]]["code"]
-
-        if len(flowchart_component["inputs"][input_name]['connections']) > 0:
-            target_bus_id = flowchart_component["inputs"][input_name]['connections'][0]["node"]
-            target_bus_name = flowchart_data[target_bus_id]["name"]
-
-            conversion_value = component_ports["inputs"][input_port["id"]]["timeSeries"]
-            if conversion_value is not None:
-                conversion_factors[target_bus_name] = conversion_value
-
-    for output_port in component_ports["outputs"]:
-        output_name = component_ports["outputs"][output_port["id"]]["code"]
-
-        if len(flowchart_component["outputs"][output_name]['connections']) > 0:
-            target_bus_id = flowchart_component["outputs"][output_name]['connections'][0]["node"]
-            target_bus_name = flowchart_data[target_bus_id]["name"]
-
-            conversion_value = component_ports["outputs"][output_port["id"]]["timeSeries"]
-
-            if conversion_value is not None:
-                conversion_factors[target_bus_name] = conversion_value
+    for direction in ("inputs", "outputs"):
+        for port in component_ports[direction]:
+            bus_label = port_targets[direction].get(port["code"])
+            if bus_label is not None and port["timeSeries"] is not None:
+                conversion_factors[bus_label] = port["timeSeries"]
 
     return conversion_factors
 
@@ -164,28 +133,35 @@ def build_conversion_factors(flowchart_data, flowchart_component) -> dict:
 def convert_gui_json_to_ensys(flowchart_data: dict) -> EnEnergysystem:
     """Convert GUI flowchart JSON into an `EnEnergysystem` graph.
 
+    The bus labels of all nodes are indexed once; each flow is built once
+    from the connection stored on its component. The flowchart data is not
+    modified.
+
     - param flowchart_data: dict of nodes/ports from the UI flowchart
     - returns: populated `EnEnergysystem` with buses, flows, and assets
     """
     ensys_es = EnEnergysystem()
+    # buses are referenced by the id of their node
+    node_labels = {node_id: node["name"] for node_id, node in flowchart_data.items()}
 
-    for flowchart_index in flowchart_data:
+    for flowchart_component in flowchart_data.values():
         ensys_data = {}
-        flowchart_component = flowchart_data[flowchart_index]
         component_data = flowchart_component["data"]
 
         if flowchart_component["class"] != "bus":
-            input_data, output_data = create_io_data(flowchart_data, flowchart_component)
+            port_targets = {
+                direction: _port_targets(node_labels, flowchart_component[direction])
+                for direction in ("inputs", "outputs")
+            }
+            input_data, output_data = create_io_data(port_targets, flowchart_component)
             ensys_data["inputs"] = input_data
             ensys_data["outputs"] = output_data
 
             # change name to label
             ensys_data["label"] = component_data["name"]
 
-            del component_data["name"]
-
         if flowchart_component["class"] in ["converter", "transformer"]:
-            conversion_factors = build_conversion_factors(flowchart_data, flowchart_component)
+            conversion_factors = build_conversion_factors(port_targets, flowchart_component)
             ensys_data["conversion_factors"] = conversion_factors
 
             ensys_component = EnConverter(**ensys_data)
@@ -10,6 +10,7 @@ The module provides:
     - Prometheus metrics for task monitoring
     - Logging setup for task execution
     - Core simulation task implementation
+    - Parameter sweep tasks (fan-out over variants and summary)
 """
 
 # Standard Library
@@ -17,25 +18,62 @@ import json
 import logging
 import os
 import pathlib
+import signal
 from datetime import datetime
 
-from celery.signals import after_setup_logger
+from celery.signals import after_setup_logger, celeryd_after_setup
 from celery.utils.log import get_task_logger
 from fastapi import HTTPException
 from oemof import solph
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
 from starlette import status
 
 # Third Party
-from celery import Celery
+from celery import Celery, chord
 # Local Application
 from ensys.components import EnModel
 from .auxillary import convert_gui_json_to_ensys
 from .core.config import get_settings
 from .db import SessionLocal
-from .scenario.model import EnScenarioDB
+from .scenario.model import DiagnosticsLevel, EnScenarioDB
+from .simulation.artifacts import (
+    collect_garbage,
+    compress_artifacts,
+    enforce_quota,
+    evict_expired,
+)
+from .simulation.diagnostics import lp_export_path, write_compressed_lp
+from .simulation.isolation import (
+    SolveCancellation,
+    SolveJob,
+    SolveLimits,
+    SolveOutcome,
+    SolveProcessError,
+    build_model,
+    load_energysystem,
+    run_isolated,
+)
 from .simulation.model import EnSimulationDB, Status
+from .simulation.pipeline import load_constraints
+from .simulation.progress import SolverLogTailer
+from .simulation.scheduler import LARGE_QUEUE, SMALL_QUEUE, SimulationScheduler
+from .simulation.snapshot import read_converted_model, write_snapshot
+from .simulation.solvers import (
+    available_cpus,
+    gurobipy_available,
+    reached_limit,
+    solver_interface,
+    solver_interfaces,
+    solver_options,
+    solver_threads,
+)
+from .simulation.timing import StageTimer, node_count, queue_wait_seconds, size_bucket
+from .simulation.warmstart import find_previous_simulation, supports_warm_start
+from .sweep import runner as sweep_runner
+from .sweep.model import EnSweepDB
+from .sweep.runner import SweepChunkJob, SweepVariantJob, VariantOutcome, read_variant_outcomes
 
 _settings = get_settings()
 
@@ -44,16 +82,144 @@ celery_app = Celery(
     broker=_settings.redis_url,
     backend=_settings.redis_url,
 )
+# simulations run for minutes to hours, so workers must not reserve more
+# tasks than they are running; the scheduler decides the order
+celery_app.conf.worker_prefetch_multiplier = 1
+celery_app.conf.task_routes = {"ensys.sweep_chunk": {"queue": LARGE_QUEUE}}
+celery_app.conf.beat_schedule = {
+    "artifact-maintenance": {
+        "task": "ensys.artifact_maintenance",
+        "schedule": float(_settings.artifacts_maintenance_interval_seconds),
+    },
+    "reap-simulations": {
+        "task": "ensys.reap_simulations",
+        "schedule": float(_settings.scheduler_reap_interval_seconds),
+    },
+}
+
+scheduler = SimulationScheduler(
+    slots={
+        SMALL_QUEUE: _settings.scheduler_small_slots,
+        LARGE_QUEUE: _settings.scheduler_large_slots,
+    },
+    max_running_per_user=_settings.scheduler_max_running_per_user,
+    max_queued_per_user=_settings.scheduler_max_queued_per_user,
+)
 
 # Prometheus metrics for monitoring
 task_counter = Counter("celery_tasks_total", "Total number of Celery tasks")
 task_in_progress = Gauge(
     "celery_tasks_in_progress", "Number of Celery tasks in progress"
 )
+stage_duration = Histogram(
+    "simulation_stage_duration_seconds",
+    "Duration of the stages of a simulation task",
+    ["stage", "size"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, 7200),
+)
+queue_wait = Histogram(
+    "simulation_queue_wait_seconds",
+    "Time between enqueueing and start of a simulation task",
+    ["size"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+peak_memory = Histogram(
+    "simulation_peak_memory_megabytes",
+    "Peak resident memory of the solve process of a simulation",
+    ["size"],
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000),
+)
+solver_interface_info = Gauge(
+    "solver_interface_info",
+    "Pyomo interface a solver is solved with on the worker, 0 if unavailable",
+    ["solver", "interface"],
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Number of tasks the worker runs at the same time, set in the main process
+# of the worker before the pool processes are forked.
+_worker_concurrency = 1
+
+
+@celeryd_after_setup.connect
+def remember_worker_concurrency(sender, instance, **kwargs):
+    """Store the concurrency of the worker for the solver thread budget.
+
+    - param instance: worker controller
+    - returns: None
+    """
+    global _worker_concurrency
+    _worker_concurrency = instance.concurrency or 1
+
+
+@celeryd_after_setup.connect
+def report_solver_interfaces(sender, instance, **kwargs):
+    """Log and publish the interface each solver is solved with on this worker.
+
+    - param instance: worker controller
+    - returns: None
+    """
+    interfaces = solver_interfaces(_settings.solver_in_memory)
+    for solver, interface in interfaces.items():
+        solver_interface_info.labels(solver=solver, interface=interface or "none").set(interface is not None)
+
+    logger.info(
+        "solver interfaces: "
+        + ", ".join(f"{solver} -> {interface or 'unavailable'}" for solver, interface in interfaces.items())
+    )
+    if _settings.solver_in_memory and not gurobipy_available():
+        logger.warning("gurobipy is not installed, Gurobi is solved through LP files")
+
+
+def solve_threads(requested: int | None, parallel: int = 1) -> int:
+    """Return the solver threads of a task within the budget of this worker.
+
+    - param requested: threads requested by the scenario or None
+    - param parallel: processes of the solve
+    - returns: number of threads
+    """
+    return solver_threads(
+        requested,
+        budget=_settings.solver_thread_budget or available_cpus(),
+        concurrency=_worker_concurrency,
+        parallel=parallel,
+    )
+
+
+def scenario_solver_kwargs(scenario: EnScenarioDB) -> dict:
+    """Return the solver options of a scenario for the converted model.
+
+    - param scenario: scenario of the simulation or sweep
+    - returns: options set in the scenario, with the default time limit of
+      the worker if the scenario sets none
+    """
+    solver_kwargs = scenario.get_simulation_settings().solver_options.model_dump(exclude_none=True)
+    if _settings.solver_time_limit and "time_limit" not in solver_kwargs:
+        solver_kwargs["time_limit"] = _settings.solver_time_limit
+
+    return solver_kwargs
+
+
+def limit_message(solver_kwargs: dict, stopped_at_limit: bool, gap: float | None) -> str:
+    """Return the status message of a simulation that reached its limit.
+
+    - param solver_kwargs: solver options of the simulation
+    - param stopped_at_limit: the solver stopped at its time limit
+    - param gap: relative gap of the solution or None if unknown
+    - returns: message naming the limit and the achieved gap
+    """
+    if stopped_at_limit:
+        message = f"The time limit of {solver_kwargs.get('time_limit')} s was reached"
+    else:
+        message = f"The gap limit of {solver_kwargs.get('mip_gap'):.2%} was reached"
+
+    if gap is None:
+        return f"{message}, the best solution found was kept."
+    return f"{message}, the best solution found has a gap of {gap:.2%}."
+
+
 @after_setup_logger.connect
 def setup_loggers(logger, *args, **kwargs):
     """Attach file logging for Celery workers.
@@ -81,16 +247,139 @@ def start_task(simulation: EnSimulationDB):
     """
     # Start Celery task
     task = simulation_task.apply_async(
-        (simulation.scenario_id, simulation.id), task_id=simulation.sim_token
+        (simulation.scenario_id, simulation.id),
+        task_id=simulation.sim_token,
+        queue=simulation.queue or SMALL_QUEUE,
     )
 
     return task
 
 
-@celery_app.task(name="ensys.optimization")
-def simulation_task(scenario_id: int, simulation_id: int):
+def dispatch_simulations() -> int:
+    """Start queued simulations for which a worker slot is free.
+
+    - returns: number of started simulations
+    """
+    with SessionLocal() as db:
+        return len(scheduler.dispatch(db=db, start=start_task))
+
+
+def stale_simulation_age() -> float:
+    """Return the time after the dispatch after which a running simulation is stale.
+
+    Without a CPU limit the solve time is unbounded, so only simulations
+    whose task has ended are reaped.
+
+    - returns: age in seconds or 0 for no age limit
+    """
+    if not _settings.solve_max_cpu_seconds:
+        return 0
+
+    return (
+        _settings.solve_max_cpu_seconds
+        + _settings.solve_cancel_grace_seconds
+        + _settings.scheduler_stale_grace_seconds
+    )
+
+
+@celery_app.task(name="ensys.reap_simulations")
+def reap_simulations_task() -> int:
+    """Finish running simulations whose task no longer runs and free their slots.
+
+    Runs periodically on the worker started with `--beat`.
+
+    - returns: number of reaped simulations
+    """
+    with SessionLocal() as db:
+        reaped = scheduler.reap(
+            db=db,
+            task_state=lambda task_id: celery_app.AsyncResult(task_id).state,
+            max_age_seconds=stale_simulation_age(),
+        )
+        for simulation in reaped:
+            logger.info(f"reaped simulation {simulation.id} ({simulation.status})")
+
+    if reaped:
+        dispatch_simulations()
+
+    return len(reaped)
+
+
+def finish_artifacts(folder: str, user_id: int | None, db: Session):
+    """Compress the artifacts of a finished run and enforce the user quota.
+
+    Failures are only logged, the housekeeping must not fail the run.
+
+    - param folder: simulation or sweep folder of the run
+    - param user_id: owner of the run or None to skip the quota
+    - param db: SQLModel session
+    """
+    try:
+        compress_artifacts(folder)
+        if user_id is not None:
+            enforce_quota(_settings.local_datadir, db, user_id, _settings.artifacts_user_quota_mb)
+    except Exception as ex:
+        logger.warning(f"Artifact housekeeping of {folder} failed: {ex}")
+
+
+@celery_app.task(name="ensys.artifact_maintenance")
+def artifact_maintenance_task() -> dict:
+    """Evict expired heavy files and remove orphaned simulation folders.
+
+    Runs periodically on the worker started with `--beat`.
+
+    - returns: freed bytes and the number of removed folders
+    """
+    db = SessionLocal()
+
+    try:
+        freed = 0
+        if _settings.artifacts_evict_after_days:
+            freed = evict_expired(_settings.local_datadir, db, _settings.artifacts_evict_after_days)
+        removed = collect_garbage(
+            _settings.local_datadir, db, _settings.artifacts_gc_grace_hours * 3600
+        )
+
+        return {"freed_bytes": freed, "removed_folders": len(removed)}
+    finally:
+        db.close()
+
+
+def find_warm_start_dump(
+    scenario_id: int,
+    simulation_id: int,
+    db: Session,
+    task_logger: logging.Logger,
+) -> str | None:
+    """Return the dump folder of the previous simulation used as MIP start.
+
+    - param scenario_id: scenario database id
+    - param simulation_id: id of the running simulation
+    - param db: SQLModel session
+    - param task_logger: logger of the simulation task
+    - returns: dump folder or None for a cold start
+    """
+    previous = find_previous_simulation(
+        scenario_id, simulation_id, _settings.local_datadir, db
+    )
+    if previous is None:
+        task_logger.info("no previous simulation for warm start")
+        return None
+
+    task_logger.info(f"warm start from simulation {previous.id}")
+
+    return os.path.join(_settings.local_datadir, previous.get_result_token(), "dump")
+
+
+@celery_app.task(name="ensys.optimization", bind=True)
+def simulation_task(self, scenario_id: int, simulation_id: int):
     """Run the energy system optimization for a scenario.
 
+    The model is built and solved in an isolated child process with memory
+    and CPU time limits, so the worker only keeps the small outcome. While
+    the solver runs, its log is parsed and the convergence progress is
+    published as `PROGRESS` state of this task.
+
     - param scenario_id: scenario database id
     - param simulation_id: simulation database id
     - returns: dict with simulation_id and timestamps
@@ -133,107 +422,175 @@ def simulation_task(scenario_id: int, simulation_id: int):
     file_handler.setFormatter(formatter)
     task_logger.addHandler(file_handler)
 
+    # the stages are reported once the size is known from the converted model
+    timer = StageTimer()
+    size = "unknown"
+    waited = queue_wait_seconds(simulation.start_date, datetime.now())
+    timer.durations["queue"] = round(waited, 3)
+
     # convert modeling_data to energy system data
     task_logger.info("convert modeling_data to energy system data")
     modeling_data_json = json.loads(scenario.modeling_data)
-    constraints_json = json.loads(scenario.constraints) if scenario.constraints != "" else None
+    constraints_json = load_constraints(scenario)
+    simulation_settings = scenario.get_simulation_settings()
+
+    # stop_simulation revokes a running task with SIGUSR1, which interrupts
+    # the solver instead of killing this process
+    cancellation = SolveCancellation(
+        cancel_file=os.path.join(simulation_folder, "solve_cancel"),
+        grace_seconds=_settings.solve_cancel_grace_seconds,
+    )
+    previous_handler = signal.signal(signal.SIGUSR1, lambda *_: cancellation.cancel())
 
     try:
-        with open(os.path.join(simulation_folder, "modeling_data.json"), "w") as f:
-            f.write(json.dumps(modeling_data_json, indent=4))
-
-        converted_energy_system = convert_gui_json_to_ensys(
-            flowchart_data=modeling_data_json
+        with timer.stage("convert"):
+            converted_energy_system = convert_gui_json_to_ensys(
+                flowchart_data=modeling_data_json
+            )
+
+        size = size_bucket(
+            time_steps=scenario.time_steps,
+            component_count=node_count(converted_energy_system),
         )
+        timer.report(stage_duration, size)
+        queue_wait.labels(size=size).observe(waited)
 
         # Create Energysystem to be stored
         task_logger.info("create energysystem to be stored")
-        simulation_model = EnModel(energysystem=converted_energy_system)
+        with timer.stage("validate"):
+            simulation_model = EnModel(
+                energysystem=converted_energy_system,
+                solver=simulation_settings.solver,
+                solver_kwargs=scenario_solver_kwargs(scenario),
+            )
 
-        with open(os.path.join(simulation_folder, f"converted_model.json"), "wt") as f:
-            f.write(simulation_model.model_dump_json(indent=4))
+        with timer.stage("snapshot"):
+            write_snapshot(simulation_folder, modeling_data_json, simulation_model)
 
         task_logger.info(f"Scenario Interval:{scenario.interval}")
         task_logger.info(f"Scenario Timesteps:{scenario.time_steps}")
         task_logger.info(f"Scenario Startdate:{scenario.start_date}")
         task_logger.info(f"Scenario Simulation_Year:{scenario.start_date.year}")
 
-        task_logger.info("create oemof energy system")
-        timeindex = solph.create_time_index(
-            start=scenario.start_date,
-            number=scenario.time_steps,
-            interval=scenario.interval,
-        )
+        warm_start_dump = None
+        # results of aggregated runs are expanded to the full time index and
+        # do not match the variables of an aggregated model; rolling horizon
+        # builds one model per window
+        if (
+            simulation_settings.warm_start
+            and simulation_settings.aggregation is None
+            and simulation_settings.rolling_horizon is None
+            and supports_warm_start(simulation_model.solver)
+        ):
+            with timer.stage("warm_start"):
+                warm_start_dump = find_warm_start_dump(
+                    scenario_id, simulation_id, db, task_logger
+                )
 
-        oemof_es: solph.EnergySystem = solph.EnergySystem(
-            timeindex=timeindex, infer_last_interval=False
-        )
-
-        oemof_es = simulation_model.energysystem.to_oemof(oemof_es)
-
-        # create the model for optimization
-        task_logger.info("create simulation model")
-        oemof_model = solph.Model(oemof_es)
-
-        # add constraints
-        if constraints_json is not None:
-            for constraint in constraints_json:
-                print(f"Constraint {constraint}")
+        # solve the optimization model
+        solver = solver_interface(simulation_model.solver, _settings.solver_in_memory)
+        task_logger.info(f"solver interface: {solver.value}")
 
-                if constraint["enabled"]:
-                    if constraint["type"] == "emission_limit":
-                        solph.constraints.emission_limit(
-                            om=oemof_model,
-                            limit=float(constraint["values"]["limit"]),
-                        )
-                    # elif weitere constraints
-                    else:
-                        task_logger.warning(f"Constraint type {constraint['type']} not recognized or implemented.")
+        solver_logfile = os.path.abspath(os.path.join(log_path, "solver.log"))
+        pathlib.Path(solver_logfile).touch()
 
-        # solve the optimization model
-        # TODO: Dynamic solver kwargs
-        # TODO: Dynamic solver selection
-
-        gurobi_logfile = os.path.abspath(os.path.join(log_path, "solver.log"))
-        pathlib.Path(gurobi_logfile).touch()
-
-        task_logger.info("solve optimization model")
-        oemof_model.solve(
-            solver=str(simulation_model.solver.value),
-            # solve_kwargs={"tee": True},
-            cmdline_opts={
-                "LogFile": gurobi_logfile,
-                "LogToConsole": 0,
-                "OutputFlag": 1,
-            },
+        log_tailer = SolverLogTailer(
+            logfile=solver_logfile,
+            publish=lambda progress: self.update_state(
+                task_id=sim_token, state="PROGRESS", meta=progress.model_dump()
+            ),
         )
 
-        task_logger.info("simulation finished")
-        # write the lp file for specific analysis
-        task_logger.info("write lp file")
-        oemof_model.write(
-            filename=os.path.join(dump_path, "oemof_model.lp"),
-            io_options={"symbolic_solver_labels": True},
+        solve_job = SolveJob(
+            converted_model=simulation_folder,
+            dump_path=dump_path,
+            log_file=log_file,
+            start_date=scenario.start_date,
+            time_steps=scenario.time_steps,
+            interval=scenario.interval,
+            aggregation=simulation_settings.aggregation,
+            rolling_horizon=simulation_settings.rolling_horizon,
+            constraints=constraints_json,
+            solver=str(solver.value),
+            cmdline_options=solver_options(
+                solver,
+                solver_logfile,
+                simulation_model.solver_kwargs,
+                threads=solve_threads(
+                    simulation_settings.solver_options.threads,
+                    parallel=(
+                        simulation_settings.rolling_horizon.parallel_windows
+                        if simulation_settings.rolling_horizon is not None
+                        else 1
+                    ),
+                ),
+            ),
+            warm_start_dump=warm_start_dump,
+            keep_dump=_settings.results_keep_dump,
+            presolve=simulation_settings.presolve,
+        )
+        solve_limits = SolveLimits(
+            memory_mb=_settings.solve_max_memory_mb,
+            cpu_seconds=_settings.solve_max_cpu_seconds,
         )
 
-        task_logger.info("collect results")
-        oemof_es.results["main"] = solph.processing.results(oemof_model)
-        oemof_es.results["meta"] = solph.processing.meta_results(oemof_model)
-
-        # Todo: Bei mehreren Constraints ist das hier eine Falle!
-
-        if constraints_json is not None:
-            for single_constraint in constraints_json:
-                if single_constraint["type"] == "emission_limit" and single_constraint["enabled"]:
-                    print(oemof_model.integral_limit_emission_factor())
-                    oemof_es.results["emissions"] = oemof_model.integral_limit_emission_factor()
-
-        task_logger.info("dump results")
-        oemof_es.dump(dpath=dump_path, filename="oemof_es.dump")
+        task_logger.info("build and solve in an isolated process")
+        outcome = SolveOutcome()
+        log_tailer.start()
+        try:
+            outcome = run_isolated(
+                solve_job,
+                workdir=simulation_folder,
+                limits=solve_limits,
+                cancellation=cancellation,
+            )
+        except SolveProcessError as ex:
+            outcome = ex.outcome
+            raise
+        finally:
+            solver_progress = log_tailer.stop()
+            # stages of the child and its peak memory are kept for failed runs too
+            for stage, duration in outcome.durations.items():
+                timer.record(stage, duration)
+            if outcome.peak_memory_mb is not None:
+                simulation.peak_memory_mb = outcome.peak_memory_mb
+                peak_memory.labels(size=size).observe(outcome.peak_memory_mb)
+
+        task_logger.info(f"solver progress: {solver_progress.model_dump()}")
+        task_logger.info(f"peak memory of the solve process: {outcome.peak_memory_mb} MB")
+
+        task_logger.info(f"stage timings: {timer.durations}")
 
         task_logger.info("update database")
-        simulation.status = Status.FINISHED.value
-        simulation.end_date = datetime.now()
+        if cancellation.requested:
+            task_logger.info(f"simulation cancelled: {outcome.error or 'results kept'}")
+            simulation.status = Status.STOPPED.value
+            simulation.status_message = "Simulation was canceled by user request."
+            if outcome.error is None:
+                simulation.partial = True
+                simulation.gap = outcome.gap
+                simulation.status_message = (
+                    "Simulation was canceled by user request, the best solution "
+                    "found so far was kept"
+                    + (f" (gap {outcome.gap:.2%})." if outcome.gap is not None else ".")
+                )
+            simulation.end_date = simulation.end_date or datetime.now()
+        elif reached_limit(
+            outcome.limit_reached, outcome.gap, (simulation_model.solver_kwargs or {}).get("mip_gap")
+        ):
+            task_logger.info(f"simulation reached its limit with a gap of {outcome.gap}")
+            simulation.status = Status.LIMIT_REACHED.value
+            simulation.status_message = limit_message(
+                simulation_model.solver_kwargs or {}, outcome.limit_reached, outcome.gap
+            )
+            simulation.gap = outcome.gap
+            simulation.end_date = datetime.now()
+        else:
+            task_logger.info("simulation finished")
+            simulation.status = Status.FINISHED.value
+            simulation.gap = outcome.gap
+            simulation.end_date = datetime.now()
+        simulation.stage_timings = dict(timer.durations)
 
         try:
             db.commit()
@@ -246,6 +603,16 @@ def simulation_task(scenario_id: int, simulation_id: int):
             ) from exc
 
         db.refresh(simulation)
+
+        # write the lp file for specific analysis after the results are available
+        if (
+            not cancellation.requested
+            and simulation_settings.diagnostics_level is DiagnosticsLevel.DEFERRED
+            and simulation_settings.rolling_horizon is None
+        ):
+            task_logger.info("schedule lp file export")
+            lp_export_task.delay(simulation_id)
+
         task_logger.info("backgroundtask finished")
 
         task_in_progress.dec()
@@ -257,6 +624,7 @@ def simulation_task(scenario_id: int, simulation_id: int):
             simulation.status = Status.FAILED.value
             simulation.status_message = str(runError)
             simulation.end_date = datetime.now()
+            simulation.stage_timings = dict(timer.durations)
 
             try:
                 db.commit()
@@ -281,6 +649,7 @@ def simulation_task(scenario_id: int, simulation_id: int):
             simulation.status = Status.FAILED.value
             simulation.status_message = f"It appeared a KeyError for the Key {keyError}."
             simulation.end_date = datetime.now()
+            simulation.stage_timings = dict(timer.durations)
 
             try:
                 db.commit()
@@ -305,6 +674,7 @@ def simulation_task(scenario_id: int, simulation_id: int):
             simulation.status = Status.FAILED.value
             simulation.status_message = str(ex)
             simulation.end_date = datetime.now()
+            simulation.stage_timings = dict(timer.durations)
 
             try:
                 db.commit()
@@ -321,3 +691,389 @@ def simulation_task(scenario_id: int, simulation_id: int):
         task_in_progress.dec()
 
         raise HTTPException(status_code=500, detail=str(ex))
+
+    finally:
+        if timer.histogram is None:
+            # the scenario could not be converted, its size is unknown
+            timer.report(stage_duration, size)
+            queue_wait.labels(size=size).observe(waited)
+        signal.signal(signal.SIGUSR1, previous_handler)
+        task_logger.removeHandler(file_handler)
+        file_handler.close()
+        finish_artifacts(simulation_folder, scenario.user_id, db)
+        db.close()
+        # the worker slot of this simulation is free again
+        dispatch_simulations()
+
+
+@celery_app.task(name="ensys.lp_export")
+def lp_export_task(simulation_id: int):
+    """Write the compressed LP file of a finished simulation.
+
+    The optimization model is rebuilt from the stored converted model like
+    the solve built it, including presolve and constraints, so the export
+    does not delay the simulation itself. Rolling horizon runs solved a
+    sequence of window models instead of one model and are not exported.
+
+    - param simulation_id: simulation database id
+    - returns: path of the written LP file
+    - raises: ValueError for rolling horizon scenarios
+    """
+    db = SessionLocal()
+
+    try:
+        simulation = db.get(EnSimulationDB, simulation_id)
+        scenario = db.get(EnScenarioDB, simulation.scenario_id)
+        simulation_settings = scenario.get_simulation_settings()
+
+        if simulation_settings.rolling_horizon is not None:
+            raise ValueError("LP export is not available for rolling horizon scenarios.")
+
+        simulation_folder = os.path.abspath(
+            os.path.join(_settings.local_datadir, simulation.get_result_token())
+        )
+        lp_file = lp_export_path(_settings.local_datadir, simulation.get_result_token())
+
+        export_job = SolveJob(
+            converted_model=simulation_folder,
+            dump_path=os.path.dirname(lp_file),
+            start_date=scenario.start_date,
+            time_steps=scenario.time_steps,
+            interval=scenario.interval,
+            aggregation=simulation_settings.aggregation,
+            constraints=load_constraints(scenario),
+            solver=str(simulation_settings.solver.value),
+            presolve=simulation_settings.presolve,
+        )
+        timer = StageTimer()
+        energysystem = load_energysystem(export_job, timer, logger)
+        _, oemof_model = build_model(export_job, energysystem, timer, logger)
+
+        return write_compressed_lp(oemof_model, lp_file)
+    finally:
+        db.close()
+
+
+def _fail_sweep(sweep: EnSweepDB, message: str, db: Session):
+    """Mark a sweep and its unfinished variants as failed."""
+    sweep.status = Status.FAILED.value
+    sweep.status_message = message
+    sweep.end_date = datetime.now()
+
+    for simulation in db.exec(
+        select(EnSimulationDB).where(EnSimulationDB.sweep_id == sweep.id)
+    ).all():
+        if simulation.status == Status.STARTED.value:
+            simulation.status = Status.FAILED.value
+            simulation.status_message = message
+            simulation.end_date = datetime.now()
+
+    db.commit()
+
+
+@celery_app.task(name="ensys.sweep")
+def sweep_task(sweep_id: int):
+    """Convert the base scenario of a sweep once and fan out its variants.
+
+    The variants are split into `max_parallel` chunks which run as a Celery
+    chord; each chunk solves its variants one after another and the chord
+    callback combines the results into the summary table.
+
+    - param sweep_id: sweep database id
+    - returns: number of scheduled chunks
+    """
+    db = SessionLocal()
+
+    try:
+        sweep = db.get(EnSweepDB, sweep_id)
+        scenario = db.get(EnScenarioDB, sweep.scenario_id)
+
+        sweep_folder = os.path.abspath(
+            os.path.join(_settings.local_datadir, sweep.sweep_token)
+        )
+        os.makedirs(sweep_folder, exist_ok=True)
+
+        try:
+            modeling_data_json = json.loads(scenario.modeling_data)
+            simulation_model = EnModel(
+                energysystem=convert_gui_json_to_ensys(flowchart_data=modeling_data_json),
+                solver=scenario.get_simulation_settings().solver,
+                solver_kwargs=scenario_solver_kwargs(scenario),
+            )
+            write_snapshot(sweep_folder, modeling_data_json, simulation_model)
+        except Exception as ex:
+            logger.critical(f"Sweep {sweep_id} conversion failed: {ex}")
+            _fail_sweep(sweep, str(ex), db)
+            raise
+
+        simulation_ids = [
+            simulation.id
+            for simulation in db.exec(
+                select(EnSimulationDB)
+                .where(EnSimulationDB.sweep_id == sweep_id)
+                .order_by(EnSimulationDB.id)
+            ).all()
+        ]
+
+        chunk_count = max(1, min(sweep.max_parallel, len(simulation_ids)))
+        chunks = [simulation_ids[index::chunk_count] for index in range(chunk_count)]
+
+        chord(
+            sweep_chunk_task.s(sweep_id, chunk).set(task_id=chunk_task_id(sweep, index))
+            for index, chunk in enumerate(chunks)
+        )(sweep_summary_task.s(sweep_id))
+
+        return chunk_count
+    finally:
+        db.close()
+
+
+def chunk_task_id(sweep: EnSweepDB, index: int) -> str:
+    """Return the celery task id of a chunk of a sweep."""
+    return f"{sweep.sweep_token}-chunk-{index}"
+
+
+def _variant_status(
+    simulation: EnSimulationDB,
+    variant_outcome: VariantOutcome | None,
+    chunk_error: str | None,
+    cancelled: bool,
+    solver_kwargs: dict,
+):
+    """Set status, message and gap of a variant from the outcome of its chunk.
+
+    - param simulation: simulation record of the variant
+    - param variant_outcome: outcome written by the child or None if the
+      child ended before the variant
+    - param chunk_error: error of the child process or None
+    - param cancelled: the chunk was cancelled
+    - param solver_kwargs: solver options of the base model
+    """
+    if variant_outcome is None:
+        if cancelled:
+            simulation.status = Status.STOPPED.value
+            simulation.status_message = "Simulation was canceled by user request."
+        else:
+            simulation.status = Status.FAILED.value
+            simulation.status_message = chunk_error or "The variant was not solved."
+        return
+
+    simulation.gap = variant_outcome.gap
+    if variant_outcome.error is not None:
+        simulation.status = Status.FAILED.value
+        simulation.status_message = variant_outcome.error
+    elif variant_outcome.partial:
+        simulation.status = Status.STOPPED.value
+        simulation.partial = True
+        simulation.status_message = (
+            "Simulation was canceled by user request, the best solution found so far was kept"
+            + (f" (gap {variant_outcome.gap:.2%})." if variant_outcome.gap is not None else ".")
+        )
+    elif reached_limit(variant_outcome.limit_reached, variant_outcome.gap, solver_kwargs.get("mip_gap")):
+        simulation.status = Status.LIMIT_REACHED.value
+        simulation.status_message = limit_message(
+            solver_kwargs, variant_outcome.limit_reached, variant_outcome.gap
+        )
+    else:
+        simulation.status = Status.FINISHED.value
+
+
+@celery_app.task(name="ensys.sweep_chunk")
+def sweep_chunk_task(sweep_id: int, simulation_ids: list[int]) -> list[dict]:
+    """Solve a chunk of sweep variants one after another.
+
+    The variants are built and solved in an isolated child process with the
+    resource limits of a simulation (the CPU time per variant), see
+    `sweep.runner`. Consecutive variants share the structure of the base
+    model, so each solution is the MIP start of the next variant, and variants
+    which only change cost or bound coefficients re-solve the model of the
+    previous variant.
+
+    Failing variants are recorded and do not stop the chunk, so the summary
+    task of the chord always runs. Variants the child did not get to, e.g.
+    after it ran out of memory, fail with the error of the child; deleting the
+    sweep revokes the chunk with SIGUSR1, which cancels it.
+
+    - param sweep_id: sweep database id
+    - param simulation_ids: simulation ids of the variants of this chunk
+    - returns: summary rows of the variants
+    """
+    db = SessionLocal()
+
+    try:
+        sweep = db.get(EnSweepDB, sweep_id)
+        scenario = db.get(EnScenarioDB, sweep.scenario_id)
+
+        sweep_folder = os.path.abspath(os.path.join(_settings.local_datadir, sweep.sweep_token))
+        base_model = read_converted_model(sweep_folder)
+
+        simulation_settings = scenario.get_simulation_settings()
+        # results of aggregated runs are expanded, so they do not match the
+        # variables of the next aggregated model
+        warm_start = (
+            simulation_settings.warm_start
+            and simulation_settings.aggregation is None
+            and supports_warm_start(base_model.solver)
+        )
+        size = size_bucket(
+            time_steps=scenario.time_steps,
+            component_count=node_count(base_model.energysystem),
+        )
+
+        solver = solver_interface(base_model.solver, _settings.solver_in_memory)
+        solver_kwargs = base_model.solver_kwargs or {}
+        threads = solve_threads(solver_kwargs.get("threads"))
+
+        variants = []
+        for simulation_id in simulation_ids:
+            simulation = db.get(EnSimulationDB, simulation_id)
+            simulation_folder = os.path.abspath(
+                os.path.join(_settings.local_datadir, simulation.sim_token)
+            )
+            dump_path = os.path.join(simulation_folder, "dump")
+            log_path = os.path.join(simulation_folder, "log")
+            os.makedirs(dump_path, exist_ok=True)
+            os.makedirs(log_path, exist_ok=True)
+
+            variants.append(
+                SweepVariantJob(
+                    simulation_id=simulation_id,
+                    variant=simulation.variant,
+                    dump_path=dump_path,
+                    cmdline_options=solver_options(
+                        solver, os.path.join(log_path, "solver.log"), solver_kwargs, threads=threads
+                    ),
+                )
+            )
+
+        workdir = os.path.join(sweep_folder, f"chunk-{simulation_ids[0]}")
+        os.makedirs(workdir, exist_ok=True)
+
+        job = SweepChunkJob(
+            converted_model=sweep_folder,
+            outcome_file=os.path.join(workdir, "variant_outcomes.jsonl"),
+            log_file=os.path.join(workdir, "chunk.log"),
+            start_date=scenario.start_date,
+            time_steps=scenario.time_steps,
+            interval=scenario.interval,
+            aggregation=simulation_settings.aggregation,
+            constraints=load_constraints(scenario),
+            parameters=sweep.get_parameters(),
+            variants=variants,
+            solver=str(solver.value),
+            presolve=simulation_settings.presolve,
+            warm_start=warm_start,
+            keep_dump=_settings.results_keep_dump,
+        )
+        limits = SolveLimits(
+            memory_mb=_settings.solve_max_memory_mb,
+            cpu_seconds=_settings.solve_max_cpu_seconds * len(variants),
+        )
+        cancellation = SolveCancellation(
+            cancel_file=os.path.join(workdir, "solve_cancel"),
+            grace_seconds=_settings.solve_cancel_grace_seconds,
+        )
+
+        previous_handler = signal.signal(signal.SIGUSR1, lambda *_: cancellation.cancel())
+        try:
+            outcome = run_isolated(
+                job, workdir=workdir, limits=limits, cancellation=cancellation, entry=sweep_runner.__name__
+            )
+            chunk_error = outcome.error
+        except SolveProcessError as ex:
+            logger.critical(f"Sweep {sweep_id} chunk {simulation_ids} failed: {ex}")
+            outcome = ex.outcome
+            chunk_error = str(ex)
+        finally:
+            signal.signal(signal.SIGUSR1, previous_handler)
+
+        if outcome.peak_memory_mb is not None:
+            peak_memory.labels(size=size).observe(outcome.peak_memory_mb)
+
+        variant_outcomes = read_variant_outcomes(job.outcome_file)
+        rows = []
+
+        for variant in variants:
+            simulation = db.get(EnSimulationDB, variant.simulation_id)
+            # the sweep was deleted while the chunk ran
+            if simulation is None:
+                continue
+
+            variant_outcome = variant_outcomes.get(variant.simulation_id)
+            _variant_status(simulation, variant_outcome, chunk_error, cancellation.requested, solver_kwargs)
+
+            timer = StageTimer(histogram=stage_duration, size=size)
+            for stage, duration in (variant_outcome.durations if variant_outcome else {}).items():
+                timer.record(stage, duration)
+
+            # the variants of a chunk share its child process
+            simulation.peak_memory_mb = outcome.peak_memory_mb
+            simulation.end_date = datetime.now()
+            simulation.stage_timings = dict(timer.durations)
+
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                logger.critical(f"Database integrity error for sweep variant {variant.simulation_id}")
+
+            finish_artifacts(
+                os.path.join(_settings.local_datadir, simulation.sim_token), user_id=None, db=db
+            )
+
+            rows.append(
+                {
+                    "simulation_id": simulation.id,
+                    **simulation.variant,
+                    "objective": variant_outcome.objective if variant_outcome else None,
+                    "gap": simulation.gap,
+                    "status": simulation.status,
+                }
+            )
+
+        return rows
+    finally:
+        db.close()
+
+
+@celery_app.task(name="ensys.sweep_summary")
+def sweep_summary_task(chunk_rows: list[list[dict]], sweep_id: int):
+    """Combine the summary rows of all chunks and finish the sweep.
+
+    - param chunk_rows: results of the chunk tasks
+    - param sweep_id: sweep database id
+    - returns: number of finished variants
+    """
+    db = SessionLocal()
+
+    try:
+        sweep = db.get(EnSweepDB, sweep_id)
+        # deleted while its chunks ran
+        if sweep is None:
+            return 0
+
+        rows = sorted(
+            (row for rows in chunk_rows for row in rows),
+            key=lambda row: row["simulation_id"],
+        )
+        # variants that reached their limit have a solution as well
+        finished = sum(
+            row["status"] in (Status.FINISHED.value, Status.LIMIT_REACHED.value) for row in rows
+        )
+
+        sweep.summary = rows
+        sweep.status = Status.FINISHED.value if finished else Status.FAILED.value
+        sweep.status_message = f"{finished} of {len(rows)} variants finished."
+        sweep.end_date = datetime.now()
+
+        db.commit()
+
+        finish_artifacts(
+            os.path.join(_settings.local_datadir, sweep.sweep_token),
+            user_id=db.get(EnScenarioDB, sweep.scenario_id).user_id,
+            db=db,
+        )
+
+        return finished
+    finally:
+        db.close()
@@ -91,6 +91,101 @@ class Settings(BaseSettings):
         default="/backend/data", description="Local directory for data storage"
     )
 
+    # Scheduler Settings
+    scheduler_small_max_size: int = Field(
+        default=500_000,
+        description="Upper bound of estimated variables + constraints for the small queue",
+    )
+    scheduler_small_slots: int = Field(
+        default=2, description="Worker slots of the small queue"
+    )
+    scheduler_large_slots: int = Field(
+        default=2, description="Worker slots of the large queue"
+    )
+    scheduler_max_running_per_user: int = Field(
+        default=2, description="Maximum number of running simulations per user"
+    )
+    scheduler_max_queued_per_user: int = Field(
+        default=10, description="Maximum number of queued simulations per user"
+    )
+    scheduler_reap_interval_seconds: int = Field(
+        default=300,
+        description="Interval of the task finishing running simulations whose task no longer runs",
+    )
+    scheduler_stale_grace_seconds: int = Field(
+        default=3600,
+        description="Time after the CPU limit and the cancel grace after which a running simulation is reaped",
+    )
+
+    # Admission Settings
+    admission_max_memory_mb: int = Field(
+        default=8_000, description="Memory budget of a worker slot in MB"
+    )
+    admission_max_integer_variables: int = Field(
+        default=200_000,
+        description="Integer variables above which a simulation is deferred to the large queue",
+    )
+
+    # Solve Process Settings
+    solve_max_memory_mb: int = Field(
+        default=16_000,
+        description="Address space limit of the solve process in MB (0 = unlimited)",
+    )
+    solve_max_cpu_seconds: int = Field(
+        default=0,
+        description="CPU time limit of the solve process in seconds (0 = unlimited)",
+    )
+    solve_cancel_grace_seconds: int = Field(
+        default=120,
+        description="Time a cancelled solve process gets to write its best solution before it is killed",
+    )
+
+    # Solver Settings
+    solver_in_memory: bool = Field(
+        default=True,
+        description="Solve with the in-memory interface of a solver (e.g. gurobi_direct) if installed",
+    )
+    solver_thread_budget: int = Field(
+        default=0,
+        description="Solver threads of a worker shared by its concurrent solves (0 = available CPUs)",
+    )
+    solver_time_limit: int = Field(
+        default=0,
+        description="Wall-clock limit of a solve in seconds if the scenario sets none (0 = unlimited)",
+    )
+
+    # Result Settings
+    results_keep_dump: bool = Field(
+        default=False,
+        description="Also write the pickled oemof energy system next to the result store",
+    )
+
+    # Artifact Settings
+    artifacts_user_quota_mb: int = Field(
+        default=0,
+        description="Disk quota of the simulation folders of a user in MB (0 = unlimited)",
+    )
+    artifacts_evict_after_days: int = Field(
+        default=30,
+        description="Days after which unused heavy files of superseded runs are evicted (0 = never)",
+    )
+    artifacts_gc_grace_hours: int = Field(
+        default=24,
+        description="Age of a simulation folder without database entry before it is removed",
+    )
+    artifacts_maintenance_interval_seconds: int = Field(
+        default=3600,
+        description="Interval of the artifact eviction and garbage collection task",
+    )
+
+    # Sweep Settings
+    sweep_max_parallel: int = Field(
+        default=4, description="Maximum number of parallel tasks per sweep"
+    )
+    sweep_max_variants: int = Field(
+        default=200, description="Maximum number of variants per sweep"
+    )
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def split_cors_origins(cls, v):  # noqa: N805
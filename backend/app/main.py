@@ -17,6 +17,8 @@ from .scenario.model import ScenarioAdmin
 from .scenario.router import scenario_router
 from .simulation.model import SimulationAdmin
 from .simulation.router import simulation_router
+from .sweep.model import SweepAdmin
+from .sweep.router import sweep_router
 from .templates.model import TemplateScenarioAdmin, TemplateAdmin
 from .templates.router import templates_router
 from .user.model import UserAdmin
@@ -41,6 +43,7 @@ tags_metadata = [
     {"name": "default", "description": "The root of all evil."},
     {"name": "simulation", "description": "Manage simulations."},
     {"name": "results", "description": "Get results."},
+    {"name": "sweep", "description": "Run parameter sweeps over a scenario."},
     {"name": "templates", "description": "Manage templates."},
 ]
 
@@ -73,6 +76,7 @@ admin.add_view(UserAdmin)
 admin.add_view(ProjectAdmin)
 admin.add_view(ScenarioAdmin)
 admin.add_view(SimulationAdmin)
+admin.add_view(SweepAdmin)
 admin.add_view(TemplateAdmin)
 admin.add_view(TemplateScenarioAdmin)
 
@@ -97,6 +101,7 @@ routers = [
     projects_router,
     scenario_router,
     simulation_router,
+    sweep_router,
     results_router,
     oep_router,
     templates_router,
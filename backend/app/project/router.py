@@ -20,6 +20,7 @@ from .service import (
     update_project,
     delete_project,
     duplicate_project,
+    read_project_disk_usage,
 )
 from ..db import get_db_session
 from ..models.base import GeneralDataModel
@@ -107,6 +108,31 @@ async def read_project_endpoint(
         )
 
 
+@projects_router.get("/{project_id}/disk_usage", response_model=DataResponse)
+async def read_project_disk_usage_endpoint(
+    project_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Session = Depends(get_db_session),
+) -> DataResponse:
+    """Get the disk usage of the simulation folders of a project.
+
+    - param project_id: id of the project
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with the total and the bytes per scenario id
+    - raises: HTTPException 401 if not authorized
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    return DataResponse(
+        data=GeneralDataModel(
+            items=[read_project_disk_usage(project_id=project_id, user=user, db=db)],
+            totalCount=1,
+        ),
+        success=True,
+    )
+
+
 @projects_router.patch("/{project_id}", response_model=MessageResponse)
 async def update_project_endpoint(
     project_id: int,
@@ -6,6 +6,7 @@ This module provides service layer functionality for project management.
 It handles the business logic for project operations including:
 - Project creation and management
 - Project duplication
+- Disk usage of the simulation folders of a project
 - Project validation
 - Scenario management within projects
 """
@@ -19,8 +20,10 @@ from sqlmodel import Session, select
 from starlette import status
 
 from .model import EnProject, EnProjectDB, EnProjectUpdate
+from ..core.config import get_settings
 from ..scenario.model import EnScenarioDB
 from ..scenario.service import read_scenarios, delete_scenario, duplicate_scenario
+from ..simulation.artifacts import project_disk_usage
 from ..user.model import EnUserDB
 
 
@@ -123,6 +126,23 @@ def delete_project(project_id: int, user: EnUserDB, db: Session) -> None:
         )
 
 
+def read_project_disk_usage(project_id: int, user: EnUserDB, db: Session) -> dict:
+    """Return the disk usage of the simulation folders of a project.
+
+    - param project_id: id of the project
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: dict with the total and the bytes per scenario id
+    - raises: HTTPException 401 if the user has no rights on the project
+    """
+    if not user.check_project_rights(project_id=project_id, db=db):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authorized"
+        )
+
+    return project_disk_usage(get_settings().local_datadir, db, project_id)
+
+
 def duplicate_project(project_id: int, user: EnUserDB, db: Session) -> EnProjectDB:
     """Clone a project with all its scenarios for the same user."""
     if not user.check_project_rights(project_id=project_id, db=db):
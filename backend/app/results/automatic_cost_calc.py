@@ -2,6 +2,35 @@ import numpy as np
 import pandas as pd
 from oemof import solph
 
+from ..simulation.aggregation import disaggregate_sequence
+
+
+def _variable_costs(energysystem, item) -> pd.Series:
+    """Return the variable costs of a flow over the full time index."""
+    tsa_parameters = getattr(energysystem, "tsa_parameters", None)
+
+    # cost profiles of aggregated runs only cover the typical periods
+    if tsa_parameters and isinstance(item.variable_costs, np.ndarray):
+        return pd.Series(disaggregate_sequence(item.variable_costs, tsa_parameters))
+
+    return pd.Series(item.variable_costs)
+
+
+def _flow_costs(energysystem, results, item) -> float:
+    """Return the sum of flow times variable costs of a flow.
+
+    Flow values the solution leaves undefined, e.g. the last step of the
+    time index, count as zero.
+    """
+    flow = np.asarray(
+        solph.views.node(results, item.output)["sequences"][(item.input, item.output), "flow"],
+        dtype=float,
+    )
+    costs = np.asarray(_variable_costs(energysystem, item), dtype=float)
+    steps = min(len(flow), len(costs))
+
+    return float(np.nansum(flow[:steps] * costs[:steps]))
+
 
 def __cost_calculation(energysystem, results) -> pd.DataFrame:
     dict_costs = {"investment costs": {}, "variable costs": {}, "profits": {}}
@@ -52,44 +81,30 @@ def __cost_calculation(energysystem, results) -> pd.DataFrame:
             if hasattr(item, "variable_costs"):
                 if not all(v == 0 for v in item.variable_costs):
                     if all(val <= 0 for val in item.variable_costs):
-                        erloese = np.multiply(
-                            np.array(
-                                solph.views.node(results, item.output)["sequences"][
-                                    (item.input, item.output), "flow"
-                                ][:8759]
-                            ),
-                            np.array(pd.Series(item.variable_costs)[:8759]),
-                        )
+                        erloese = _flow_costs(energysystem, results, item)
 
                         if isinstance(item.input, solph.buses.Bus):
                             dict_costs["profits"].update(
-                                {str(item.output): sum(erloese)}
+                                {str(item.output): erloese}
                             )
                         elif isinstance(item.output, solph.buses.Bus):
                             dict_costs["profits"].update(
-                                {str(item.input): sum(erloese)}
+                                {str(item.input): erloese}
                             )
                         else:
                             print("Error")
                         # sum_erloese += sum(erloese)
 
                     else:
-                        line = np.multiply(
-                            np.array(
-                                solph.views.node(results, item.output)["sequences"][
-                                    (item.input, item.output), "flow"
-                                ][:8759]
-                            ),
-                            np.array(pd.Series(item.variable_costs)[:8759]),
-                        )
+                        line = _flow_costs(energysystem, results, item)
 
                         if isinstance(item.input, solph.buses.Bus):
                             dict_costs["variable costs"].update(
-                                {str(item.output): sum(line)}
+                                {str(item.output): line}
                             )
                         elif isinstance(item.output, solph.buses.Bus):
                             dict_costs["variable costs"].update(
-                                {str(item.input): sum(line)}
+                                {str(item.input): line}
                             )
                         else:
                             print("Error")
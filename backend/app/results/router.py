@@ -7,14 +7,15 @@ from oemof import solph
 from sqlmodel import Session
 from starlette import status
 
-from .automatic_cost_calc import cost_calculation_from_energysystem
 from .model import EnDataFrame, EnTimeSeries, EnTableResult, ResultDataModel
+from .store import DUMP_FILE, ResultStore, has_result_store, has_results, write_result_store
 from ..db import get_db_session, SessionLocal
 from ..models.base import GeneralDataModel, ErrorModel
 from ..models.response import ErrorResponse, ResultResponse
 from ..project.model import EnProjectDB
 from ..scenario.model import EnScenarioDB
 from ..security import oauth2_scheme
+from ..simulation.artifacts import mark_used
 from ..simulation.model import EnSimulationDB, Status
 
 results_router = APIRouter(
@@ -23,53 +24,77 @@ results_router = APIRouter(
 )
 
 
+def load_result_store(dump_path: str) -> ResultStore:
+    """Open the result store of a dump folder.
+
+    Simulations finished before the result store was introduced only have
+    the pickled dump; it is restored once and converted to a result store.
+
+    - param dump_path: dump folder of the simulation
+    - returns: ResultStore of the simulation
+    - raises: HTTPException 404 when neither store nor dump exists
+    """
+    if not has_result_store(dump_path):
+        if not has_results(dump_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Dumpfile not found"
+            )
+
+        es = solph.EnergySystem()
+        es.restore(dpath=dump_path, filename=DUMP_FILE)
+        write_result_store(es, dump_path)
+
+    return ResultStore(dump_path)
+
+
 def get_results_from_dump(simulation_id: int, db: Session = SessionLocal()) -> GeneralDataModel:
-    """Load simulation results from the dump on disk.
+    """Load simulation results from the result store on disk.
 
-    - param simulation_id: simulation id whose dump to read
+    - param simulation_id: simulation id whose results to read
     - param db: Session for fetching simulation metadata
     - returns: GeneralDataModel with ResultDataModel entries
-    - raises: HTTPException 404 when simulation or dump is missing
+    - raises: HTTPException 404 when simulation or results are missing
     """
     simulation = db.get(EnSimulationDB, simulation_id)
-    sim_scenario = db.get(EnScenarioDB, simulation.scenario_id)
-    sim_project = db.get(EnProjectDB, sim_scenario.project_id)
 
     if not simulation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Simulation not found"
         )
 
-    simulation_token = simulation.sim_token
+    sim_scenario = db.get(EnScenarioDB, simulation.scenario_id)
+    sim_project = db.get(EnProjectDB, sim_scenario.project_id)
+
+    simulation_token = simulation.get_result_token()
     simulations_path = os.path.abspath(
         os.path.join(os.getenv("LOCAL_DATADIR"), simulation_token, "dump")
     )
-    print(f"simulations_path: {simulations_path}")
 
-    if not os.path.isfile(os.path.join(simulations_path, "oemof_es.dump")):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Dumpfile not found"
-        )
-
-    es = solph.EnergySystem()
-    es.restore(dpath=simulations_path, filename="oemof_es.dump")
+    store = load_result_store(simulations_path)
+    mark_used(os.path.dirname(simulations_path))
 
     busses = []
     components = []
     result_data = []
 
-    for node in es.nodes:
-        if isinstance(node, solph.Bus):
-            print(f"Bus: {node}")
-            busses.append(node)
+    for label, node_class in store.nodes.items():
+        if node_class == "Bus":
+            busses.append(label)
         else:
-            components.append(node)
+            components.append(label)
 
     # TODO: Dat muss nochmal überdacht werden. Schon gut, aber irgendwie weird.
     for bus in busses:
+        bus_results = store.node(bus)
+        if "sequences" not in bus_results:
+            continue
+
         graph_data = []
+        # aggregated runs keep the typical periods as timeindex, the results
+        # are expanded to the full time index
+        bus_sequences = bus_results["sequences"]
 
-        for t, g in solph.views.node(es.results["main"], node=bus)["sequences"].items():
+        for t, g in bus_sequences.items():
             idx_asset = abs(t[0].index(bus) - 1)
 
             series_name = str(t[0][0]) + " > " + str(t[0][1])
@@ -80,7 +105,7 @@ def get_results_from_dump(simulation_id: int, db: Session = SessionLocal()) -> G
             graph_data.append(time_series)
 
         bus_data: EnDataFrame = EnDataFrame(
-            name=f"{bus}", index=es.timeindex.to_pydatetime(), data=graph_data
+            name=bus, index=bus_sequences.index.to_pydatetime(), data=graph_data
         )
 
         result_data.append(bus_data)
@@ -88,60 +113,42 @@ def get_results_from_dump(simulation_id: int, db: Session = SessionLocal()) -> G
     result_components = []
     for component in components:
         result_component_data = {}
-        component_data = solph.views.node(es.results["main"], node=component)
+        component_data = store.node(component)
+        is_storage = store.nodes[component] == "GenericStorage"
 
         if "scalars" in component_data:
             if sim_project.unit_energy == "MW/MWh":
-                if type(component) == solph.components.GenericStorage:
-                    result_component_data = EnTableResult(
-                        name=str(component),
-                        value=round(list(component_data["scalars"])[0], 2),
-                        unit="MWh"
-                    )
-                else:
-                    result_component_data = EnTableResult(
-                        name=str(component),
-                        value=round(list(component_data["scalars"])[0], 2),
-                        unit="MW"
-                    )
+                result_component_data = EnTableResult(
+                    name=component,
+                    value=round(list(component_data["scalars"])[0], 2),
+                    unit="MWh" if is_storage else "MW"
+                )
             else:
-                if type(component) == solph.components.GenericStorage:
-                    result_component_data = EnTableResult(
-                        name=str(component),
-                        value=round(list(component_data["scalars"])[0] * 1000, 2),
-                        unit="kWh"
-                    )
-                else:
-                    result_component_data = EnTableResult(
-                        name=str(component),
-                        value=round(list(component_data["scalars"])[0] * 1000, 2),
-                        unit="kW"
-                    )
+                result_component_data = EnTableResult(
+                    name=component,
+                    value=round(list(component_data["scalars"])[0] * 1000, 2),
+                    unit="kWh" if is_storage else "kW"
+                )
 
         if result_component_data != {}:
             result_components.append(result_component_data)
 
-    costs = cost_calculation_from_energysystem(es)
-    print(f"Costs: {costs}")
-
-    # for key in costs.keys():
-    #     for index in costs.index:
-    #         data = costs.loc[index, key]
-    #
-    #         if not math.isnan(data):
-    #             result_components.append(EnTableResult(
-    #                 name=f"{index} ({key})",
-    #                 value=round(data, 2),
-    #                 unit="EUR"
-    #             ))
-
-    result_components.append(
-        EnTableResult(name="Costs", value=round(costs.sum().sum(), 2), unit="EUR/a")
-    )
+    costs = store.costs
+
+    if costs is not None:
+        result_components.append(
+            EnTableResult(name="Costs", value=round(costs.sum().sum(), 2), unit="EUR/a")
+        )
+
+    if store.emissions is not None:
+        result_components.append(
+            EnTableResult(name="Emissions", value=round(store.emissions, 2), unit=sim_project.unit_co2)
+        )
 
-    if "Emissions" in es.results.keys():
+    # the best solution of a run that reached its limit or was stopped
+    if simulation.status != Status.FINISHED.value and simulation.gap is not None:
         result_components.append(
-            EnTableResult(name="Emissions", value=round(es.results["emissions"], 2), unit=sim_project.unit_co2)
+            EnTableResult(name="Gap", value=round(simulation.gap * 100, 2), unit="%")
         )
 
     return_data = [ResultDataModel(static=result_components, graphs=result_data)]
@@ -174,7 +181,7 @@ async def get_results(
             status_code=status.HTTP_404_NOT_FOUND, detail="Simulation not found"
         )
 
-    if simulation.status == Status.STARTED.value:
+    if simulation.status in (Status.STARTED.value, Status.QUEUED.value):
         return ErrorResponse(
             errors=[
                 ErrorModel(
@@ -193,6 +200,11 @@ async def get_results(
                 )
             ]
         )
+    elif simulation.status == Status.STOPPED.value and simulation.partial:
+        # the best solution found before the simulation was cancelled
+        return ResultResponse(
+            data=get_results_from_dump(simulation.id, db), success=True
+        )
     elif simulation.status == Status.STOPPED.value:
         return ErrorResponse(
             errors=[
@@ -202,7 +214,7 @@ async def get_results(
                 )
             ]
         )
-    elif simulation.status == Status.FINISHED.value:
+    elif simulation.status in (Status.FINISHED.value, Status.LIMIT_REACHED.value):
         return ResultResponse(
             data=get_results_from_dump(simulation.id, db), success=True
         )
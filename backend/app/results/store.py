@@ -0,0 +1,240 @@
+"""
+Result Store Module
+=================
+
+This module stores the results of a solved energy system as plain columnar
+files instead of the pickled `oemof_es.dump`. Every result entry of
+`solph.processing.results` (a flow or a node with variables of its own) gets
+one `.npy` array with one column per variable (`flow`, `status`,
+`storage_content`, ...), which readers memory-map and load one bus or one
+component at a time.
+
+A small manifest next to the arrays indexes the entries by node and flow and
+holds everything the results endpoints need without the energy system: the
+class of every node, the scalars (e.g. `invest`), the costs, the emissions
+and the meta results of the solve.
+
+    <dump folder>/results/
+        manifest.json
+        timeindex.npy
+        sequences/<entry>.npy
+
+The module provides:
+    - Writing the store from a solved oemof energy system
+    - Lookup whether a dump folder holds results in either format
+    - Selective, memory-mapped reading of nodes and flows
+"""
+
+import json
+import logging
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from oemof import solph
+
+from .automatic_cost_calc import cost_calculation_from_energysystem
+
+STORE_FOLDER = "results"
+MANIFEST_FILE = "manifest.json"
+DUMP_FILE = "oemof_es.dump"
+# Increased whenever the layout of the store changes.
+STORE_VERSION = 1
+
+Labels = tuple[str, str | None]
+
+logger = logging.getLogger(__name__)
+
+
+def result_store_path(dump_path: str) -> str:
+    """Return the folder of the result store within a dump folder."""
+    return os.path.join(dump_path, STORE_FOLDER)
+
+
+def has_result_store(dump_path: str) -> bool:
+    """Return True if the dump folder holds a complete result store."""
+    # the manifest is written last
+    return os.path.isfile(os.path.join(result_store_path(dump_path), MANIFEST_FILE))
+
+
+def has_results(dump_path: str) -> bool:
+    """Return True if the dump folder holds a result store or a pickled dump."""
+    return has_result_store(dump_path) or os.path.isfile(os.path.join(dump_path, DUMP_FILE))
+
+
+def _labels(key: tuple) -> Labels:
+    return str(key[0]), None if key[1] is None else str(key[1])
+
+
+def write_result_store(oemof_es: solph.EnergySystem, dump_path: str) -> str:
+    """Write the results of a solved energy system as result store.
+
+    - param oemof_es: energy system with processed results
+    - param dump_path: dump folder of the simulation
+    - returns: folder of the written store
+    """
+    path = result_store_path(dump_path)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(os.path.join(path, "sequences"))
+
+    entries = []
+    nodes = {
+        str(node.label): {"class": type(node).__name__, "entries": []}
+        for node in oemof_es.nodes
+    }
+    timeindex = None
+
+    for index, (key, data) in enumerate(oemof_es.results["main"].items()):
+        labels = _labels(key)
+        sequences = data["sequences"]
+        entry = {"labels": list(labels), "file": None, "columns": [], "scalars": {}}
+
+        if not sequences.empty:
+            entry["file"] = os.path.join("sequences", f"{index}.npy")
+            entry["columns"] = [str(column) for column in sequences.columns]
+            np.save(os.path.join(path, entry["file"]), sequences.to_numpy(dtype=float))
+            if timeindex is None or len(sequences.index) > len(timeindex):
+                timeindex = sequences.index
+
+        for name, value in data["scalars"].items():
+            try:
+                entry["scalars"][str(name)] = float(value)
+            except (TypeError, ValueError):
+                continue
+
+        for label in labels:
+            if label is not None:
+                nodes.setdefault(label, {"class": None, "entries": []})["entries"].append(index)
+        entries.append(entry)
+
+    if timeindex is None:
+        timeindex = oemof_es.timeindex
+    np.save(os.path.join(path, "timeindex.npy"), pd.DatetimeIndex(timeindex).to_numpy())
+
+    # the costs need the parameters of the energy system, so they are
+    # calculated while it is at hand
+    try:
+        costs = cost_calculation_from_energysystem(oemof_es).to_dict()
+    except Exception as ex:
+        logger.warning(f"cost calculation failed: {ex}")
+        costs = None
+
+    emissions = oemof_es.results.get("emissions")
+    manifest = {
+        "version": STORE_VERSION,
+        "nodes": nodes,
+        "flows": {
+            f"{entry['labels'][0]}|{entry['labels'][1]}": index
+            for index, entry in enumerate(entries)
+            if entry["labels"][1] is not None
+        },
+        "entries": entries,
+        "costs": costs,
+        "emissions": None if emissions is None else float(emissions),
+        "meta": oemof_es.results.get("meta"),
+    }
+
+    with open(os.path.join(path, MANIFEST_FILE), "wt") as f:
+        json.dump(manifest, f, default=str)
+
+    return path
+
+
+class ResultStore:
+    """Read access to a result store.
+
+    Arrays are memory-mapped, so reading a single bus or component only
+    touches the files of its entries.
+    """
+
+    def __init__(self, dump_path: str):
+        """Open the result store of a dump folder.
+
+        - param dump_path: dump folder of the simulation
+        - raises: FileNotFoundError if the folder holds no result store
+        """
+        self.path = result_store_path(dump_path)
+        with open(os.path.join(self.path, MANIFEST_FILE), "rt") as f:
+            self.manifest = json.load(f)
+        self._timeindex = None
+
+    @property
+    def timeindex(self) -> pd.DatetimeIndex:
+        """Time index of the longest sequences."""
+        if self._timeindex is None:
+            self._timeindex = pd.DatetimeIndex(
+                np.load(os.path.join(self.path, "timeindex.npy"))
+            )
+        return self._timeindex
+
+    @property
+    def nodes(self) -> dict[str, str | None]:
+        """Class names of the nodes by label."""
+        return {label: node["class"] for label, node in self.manifest["nodes"].items()}
+
+    @property
+    def costs(self) -> pd.DataFrame | None:
+        """Costs by node as calculated by `automatic_cost_calc`."""
+        if self.manifest["costs"] is None:
+            return None
+        return pd.DataFrame(self.manifest["costs"])
+
+    @property
+    def emissions(self) -> float | None:
+        return self.manifest["emissions"]
+
+    @property
+    def meta(self) -> dict | None:
+        return self.manifest["meta"]
+
+    def _entry_results(self, entry: dict) -> dict:
+        if entry["file"] is None:
+            sequences = pd.DataFrame()
+        else:
+            values = np.load(os.path.join(self.path, entry["file"]), mmap_mode="r")
+            sequences = pd.DataFrame(
+                values, index=self.timeindex[: len(values)], columns=entry["columns"]
+            )
+
+        return {
+            "sequences": sequences,
+            "scalars": pd.Series(entry["scalars"], dtype=float),
+        }
+
+    def results(self, label: str | None = None) -> dict[Labels, dict]:
+        """Return results keyed by labels like `convert_keys_to_strings`.
+
+        - param label: only load the entries of this node, all if None
+        - returns: dict of sequences and scalars by (label, label or None)
+        """
+        entries = self.manifest["entries"]
+        if label is not None:
+            entries = [entries[index] for index in self.manifest["nodes"][label]["entries"]]
+
+        return {tuple(entry["labels"]): self._entry_results(entry) for entry in entries}
+
+    def node(self, label: str) -> dict:
+        """Return the results of a node like `solph.views.node`.
+
+        - param label: label of a bus or component
+        - returns: dict with "sequences" and "scalars" of all entries of the node
+        - raises: KeyError if there is no node with this label
+        """
+        results = self.results(label)
+        if not results:
+            return {}
+
+        return solph.views.node(results, label, keep_none_type=True)
+
+    def flow(self, source: str, target: str) -> pd.DataFrame:
+        """Return the sequences of a single flow.
+
+        - param source: label of the source node
+        - param target: label of the target node
+        - returns: DataFrame with one column per variable of the flow
+        - raises: KeyError if there is no flow between the nodes
+        """
+        entry = self.manifest["entries"][self.manifest["flows"][f"{source}|{target}"]]
+        return self._entry_results(entry)["sequences"]
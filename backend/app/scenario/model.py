@@ -3,15 +3,107 @@ Scenario data models for storing and updating scenarios.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import TYPE_CHECKING, Annotated
 
 import math
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator, model_validator
 from sqladmin import ModelView
 from sqlalchemy import Column
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
+from ensys.common.types import Solver
+from ..simulation.solvers import SCENARIO_SOLVERS
+
+
+class DiagnosticsLevel(Enum):
+    """Export modes for the LP file of a simulation."""
+
+    NONE = "none"
+    DEFERRED = "deferred"
+    ON_DEMAND = "on_demand"
+
+
+class EnAggregationSettings(BaseModel):
+    """Typical-period aggregation of the time series of a scenario.
+
+    - fields: typical_periods (number of clusters), hours_per_period (e.g. 24
+      for typical days, 168 for typical weeks)
+    """
+
+    typical_periods: int = Field(default=12, ge=1)
+    hours_per_period: float = Field(default=24, gt=0)
+
+
+class EnRollingHorizonSettings(BaseModel):
+    """Rolling horizon solve of dispatch-only scenarios.
+
+    - fields: window_hours (kept part of a window), overlap_hours (look-ahead
+      solved but discarded), parallel_windows (processes for scenarios
+      without storages)
+    """
+
+    window_hours: float = Field(default=168, gt=0)
+    overlap_hours: float = Field(default=24, ge=0)
+    parallel_windows: int = Field(default=1, ge=1)
+
+
+class EnSolverOptions(BaseModel):
+    """Whitelisted solver options of a scenario; unknown options are rejected.
+
+    - fields: mip_gap (relative), time_limit (seconds), method (Gurobi LP
+      algorithm, ignored by other solvers), threads (capped by the thread
+      budget of the worker)
+    """
+
+    model_config = {"extra": "forbid"}
+
+    mip_gap: float | None = Field(default=None, ge=0, le=1)
+    time_limit: float | None = Field(default=None, gt=0)
+    method: int | None = Field(default=None, ge=-1, le=5)
+    threads: int | None = Field(default=None, ge=1)
+
+
+class EnSimulationSettings(BaseModel):
+    """Per-scenario settings for running simulations.
+
+    - fields: diagnostics_level (LP export mode), warm_start (MIP start from the
+      previous simulation of the scenario), aggregation (typical periods
+      instead of the full time series, None = full resolution), rolling_horizon
+      (solve window by window, None = one model), solver_options, presolve
+      (remove dead components and merge lossless busses before the model is
+      built; off by default, as the removed and merged nodes are missing
+      from the results), solver (one of `SCENARIO_SOLVERS`; HiGHS needs no
+      licence)
+    """
+
+    diagnostics_level: DiagnosticsLevel = Field(default=DiagnosticsLevel.ON_DEMAND)
+    warm_start: bool = Field(default=True)
+    aggregation: EnAggregationSettings | None = Field(default=None)
+    rolling_horizon: EnRollingHorizonSettings | None = Field(default=None)
+    solver_options: EnSolverOptions = Field(default_factory=EnSolverOptions)
+    presolve: bool = Field(default=False)
+    solver: Solver = Field(default=Solver.gurobi)
+
+    @field_validator("solver")
+    @classmethod
+    def check_solver(cls, value: Solver) -> Solver:
+        """Reject solvers a scenario can not select."""
+        if value not in SCENARIO_SOLVERS:
+            raise ValueError(
+                f"Solver {value.value} is not supported, choose one of "
+                f"{', '.join(solver.value for solver in SCENARIO_SOLVERS)}."
+            )
+        return value
+
+    @model_validator(mode="after")
+    def check_solve_mode(self):
+        """Reject aggregation and rolling horizon at the same time."""
+        if self.aggregation is not None and self.rolling_horizon is not None:
+            raise ValueError("Aggregation and rolling horizon can not be combined.")
+        return self
+
 
 class EnScenario(BaseModel):
     """Scenario payload with timing, project link, and modeling data."""
@@ -23,6 +115,15 @@ class EnScenario(BaseModel):
     project_id: int = Field()
     constraints: str = Field(default="")
     modeling_data: str = Field(default="")
+    simulation_settings: str = Field(default="")
+
+    @field_validator("simulation_settings")
+    @classmethod
+    def check_simulation_settings(cls, value: str | None) -> str | None:
+        """Reject simulation settings that do not match `EnSimulationSettings`."""
+        if value:
+            EnSimulationSettings.model_validate_json(value)
+        return value
 
     def model_dump(self, *args, **kwargs) -> dict:
         """Return scenario dict converting start_date timestamp."""
@@ -52,6 +153,17 @@ class EnScenarioDB(SQLModel, table=True):
     user_id: int = Field(foreign_key="users.id")
     constraints: str = Field(sa_column=Column(JSONB), default={})
     modeling_data: str = Field(sa_column=Column(JSONB), default={})
+    simulation_settings: str = Field(sa_column=Column(JSONB), default="")
+
+    def get_simulation_settings(self) -> EnSimulationSettings:
+        """Return the parsed simulation settings (defaults if unset)."""
+        if self.simulation_settings is None or self.simulation_settings == "":
+            return EnSimulationSettings()
+
+        if isinstance(self.simulation_settings, str):
+            return EnSimulationSettings.model_validate_json(self.simulation_settings)
+
+        return EnSimulationSettings.model_validate(self.simulation_settings)
 
     def model_dump(self, *args, **kwargs) -> dict:
         """Return scenario dict incl. simulation_year and unix start_date."""
@@ -76,6 +188,7 @@ class EnScenarioUpdate(EnScenario):
     time_steps: Annotated[int | None, Field(default=8760, nullable=True)]
     modeling_data: Annotated[str | None, Field(default=None, nullable=True)]
     constraints: Annotated[str | None, Field(default=None, nullable=True)]
+    simulation_settings: Annotated[str | None, Field(default=None, nullable=True)]
     project_id: Annotated[None, Field(default=None, nullable=True, repr=False)]
 
 
@@ -98,6 +211,7 @@ class ScenarioAdmin(ModelView, model=EnScenarioDB):
         "user_id",
         "constraints",
         "modeling_data",
+        "simulation_settings",
     ]
     name = "Scenario (EnScenarioDB)"
     icon = "fa-solid fa-timeline"
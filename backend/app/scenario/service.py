@@ -21,6 +21,7 @@ from starlette import status
 
 from .model import EnScenarioDB, EnScenario, EnScenarioUpdate
 from ..simulation.service import delete_simulation, read_scenario_simulations
+from ..sweep.service import delete_sweep, read_scenario_sweeps
 from ..user.model import EnUserDB
 
 
@@ -176,6 +177,9 @@ def delete_scenario(scenario_id: int, user: EnUserDB, db: Session) -> bool:
     for simulation in linked_simulations:
         delete_simulation(simulation_id=simulation.id, user=user, db=db)
 
+    for sweep in read_scenario_sweeps(scenario_id=scenario_id, user=user, db=db):
+        delete_sweep(sweep_id=sweep.id, user=user, db=db)
+
     db.delete(scenario)
 
     try:
@@ -0,0 +1,237 @@
+"""
+Time Series Aggregation Module
+============================
+
+This module reduces a scenario to a small number of typical periods (e.g.
+typical days or weeks) before the oemof energy system is created. All
+profiles of the energy system (`fix`, `min`, `max`, costs, conversion factors,
+storage losses, ...) are clustered jointly, so the typical periods keep the
+correlation between e.g. demand and PV feed-in.
+
+Every period is represented by the medoid of its cluster, i.e. a real period
+of the input, and the clusters are weighted by the number of periods they
+stand for. oemof.solph runs the model in its TSAM mode with these parameters:
+storages are balanced across the sequence of original periods and the
+results are expanded back to the full time index.
+
+The module provides:
+    - Discovery of all profiles of a converted `EnEnergysystem`
+    - Joint clustering of the profiles into typical periods
+    - Creation of the aggregated energy system and its `tsa_parameters`
+    - Expansion of aggregated sequences to the full time index
+"""
+
+import copy
+from numbers import Real
+
+import numpy as np
+from pydantic import BaseModel
+
+from ensys.common.timeseries import TimeSeries
+from ensys.components import EnEnergysystem
+from ..scenario.model import EnAggregationSettings
+
+# Iteration limit of the k-means refinement; converges far earlier in practice.
+_MAX_ITERATIONS = 100
+
+
+def steps_per_period(interval: float, aggregation: EnAggregationSettings) -> int:
+    """Return the number of time steps of one typical period."""
+    return max(1, round(aggregation.hours_per_period / interval))
+
+
+def aggregated_time_steps(
+    time_steps: int, interval: float, aggregation: EnAggregationSettings
+) -> int:
+    """Return the number of time steps of the aggregated model.
+
+    - param time_steps: number of time steps of the scenario
+    - param interval: length of a time step in hours
+    - param aggregation: aggregation settings of the scenario
+    - returns: time steps of all typical periods
+    - raises: ValueError if the time steps are no multiple of a period
+    """
+    steps = steps_per_period(interval, aggregation)
+    if time_steps % steps != 0:
+        raise ValueError(
+            f"The {time_steps} time steps of the scenario are no multiple of the "
+            f"{steps} time steps of a typical period."
+        )
+
+    return min(aggregation.typical_periods, time_steps // steps) * steps
+
+
+def _is_profile(value, time_steps: int) -> bool:
+    """Return True if `value` is a numeric sequence over all time steps."""
+    if isinstance(value, TimeSeries):
+        return len(value) == time_steps
+
+    return (
+        isinstance(value, list)
+        and len(value) == time_steps
+        and all(isinstance(item, Real) and not isinstance(item, bool) for item in value)
+    )
+
+
+def find_profiles(node, time_steps: int, found: list | None = None) -> list[tuple]:
+    """Collect all profiles below `node`.
+
+    - param node: energy system, component, dict or list to search
+    - param time_steps: number of time steps of the scenario
+    - param found: list to append to (internal)
+    - returns: list of (container, key) tuples addressing the profiles
+    """
+    if found is None:
+        found = []
+
+    if isinstance(node, BaseModel):
+        items = [(name, getattr(node, name)) for name in type(node).model_fields]
+    elif isinstance(node, dict):
+        items = list(node.items())
+    elif isinstance(node, list):
+        items = list(enumerate(node))
+    else:
+        return found
+
+    for key, value in items:
+        if _is_profile(value, time_steps):
+            found.append((node, key))
+        else:
+            find_profiles(value, time_steps, found)
+
+    return found
+
+
+def _get(container, key):
+    return getattr(container, key) if isinstance(container, BaseModel) else container[key]
+
+
+def _set(container, key, value):
+    if isinstance(container, BaseModel):
+        setattr(container, key, value)
+    else:
+        container[key] = value
+
+
+def cluster_periods(
+    profiles: np.ndarray, steps: int, typical_periods: int, seed: int = 0
+) -> tuple[list[int], list[int]]:
+    """Cluster the periods of the profiles jointly.
+
+    Profiles are scaled to [0, 1] first, so all of them have the same weight
+    regardless of their unit. Clusters are found with k-means (k-means++
+    initialisation, fixed seed) and represented by their medoid.
+
+    - param profiles: array of shape (profiles, time steps)
+    - param steps: time steps per period
+    - param typical_periods: number of clusters
+    - param seed: seed of the initialisation for reproducible results
+    - returns: order (cluster of each original period) and the original
+      period representing each cluster
+    """
+    period_count = profiles.shape[1] // steps
+
+    low = profiles.min(axis=1, keepdims=True)
+    span = profiles.max(axis=1, keepdims=True) - low
+    scaled = np.divide(profiles - low, span, out=np.zeros_like(profiles), where=span > 0)
+
+    # one row per period with the concatenated profiles of that period
+    periods = scaled.reshape(len(profiles), period_count, steps).transpose(1, 0, 2)
+    periods = periods.reshape(period_count, -1)
+
+    if typical_periods >= period_count:
+        return list(range(period_count)), list(range(period_count))
+
+    rng = np.random.default_rng(seed)
+    centers = [periods[rng.integers(period_count)]]
+    while len(centers) < typical_periods:
+        distances = np.min([((periods - center) ** 2).sum(axis=1) for center in centers], axis=0)
+        if distances.sum() == 0:
+            break
+        centers.append(periods[rng.choice(period_count, p=distances / distances.sum())])
+    centers = np.array(centers)
+
+    labels = None
+    for _ in range(_MAX_ITERATIONS):
+        distances = ((periods[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        new_labels = distances.argmin(axis=1)
+        if labels is not None and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        centers = np.array(
+            [
+                periods[labels == cluster].mean(axis=0) if (labels == cluster).any() else centers[cluster]
+                for cluster in range(len(centers))
+            ]
+        )
+
+    # drop empty clusters and represent each cluster by its medoid
+    order = []
+    medoids = []
+    cluster_index = {}
+    for label in labels:
+        if label not in cluster_index:
+            members = np.flatnonzero(labels == label)
+            distances = ((periods[members] - centers[label]) ** 2).sum(axis=1)
+            cluster_index[label] = len(medoids)
+            medoids.append(int(members[distances.argmin()]))
+        order.append(cluster_index[label])
+
+    return order, medoids
+
+
+def aggregate_energysystem(
+    energysystem: EnEnergysystem,
+    time_steps: int,
+    interval: float,
+    aggregation: EnAggregationSettings,
+) -> tuple[EnEnergysystem, dict]:
+    """Reduce all profiles of an energy system to typical periods.
+
+    - param energysystem: converted energy system (not modified)
+    - param time_steps: number of time steps of the scenario
+    - param interval: length of a time step in hours
+    - param aggregation: aggregation settings of the scenario
+    - returns: aggregated energy system and the `tsa_parameters` for solph
+    - raises: ValueError if the time steps are no multiple of a period
+    """
+    aggregated_time_steps(time_steps, interval, aggregation)
+    steps = steps_per_period(interval, aggregation)
+
+    aggregated = copy.deepcopy(energysystem)
+    profiles = find_profiles(aggregated, time_steps)
+
+    if profiles:
+        values = np.array([_get(container, key) for container, key in profiles], dtype=float)
+        order, medoids = cluster_periods(values, steps, aggregation.typical_periods)
+    else:
+        # without profiles every period is the same
+        order, medoids = [0] * (time_steps // steps), [0]
+
+    for container, key in profiles:
+        profile = _get(container, key)
+        periods = [profile[period * steps:(period + 1) * steps] for period in medoids]
+        if isinstance(profile, TimeSeries):
+            _set(container, key, TimeSeries.validate(np.concatenate(periods)))
+        else:
+            _set(container, key, [value for values in periods for value in values])
+
+    return aggregated, {"timesteps_per_period": steps, "order": order}
+
+
+def disaggregate_sequence(values, tsa_parameters: list[dict] | dict) -> np.ndarray:
+    """Expand an aggregated sequence to the full time index.
+
+    - param values: sequence over the time steps of the typical periods
+    - param tsa_parameters: `tsa_parameters` of the aggregated energy system
+    - returns: array over the time steps of all original periods
+    """
+    if isinstance(tsa_parameters, list):
+        tsa_parameters = tsa_parameters[0]
+
+    steps = tsa_parameters["timesteps_per_period"]
+    values = np.asarray(values)
+
+    return np.concatenate(
+        [values[period * steps:(period + 1) * steps] for period in tsa_parameters["order"]]
+    )
@@ -0,0 +1,336 @@
+"""
+Simulation Artifact Module
+========================
+
+This module manages the simulation and sweep folders below
+`LOCAL_DATADIR/<token>` over their lifetime.
+
+When a run is finished, its JSON snapshots and logs are compressed to
+`<file>.gz`; `open_artifact` opens either form, so readers do not care
+whether a folder was already compacted.
+
+A run is superseded when a newer run of its scenario finished (for sweeps, a
+newer sweep of the scenario). The heavy files of superseded runs (pickled
+dump, LP export, solver log) are evicted once they were not used for
+`artifacts_evict_after_days`, or earlier, least recently used first, when
+their user exceeds `artifacts_user_quota_mb`. Their result store is kept, so
+superseded runs still show their results and serve as warm start or result
+cache. A folder counts as used when it is written or its results are read.
+
+Folders which no simulation or sweep refers to any more, e.g. after a
+scenario or project was deleted, are removed by the garbage collector.
+
+The module provides:
+    - Transparent compression and reading of artifacts
+    - Disk usage of folders, users and projects
+    - Eviction of heavy files of superseded runs by age and user quota
+    - Garbage collection of orphaned folders
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import time
+from collections import defaultdict
+
+from sqlmodel import Session, select
+
+from .diagnostics import LP_EXPORT_FILENAME
+from .model import EnSimulationDB, Status
+from ..results.store import DUMP_FILE, has_result_store
+from ..scenario.model import EnScenarioDB
+from ..sweep.model import EnSweepDB
+
+COMPRESSED_SUFFIX = ".gz"
+# Files of a finished run compressed by `compress_artifacts`.
+COMPRESSIBLE_SUFFIXES = (".json", ".log")
+# Files of a superseded run which are not needed to show its results.
+HEAVY_FILES = (
+    os.path.join("dump", DUMP_FILE),
+    os.path.join("dump", LP_EXPORT_FILENAME),
+    os.path.join("log", "solver.log"),
+    os.path.join("log", "solver.log" + COMPRESSED_SUFFIX),
+)
+# Entries of which one exists in every simulation and sweep folder.
+_RUN_FOLDER_ENTRIES = ("dump", "log", "snapshot", "modeling_data.json", "modeling_data.json" + COMPRESSED_SUFFIX)
+# Statuses of runs whose results supersede older runs of their scenario.
+_RESULT_STATUSES = (Status.FINISHED.value, Status.LIMIT_REACHED.value)
+
+logger = logging.getLogger(__name__)
+
+
+def open_artifact(path: str, mode: str = "rt"):
+    """Open an artifact which may have been compressed in the meantime.
+
+    - param path: path of the uncompressed artifact
+    - param mode: read mode, "rt" or "rb"
+    - returns: file object of the plain or the compressed artifact
+    - raises: FileNotFoundError if neither exists
+    """
+    if not os.path.exists(path) and os.path.exists(path + COMPRESSED_SUFFIX):
+        return gzip.open(path + COMPRESSED_SUFFIX, mode)
+
+    return open(path, mode)
+
+
+def compress_artifacts(folder: str) -> int:
+    """Compress the JSON snapshots and logs of a finished run.
+
+    - param folder: simulation or sweep folder
+    - returns: number of bytes saved
+    """
+    saved = 0
+
+    for root, folders, files in os.walk(folder):
+        # the result store is memory-mapped and stays uncompressed
+        if "dump" in folders:
+            folders.remove("dump")
+
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+
+            path = os.path.join(root, name)
+            with open(path, "rb") as source, gzip.open(path + COMPRESSED_SUFFIX, "wb") as target:
+                shutil.copyfileobj(source, target)
+
+            saved += os.path.getsize(path) - os.path.getsize(path + COMPRESSED_SUFFIX)
+            os.remove(path)
+
+    return saved
+
+
+def mark_used(folder: str):
+    """Record that the artifacts of `folder` were used just now."""
+    if os.path.isdir(folder):
+        os.utime(folder)
+
+
+def folder_size(folder: str) -> int:
+    """Return the size of all files below `folder` in bytes."""
+    size = 0
+
+    for root, _, files in os.walk(folder):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except FileNotFoundError:
+                pass
+
+    return size
+
+
+def evict_heavy_files(folder: str) -> int:
+    """Delete the heavy files of a run which its results do not need.
+
+    A pickled dump is only deleted if the run has a result store, as runs
+    finished before the result store was introduced are read from it.
+
+    - param folder: simulation or sweep folder
+    - returns: number of bytes freed
+    """
+    freed = 0
+    keep_dump = not has_result_store(os.path.join(folder, "dump"))
+
+    for name in HEAVY_FILES:
+        path = os.path.join(folder, name)
+        if not os.path.isfile(path) or (keep_dump and name.endswith(DUMP_FILE)):
+            continue
+
+        freed += os.path.getsize(path)
+        os.remove(path)
+
+    return freed
+
+
+def _user_runs(db: Session, user_id: int | None) -> tuple[list[EnSimulationDB], list[EnSweepDB]]:
+    """Return the simulations and sweeps of a user, or of all users if None."""
+    simulations = select(EnSimulationDB)
+    sweeps = select(EnSweepDB)
+    if user_id is not None:
+        # sweep variants have no user of their own
+        simulations = simulations.join(EnScenarioDB, EnSimulationDB.scenario_id == EnScenarioDB.id).where(
+            EnScenarioDB.user_id == user_id
+        )
+        sweeps = sweeps.join(EnScenarioDB, EnSweepDB.scenario_id == EnScenarioDB.id).where(
+            EnScenarioDB.user_id == user_id
+        )
+
+    return list(db.exec(simulations).all()), list(db.exec(sweeps).all())
+
+
+def superseded_tokens(db: Session, user_id: int | None = None) -> set[str]:
+    """Return the folders of runs superseded by a newer finished run.
+
+    A folder shared through the result cache is only superseded if all
+    simulations using it are.
+
+    - param db: SQLModel session
+    - param user_id: restrict to the runs of this user or None for all users
+    - returns: tokens of the superseded simulation and sweep folders
+    """
+    simulations, sweeps = _user_runs(db, user_id)
+
+    newest: dict[int, int] = {}
+    for simulation in simulations:
+        if simulation.sweep_id is None and simulation.status in _RESULT_STATUSES:
+            newest[simulation.scenario_id] = max(newest.get(simulation.scenario_id, 0), simulation.id)
+
+    newest_sweep: dict[int, int] = {}
+    for sweep in sweeps:
+        newest_sweep[sweep.scenario_id] = max(newest_sweep.get(sweep.scenario_id, 0), sweep.id)
+
+    current: dict[str, bool] = defaultdict(bool)
+    for simulation in simulations:
+        if simulation.sweep_id is None:
+            is_current = simulation.id >= newest.get(simulation.scenario_id, 0)
+        else:
+            is_current = simulation.sweep_id == newest_sweep.get(simulation.scenario_id)
+        current[simulation.get_result_token()] |= is_current
+    for sweep in sweeps:
+        current[sweep.sweep_token] |= sweep.id == newest_sweep[sweep.scenario_id]
+
+    return {token for token, is_current in current.items() if not is_current}
+
+
+def _owned_tokens(db: Session, user_id: int) -> set[str]:
+    """Return the folders of the runs of a user, shared folders included."""
+    simulations, sweeps = _user_runs(db, user_id)
+
+    return {simulation.get_result_token() for simulation in simulations} | {
+        sweep.sweep_token for sweep in sweeps
+    }
+
+
+def user_disk_usage(datadir: str, db: Session, user_id: int) -> int:
+    """Return the disk usage of the runs of a user in bytes."""
+    return sum(folder_size(os.path.join(datadir, token)) for token in _owned_tokens(db, user_id))
+
+
+def project_disk_usage(datadir: str, db: Session, project_id: int) -> dict:
+    """Return the disk usage of a project by scenario.
+
+    Folders shared through the result cache are counted for the run which
+    wrote them.
+
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - param project_id: project database id
+    - returns: dict with the total and the bytes per scenario id
+    """
+    scenarios = db.exec(select(EnScenarioDB).where(EnScenarioDB.project_id == project_id)).all()
+
+    usage = {}
+    for scenario in scenarios:
+        tokens = {
+            simulation.sim_token
+            for simulation in db.exec(
+                select(EnSimulationDB).where(EnSimulationDB.scenario_id == scenario.id)
+            ).all()
+            if simulation.result_token is None
+        } | {
+            sweep.sweep_token
+            for sweep in db.exec(select(EnSweepDB).where(EnSweepDB.scenario_id == scenario.id)).all()
+        }
+        usage[scenario.id] = sum(folder_size(os.path.join(datadir, token)) for token in tokens)
+
+    return {"total": sum(usage.values()), "scenarios": usage}
+
+
+def _last_used(folder: str) -> float:
+    try:
+        return os.path.getmtime(folder)
+    except FileNotFoundError:
+        return 0.0
+
+
+def evict_expired(datadir: str, db: Session, max_age_days: int) -> int:
+    """Evict the heavy files of superseded runs not used for `max_age_days`.
+
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - param max_age_days: age after which the heavy files are evicted
+    - returns: number of bytes freed
+    """
+    deadline = time.time() - max_age_days * 86400
+    freed = 0
+
+    for token in superseded_tokens(db):
+        folder = os.path.join(datadir, token)
+        if os.path.isdir(folder) and _last_used(folder) < deadline:
+            freed += evict_heavy_files(folder)
+
+    return freed
+
+
+def enforce_quota(datadir: str, db: Session, user_id: int, quota_mb: int) -> int:
+    """Evict heavy files of superseded runs until a user is within the quota.
+
+    The least recently used runs are evicted first. Current runs and result
+    stores are never evicted, so the usage may stay above the quota.
+
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - param user_id: user database id
+    - param quota_mb: disk quota of the user in MB (0 = unlimited)
+    - returns: disk usage of the user in bytes afterwards
+    """
+    usage = user_disk_usage(datadir, db, user_id)
+    quota = quota_mb * 1024 * 1024
+    if not quota_mb or usage <= quota:
+        return usage
+
+    folders = sorted(
+        (os.path.join(datadir, token) for token in superseded_tokens(db, user_id)),
+        key=_last_used,
+    )
+    for folder in folders:
+        if usage <= quota:
+            break
+        usage -= evict_heavy_files(folder)
+
+    if usage > quota:
+        logger.warning(f"User {user_id} uses {usage // (1024 * 1024)} MB, quota {quota_mb} MB")
+
+    return usage
+
+
+def _is_run_folder(entry: os.DirEntry) -> bool:
+    """Return True if `entry` is a folder written by a simulation or sweep."""
+    return entry.is_dir() and any(
+        os.path.exists(os.path.join(entry.path, name)) for name in _RUN_FOLDER_ENTRIES
+    )
+
+
+def collect_garbage(datadir: str, db: Session, grace_seconds: int) -> list[str]:
+    """Remove the folders no simulation or sweep refers to.
+
+    Folders changed within `grace_seconds` are kept, as the run writing them
+    may not be committed yet.
+
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - param grace_seconds: minimum age of a removed folder
+    - returns: tokens of the removed folders
+    """
+    simulations, sweeps = _user_runs(db, None)
+    referenced = (
+        {simulation.sim_token for simulation in simulations}
+        | {simulation.result_token for simulation in simulations if simulation.result_token}
+        | {sweep.sweep_token for sweep in sweeps}
+    )
+    deadline = time.time() - grace_seconds
+
+    removed = []
+    for entry in os.scandir(datadir):
+        if not _is_run_folder(entry) or entry.name in referenced or _last_used(entry.path) > deadline:
+            continue
+
+        shutil.rmtree(entry.path, ignore_errors=True)
+        removed.append(entry.name)
+
+    if removed:
+        logger.info(f"Removed {len(removed)} orphaned simulation folders")
+
+    return removed
@@ -0,0 +1,213 @@
+"""
+Build Cache Module
+================
+
+This module keeps built oemof models, so runs which only differ in cost and
+bound coefficients (e.g. the variants of a sweep) re-solve the model of the
+previous run instead of building the energy system and the Pyomo model again.
+
+Runs share a model if the structure key of their energy systems is equal. The
+key covers everything but the mutable coefficients:
+
+    - `variable_costs` of all flows, `ep_costs` and `offset` of investments
+      and the `storage_costs` of storages only enter the objective, which is
+      rebuilt from the updated components,
+    - `nominal_value`, `min`, `max` and the values of `fix` of flows with a
+      fixed capacity only bound the flow variables, which are set again. This
+      does not apply to nonconvex flows and flows with full load time or
+      gradient limits, as their bounds enter constraints.
+
+The solution of the previous run stays in the variables of a reused model,
+so it is the MIP start of the next solve.
+
+The module provides:
+    - The structure key of an energy system
+    - Updating the coefficients of a built model in place
+    - A cache of built models by structure key
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+
+from oemof import solph
+
+from ensys.components import EnEnergysystem, EnFlow, EnInvestment
+
+_COMPONENT_LISTS = ("sinks", "sources", "converters", "generic_storages")
+
+# Replaces the mutable coefficients in the structure key.
+_MUTABLE = "mutable"
+
+
+class BuiltModel:
+    """Built oemof energy system and model of a structure key.
+
+    - param oemof_es: populated oemof energy system
+    - param model: solph.Model of `oemof_es`
+    """
+
+    def __init__(self, oemof_es: solph.EnergySystem, model: solph.Model):
+        self.oemof_es = oemof_es
+        self.model = model
+
+
+class BuildCache:
+    """Built models by structure key; the least recently used is dropped first.
+
+    Every model holds its whole Pyomo model in memory, so the cache is small
+    and lives as long as the task that solves the runs.
+
+    - param size: number of models kept
+    """
+
+    def __init__(self, size: int = 1):
+        self.size = size
+        self._models: OrderedDict[str, BuiltModel] = OrderedDict()
+
+    def get(self, key: str) -> BuiltModel | None:
+        """Return the model of `key` or None."""
+        if key not in self._models:
+            return None
+
+        self._models.move_to_end(key)
+        return self._models[key]
+
+    def put(self, key: str, built: BuiltModel):
+        """Keep `built` as model of `key`."""
+        self._models[key] = built
+        self._models.move_to_end(key)
+
+        while len(self._models) > self.size:
+            self._models.popitem(last=False)
+
+
+def has_mutable_bounds(flow: EnFlow) -> bool:
+    """Return True if the bounds of `flow` only enter its variable bounds."""
+    return (
+        isinstance(flow.nominal_value, (int, float))
+        and flow.nonconvex is None
+        and not flow.full_load_time_max
+        and not flow.full_load_time_min
+        and flow.positive_gradient_limit is None
+        and flow.negative_gradient_limit is None
+    )
+
+
+def _mask_investment(data: dict):
+    data["ep_costs"] = _MUTABLE
+    data["offset"] = _MUTABLE
+
+
+def _mask_flow(flow: EnFlow, data: dict):
+    data["variable_costs"] = _MUTABLE
+
+    if isinstance(flow.nominal_value, EnInvestment):
+        _mask_investment(data["nominal_value"])
+    elif has_mutable_bounds(flow):
+        # a fixed flow stays fixed, only its profile may change
+        data["fix"] = _MUTABLE if flow.fix is not None else None
+        data["nominal_value"] = _MUTABLE
+        data["min"] = _MUTABLE
+        data["max"] = _MUTABLE
+
+
+def structure_key(
+    energysystem: EnEnergysystem,
+    constraints: list[dict] | None,
+    time_index: dict,
+) -> str:
+    """Return the sha256 key of the model structure of `energysystem`.
+
+    - param energysystem: converted energy system of the run
+    - param constraints: parsed scenario constraints or None
+    - param time_index: start date, time steps and interval of the run
+    - returns: hex digest of the energy system without its mutable
+      coefficients, the constraints and the time index
+    """
+    # profiles in place, a shared one may be masked for one component only
+    data = energysystem.model_dump(mode="json", context={"shared_timeseries": False})
+
+    for list_name in _COMPONENT_LISTS:
+        for component, component_data in zip(getattr(energysystem, list_name), data[list_name]):
+            for direction in ("inputs", "outputs"):
+                for bus, flow in (getattr(component, direction, None) or {}).items():
+                    _mask_flow(flow, component_data[direction][bus])
+
+            if list_name == "generic_storages":
+                component_data["storage_costs"] = _MUTABLE
+                if isinstance(component.nominal_storage_capacity, EnInvestment):
+                    _mask_investment(component_data["nominal_storage_capacity"])
+
+    canonical = json.dumps(
+        {"energysystem": data, "constraints": constraints, "time_index": time_index},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _update_flow(model: solph.Model, edge: tuple, flow: EnFlow):
+    """Copy the mutable coefficients of `flow` to the built flow of `edge`."""
+    target: solph.Flow = model.flows[edge]
+    source: solph.Flow = flow.to_oemof(model.es)
+
+    target.variable_costs = source.variable_costs
+    if target.investment is not None:
+        target.investment.ep_costs = source.investment.ep_costs
+        target.investment.offset = source.investment.offset
+    elif has_mutable_bounds(flow):
+        target.nominal_capacity = source.nominal_capacity
+        target.fix = source.fix
+        target.maximum = source.maximum
+        target.minimum = source.minimum
+
+        # same bounds as solph.Model sets on construction
+        for t in model.TIMESTEPS:
+            variable = model.flow[edge[0], edge[1], t]
+            if target.fix[t] is not None:
+                variable.fix(target.fix[t] * target.nominal_capacity)
+            else:
+                variable.setub(target.maximum[t] * target.nominal_capacity)
+                variable.setlb(target.minimum[t] * target.nominal_capacity)
+
+
+def update_model(built: BuiltModel, energysystem: EnEnergysystem):
+    """Update the built model to the coefficients of `energysystem`.
+
+    `energysystem` must have the structure key of the built model.
+
+    - param built: built model of a previous run
+    - param energysystem: converted energy system of the next run
+    """
+    oemof_es = built.oemof_es
+    model = built.model
+
+    for list_name in _COMPONENT_LISTS:
+        for component in getattr(energysystem, list_name):
+            node = oemof_es.groups[component.label]
+
+            for bus, flow in (getattr(component, "inputs", None) or {}).items():
+                _update_flow(model, (oemof_es.groups[bus], node), flow)
+            for bus, flow in (getattr(component, "outputs", None) or {}).items():
+                _update_flow(model, (node, oemof_es.groups[bus]), flow)
+
+            if list_name == "generic_storages":
+                node.storage_costs = solph.sequence(component.storage_costs)
+                if isinstance(component.nominal_storage_capacity, EnInvestment):
+                    investment = component.nominal_storage_capacity.to_oemof(oemof_es)
+                    node.investment.ep_costs = investment.ep_costs
+                    node.investment.offset = investment.offset
+
+    # the blocks replace their cost expressions, which pyomo warns about
+    pyomo_logger = logging.getLogger("pyomo.core")
+    level = pyomo_logger.level
+    pyomo_logger.setLevel(logging.ERROR)
+    try:
+        model._add_objective(update=True)
+    finally:
+        pyomo_logger.setLevel(level)
@@ -0,0 +1,46 @@
+"""
+Simulation Diagnostics Module
+===========================
+
+This module writes the LP file of a simulation for debugging purposes. The
+LP file is streamed through gzip while it is generated, so no uncompressed
+copy of the (often several hundred MB large) file is written to disk.
+
+The module provides:
+    - Path helpers for the compressed LP export
+    - Streaming LP writer for oemof models
+"""
+
+import gzip
+import os
+
+from oemof import solph
+from pyomo.repn.plugins.lp_writer import LPWriter
+
+LP_EXPORT_FILENAME = "oemof_model.lp.gz"
+
+
+def lp_export_path(datadir: str, sim_token: str) -> str:
+    """Return the path of the compressed LP export of a simulation."""
+    return os.path.abspath(os.path.join(datadir, sim_token, "dump", LP_EXPORT_FILENAME))
+
+
+def write_compressed_lp(oemof_model: solph.Model, filename: str) -> str:
+    """Write the LP representation of `oemof_model` gzip compressed.
+
+    The file is written to a temporary name first and renamed when complete,
+    so readers never see a partially written export.
+
+    - param oemof_model: constructed oemof model
+    - param filename: target path of the compressed file
+    - returns: path of the written file
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    partial_filename = f"{filename}.part"
+
+    with gzip.open(partial_filename, "wt", compresslevel=6) as lp_stream:
+        LPWriter().write(oemof_model, lp_stream, symbolic_solver_labels=True)
+
+    os.replace(partial_filename, filename)
+
+    return filename
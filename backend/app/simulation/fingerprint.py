@@ -0,0 +1,116 @@
+"""
+Simulation Fingerprint Module
+===========================
+
+This module derives a canonical fingerprint from all inputs of a scenario that
+influence the optimization result. Two simulations with the same fingerprint
+solve the identical problem, so a finished run can be reused instead of
+converting, building and solving the model again.
+
+The module provides:
+    - Canonical serialization of the solve-relevant scenario inputs
+    - Fingerprint calculation (sha256)
+    - Lookup of a finished simulation with reusable results
+"""
+
+import hashlib
+import json
+import os
+
+from sqlmodel import Session, select
+
+from .model import EnSimulationDB, Status
+from ..results.store import has_results
+from ..scenario.model import EnScenarioDB
+
+# Increase when the simulation pipeline changes in a way that alters results,
+# so that previously stored results are no longer reused.
+FINGERPRINT_VERSION = 2
+
+
+def _load_json_field(value) -> object | None:
+    """Parse a scenario JSON field which may be stored as string or object."""
+    if value is None or value == "":
+        return None
+
+    if isinstance(value, str):
+        return json.loads(value)
+
+    return value
+
+
+def fingerprint_inputs(scenario: EnScenarioDB) -> dict:
+    """Collect all scenario inputs that influence the optimization result.
+
+    - param scenario: scenario to be simulated
+    - returns: dict with modeling data, constraints, time settings, solver,
+      solver options, presolve and the aggregation or rolling horizon settings
+    """
+    simulation_settings = scenario.get_simulation_settings()
+
+    inputs = {
+        "version": FINGERPRINT_VERSION,
+        "modeling_data": _load_json_field(scenario.modeling_data),
+        "constraints": _load_json_field(scenario.constraints),
+        "time_steps": scenario.time_steps,
+        "interval": float(scenario.interval),
+        "start_date": scenario.start_date.isoformat(),
+        "solver": simulation_settings.solver.value,
+    }
+
+    # only part of the fingerprint if set, monolithic runs stay reusable
+    if simulation_settings.aggregation is not None:
+        inputs["aggregation"] = simulation_settings.aggregation.model_dump()
+    if simulation_settings.rolling_horizon is not None:
+        inputs["rolling_horizon"] = simulation_settings.rolling_horizon.model_dump()
+    # the presolve removes nodes from the results
+    inputs["presolve"] = simulation_settings.presolve
+    # the number of threads does not change the result
+    solver_options = simulation_settings.solver_options.model_dump(exclude={"threads"}, exclude_none=True)
+    if solver_options:
+        inputs["solver_options"] = solver_options
+
+    return inputs
+
+
+def scenario_fingerprint(scenario: EnScenarioDB) -> str:
+    """Return the sha256 fingerprint of the solve-relevant scenario inputs.
+
+    Keys are sorted and whitespace is stripped, so the fingerprint does not
+    depend on how the GUI serialized the modeling data.
+
+    - param scenario: scenario to be simulated
+    - returns: hex digest of the canonical input representation
+    """
+    canonical = json.dumps(
+        fingerprint_inputs(scenario),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def find_cached_simulation(
+    fingerprint: str, datadir: str, db: Session
+) -> EnSimulationDB | None:
+    """Return the newest finished simulation with this fingerprint and results.
+
+    - param fingerprint: fingerprint of the scenario to be simulated
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - returns: EnSimulationDB whose results can be reused or None
+    """
+    candidates = db.exec(
+        select(EnSimulationDB)
+        .where(EnSimulationDB.fingerprint == fingerprint)
+        .where(EnSimulationDB.status == Status.FINISHED.value)
+        .order_by(EnSimulationDB.end_date.desc())
+    ).all()
+
+    for candidate in candidates:
+        if has_results(os.path.join(datadir, candidate.get_result_token(), "dump")):
+            return candidate
+
+    return None
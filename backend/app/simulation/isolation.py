@@ -0,0 +1,554 @@
+"""
+Isolated Solve Module
+===================
+
+This module runs the build-and-solve stage of a simulation in a dedicated
+child process. The oemof energy system and the Pyomo model only ever exist in
+the child, so their memory is returned to the operating system when it exits,
+and a model exceeding the limits of the child ends the child instead of the
+long-lived Celery worker.
+
+The parent writes a job file next to the converted model and starts
+`python -m <this module> <job file>`; other jobs, such as the chunks of a
+sweep, bring their own entry module built on `run_child`. The child builds, solves and dumps the
+energy system and writes back a small outcome file with its stage durations;
+the results themselves are only exchanged through the result store.
+
+The child runs in a process group of its own with a private temporary
+folder. A cancelled solve is interrupted with SIGINT, on which the in-memory
+solver interfaces stop and return their incumbent; the child writes it as
+partial result with its gap. A rolling horizon solve stops before its next
+window, or keeps the incumbent if its last window was interrupted. After
+the child exited, or after a grace period if it does not react, the whole
+process group is killed and the temporary folder removed, so no solver
+process outlives the task.
+
+The module provides:
+    - Job, limits and outcome models exchanged with the child
+    - Running the child with resource limits and measuring its peak memory
+    - Loading and building the model of a job, shared with the LP export
+    - Cancellation of the child, keeping the best solution found so far
+    - Mapping of a killed or failed child to a readable error
+    - The entry point of the child process and its error handling
+"""
+
+import ctypes
+import functools
+import logging
+import os
+import resource
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from typing import Callable
+
+from pydantic import BaseModel, Field
+
+from .timing import StageTimer
+from ..scenario.model import EnAggregationSettings, EnRollingHorizonSettings
+
+# Linux prctl option delivering a signal to the child when its parent dies.
+_PR_SET_PDEATHSIG = 1
+# Grace period between SIGXCPU at the soft and SIGKILL at the hard CPU limit.
+_CPU_GRACE_SECONDS = 5
+# Exit code of a child which caught an error and wrote it to the outcome.
+_EXIT_FAILED = 1
+# Error of a cancelled solve without a feasible solution.
+_CANCELLED_ERROR = "The solve was cancelled before a feasible solution was found."
+
+
+class SolveJob(BaseModel):
+    """Input of the child process.
+
+    - fields: paths of the converted model (run folder with the input
+      snapshot or JSON file), dump folder and log file, time
+      index, optional aggregation or rolling horizon, constraints, solver and
+      options, optional warm start dump, whether to keep the pickled dump,
+      file whose existence tells the child that the solve was cancelled,
+      whether to presolve the energy system
+    """
+
+    converted_model: str = Field()
+    dump_path: str = Field()
+    log_file: str | None = Field(default=None)
+    start_date: datetime = Field()
+    time_steps: int = Field()
+    interval: float = Field()
+    aggregation: EnAggregationSettings | None = Field(default=None)
+    rolling_horizon: EnRollingHorizonSettings | None = Field(default=None)
+    constraints: list[dict] | None = Field(default=None)
+    solver: str = Field()
+    cmdline_options: dict = Field(default_factory=dict)
+    warm_start_dump: str | None = Field(default=None)
+    keep_dump: bool = Field(default=False)
+    cancel_file: str | None = Field(default=None)
+    presolve: bool = Field(default=False)
+
+
+class SolveLimits(BaseModel):
+    """Resource limits of the child process (0 = unlimited).
+
+    The CPU time is summed over all threads, so a solver using n threads
+    reaches the limit n times faster than the wall clock.
+
+    - fields: memory_mb (address space), cpu_seconds
+    """
+
+    memory_mb: int = Field(default=0)
+    cpu_seconds: int = Field(default=0)
+
+
+class SolveOutcome(BaseModel):
+    """Result of the child process.
+
+    A cancelled solve without error wrote the incumbent as partial result, a
+    solve stopped at its time limit the best solution found.
+
+    - fields: stage durations, warm_started, error, peak_memory_mb, cancelled,
+      partial, limit_reached, relative gap of the solution
+    """
+
+    durations: dict[str, float] = Field(default_factory=dict)
+    warm_started: bool = Field(default=False)
+    error: str | None = Field(default=None)
+    peak_memory_mb: int | None = Field(default=None)
+    cancelled: bool = Field(default=False)
+    partial: bool = Field(default=False)
+    limit_reached: bool = Field(default=False)
+    gap: float | None = Field(default=None)
+
+
+class SolveProcessError(RuntimeError):
+    """The child process failed; `outcome` holds what is known about it."""
+
+    def __init__(self, message: str, outcome: SolveOutcome):
+        super().__init__(message)
+        self.outcome = outcome
+
+
+class SolveCancellation:
+    """Cancellation of a solve process, e.g. requested from a signal handler.
+
+    The child is interrupted with SIGINT after the cancel file was written.
+    If it has not exited after `grace_seconds`, e.g. while it writes a large
+    result, its process group is killed.
+    """
+
+    def __init__(self, cancel_file: str, grace_seconds: float):
+        """
+        - param cancel_file: file written before the child is interrupted
+        - param grace_seconds: time the child gets to write its incumbent
+        """
+        self.cancel_file = cancel_file
+        self.grace_seconds = grace_seconds
+        self.requested = False
+        self._pid = None
+        self._timer = None
+
+    def cancel(self):
+        """Request the cancellation and interrupt a running child."""
+        if self.requested:
+            return
+
+        self.requested = True
+        with open(self.cancel_file, "wt"):
+            pass
+        if self._pid is not None:
+            self._interrupt()
+
+    def attach(self, pid: int):
+        """Register the started child, interrupt it if already cancelled."""
+        self._pid = pid
+        if self.requested:
+            self._interrupt()
+
+    def detach(self):
+        """Forget the exited child and stop the grace period."""
+        self._pid = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _interrupt(self):
+        try:
+            os.kill(self._pid, signal.SIGINT)
+        except ProcessLookupError:
+            return
+
+        self._timer = threading.Timer(self.grace_seconds, _kill_process_group, (self._pid,))
+        self._timer.daemon = True
+        self._timer.start()
+
+
+def _kill_process_group(pgid: int):
+    """Kill what is left of the process group of a child."""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _prepare_child(limits: SolveLimits):
+    """Apply the resource limits in the forked child before it executes."""
+    if limits.memory_mb:
+        address_space = limits.memory_mb * 1024**2
+        resource.setrlimit(resource.RLIMIT_AS, (address_space, address_space))
+
+    if limits.cpu_seconds:
+        resource.setrlimit(
+            resource.RLIMIT_CPU,
+            (limits.cpu_seconds, limits.cpu_seconds + _CPU_GRACE_SECONDS),
+        )
+
+    # never outlive the worker process, e.g. after a task was terminated
+    try:
+        ctypes.CDLL(None, use_errno=True).prctl(_PR_SET_PDEATHSIG, signal.SIGKILL)
+    except (AttributeError, OSError):
+        pass
+
+
+def _exit_error(returncode: int, limits: SolveLimits, peak_memory_mb: int) -> str:
+    """Describe why a child without an outcome file ended."""
+    if returncode == -signal.SIGKILL:
+        return (
+            f"The solve process was killed at a peak memory of {peak_memory_mb} MB, "
+            "most likely it ran out of memory."
+        )
+
+    if returncode == -signal.SIGXCPU:
+        return f"The solve process exceeded the CPU time limit of {limits.cpu_seconds} s."
+
+    if returncode < 0:
+        return f"The solve process was terminated by {signal.Signals(-returncode).name}."
+
+    return f"The solve process failed with exit code {returncode}."
+
+
+def run_isolated(
+    job: BaseModel,
+    workdir: str,
+    limits: SolveLimits,
+    cancellation: SolveCancellation | None = None,
+    entry: str = __name__,
+) -> SolveOutcome:
+    """Build, solve and dump the energy system of `job` in a child process.
+
+    - param job: input of the child process with a `cancel_file` field, a
+      SolveJob unless `entry` is given
+    - param workdir: folder for the job and outcome file
+    - param limits: resource limits of the child
+    - param cancellation: cancellation of the solve or None
+    - param entry: module run by the child, reading the job with `run_child`
+    - returns: SolveOutcome including the peak memory of the child; a
+      cancelled solve is returned with `cancelled` set instead of raising
+    - raises: SolveProcessError if the child failed or was killed
+    """
+    if cancellation is not None and cancellation.requested:
+        return SolveOutcome(cancelled=True, error=_CANCELLED_ERROR)
+
+    job_file = os.path.join(workdir, "solve_job.json")
+    outcome_file = os.path.join(workdir, "solve_outcome.json")
+    tmp_dir = os.path.join(workdir, "tmp")
+
+    if cancellation is not None:
+        job = job.model_copy(update={"cancel_file": cancellation.cancel_file})
+    with open(job_file, "wt") as f:
+        f.write(job.model_dump_json())
+    if os.path.exists(outcome_file):
+        os.remove(outcome_file)
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", entry, job_file],
+        preexec_fn=functools.partial(_prepare_child, limits),
+        # solver and pool processes of the child share its process group
+        start_new_session=True,
+        env={**os.environ, "TMPDIR": tmp_dir},
+    )
+    if cancellation is not None:
+        cancellation.attach(process.pid)
+    try:
+        _, wait_status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(wait_status)
+    finally:
+        if cancellation is not None:
+            cancellation.detach()
+        if process.returncode is None:
+            process.kill()
+            process.wait()
+        _kill_process_group(process.pid)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if job.cancel_file is not None and os.path.exists(job.cancel_file):
+            os.remove(job.cancel_file)
+
+    # ru_maxrss is reported in KB on Linux
+    peak_memory_mb = round(rusage.ru_maxrss / 1024)
+
+    outcome = SolveOutcome()
+    if os.path.exists(outcome_file):
+        with open(outcome_file, "rt") as f:
+            outcome = SolveOutcome.model_validate_json(f.read())
+    outcome.peak_memory_mb = peak_memory_mb
+
+    if cancellation is not None and cancellation.requested:
+        outcome.cancelled = True
+        if process.returncode != 0 and outcome.error is None:
+            outcome.error = _CANCELLED_ERROR
+        return outcome
+
+    if process.returncode != 0 or outcome.error is not None:
+        raise SolveProcessError(
+            outcome.error or _exit_error(process.returncode, limits, peak_memory_mb),
+            outcome,
+        )
+
+    return outcome
+
+
+def write_results(oemof_es, job: SolveJob, timer: StageTimer, logger: logging.Logger):
+    """Write the result store and, if requested, the pickled dump.
+
+    - param oemof_es: solved energy system with processed results
+    - param job: input of the solve
+    - param timer: stage timer of the solve
+    - param logger: logger of the solve process
+    """
+    from ..results.store import DUMP_FILE, write_result_store
+
+    logger.info("write results")
+    with timer.stage("dump"):
+        write_result_store(oemof_es, job.dump_path)
+        if job.keep_dump:
+            oemof_es.dump(dpath=job.dump_path, filename=DUMP_FILE)
+
+
+def load_energysystem(job: SolveJob, timer: StageTimer, logger: logging.Logger):
+    """Read the converted energy system of `job` and presolve it if requested.
+
+    - param job: input of the solve
+    - param timer: stage timer of the solve
+    - param logger: logger of the solve process
+    - returns: EnEnergysystem the model of the job is built from
+    """
+    from ensys.common.presolve import presolve
+    from .snapshot import read_converted_model
+
+    with timer.stage("load"):
+        energysystem = read_converted_model(job.converted_model).energysystem
+
+    # the scenario constraints refer to components by label
+    if job.presolve and not job.constraints:
+        with timer.stage("presolve"):
+            energysystem, report = presolve(energysystem)
+        logger.info(f"presolve: {report}")
+
+    return energysystem
+
+
+def build_model(job: SolveJob, energysystem, timer: StageTimer, logger: logging.Logger) -> tuple:
+    """Build the oemof energy system and the optimization model of `job`.
+
+    - param job: input of the solve, without rolling horizon
+    - param energysystem: EnEnergysystem returned by `load_energysystem`
+    - param timer: stage timer of the solve
+    - param logger: logger of the solve process
+    - returns: oemof energy system and constructed oemof model
+    """
+    from .pipeline import create_oemof_energysystem, create_oemof_model
+
+    with timer.stage("to_oemof"):
+        oemof_es = create_oemof_energysystem(
+            energysystem=energysystem,
+            start_date=job.start_date,
+            time_steps=job.time_steps,
+            interval=job.interval,
+            aggregation=job.aggregation,
+        )
+
+    logger.info("create simulation model")
+    with timer.stage("build"):
+        oemof_model = create_oemof_model(
+            oemof_es=oemof_es, constraints=job.constraints, logger=logger
+        )
+
+    return oemof_es, oemof_model
+
+
+def _cancelled(job: BaseModel) -> bool:
+    """Return True if the parent cancelled the solve of `job`."""
+    return job.cancel_file is not None and os.path.exists(job.cancel_file)
+
+
+def solve_job(job: SolveJob, timer: StageTimer, logger: logging.Logger) -> SolveOutcome:
+    """Build, solve and dump the energy system of `job` in this process.
+
+    - param job: input of the solve
+    - param timer: stage timer, filled as far as the solve got if it raises
+    - param logger: logger of the solve process
+    - returns: SolveOutcome with the stage durations
+    """
+    # imported here, the parent only needs the models of this module
+    from .pipeline import collect_results
+    from .rolling import solve_rolling_horizon
+    from ensys.common.solver import SolverStoppedError, solution_gap, solve_model
+    from .warmstart import apply_warm_start, load_solution
+
+    energysystem = load_energysystem(job, timer, logger)
+
+    if job.rolling_horizon is not None:
+        oemof_es = solve_rolling_horizon(
+            energysystem=energysystem,
+            start_date=job.start_date,
+            time_steps=job.time_steps,
+            interval=job.interval,
+            constraints=job.constraints,
+            solver=job.solver,
+            cmdline_options=job.cmdline_options,
+            settings=job.rolling_horizon,
+            timer=timer,
+            logger=logger,
+            cancel_file=job.cancel_file,
+        )
+
+        write_results(oemof_es, job, timer, logger)
+
+        meta = oemof_es.results["meta"]
+        return SolveOutcome(
+            durations=timer.durations,
+            # the last window was interrupted and kept its incumbent
+            cancelled=_cancelled(job),
+            partial=_cancelled(job),
+            limit_reached=meta["limit_reached"],
+            gap=meta["gap"],
+        )
+
+    oemof_es, oemof_model = build_model(job, energysystem, timer, logger)
+
+    warm_started = False
+    if job.warm_start_dump is not None:
+        with timer.stage("warm_start"):
+            # a missing or unreadable previous solution only means a cold start
+            try:
+                assigned, assigned_integer = apply_warm_start(
+                    oemof_model, load_solution(job.warm_start_dump)
+                )
+                logger.info(f"warm start: {assigned} variables, {assigned_integer} integer")
+                warm_started = assigned_integer > 0
+            except Exception as ex:
+                logger.warning(f"warm start skipped: {ex}")
+
+    logger.info(f"solve optimization model with {job.solver}")
+    partial = False
+    limit_reached = False
+    with timer.stage("solve"):
+        try:
+            solver_results = solve_model(
+                oemof_model,
+                solver=job.solver,
+                solve_kwargs={"warmstart": True} if warm_started else {},
+                cmdline_options=job.cmdline_options,
+            )
+        except SolverStoppedError as stopped:
+            if _cancelled(job):
+                logger.warning(f"solve cancelled, keep the incumbent with a gap of {stopped.gap}")
+                partial = True
+            elif stopped.limit_reached:
+                logger.warning(f"solve limit reached, keep the incumbent with a gap of {stopped.gap}")
+                limit_reached = True
+            else:
+                raise
+            solver_results = stopped.solver_results
+
+    logger.info("collect results")
+    with timer.stage("results"):
+        collect_results(oemof_es, oemof_model, job.constraints)
+
+    write_results(oemof_es, job, timer, logger)
+
+    return SolveOutcome(
+        durations=timer.durations,
+        warm_started=warm_started,
+        cancelled=_cancelled(job),
+        partial=partial,
+        limit_reached=limit_reached,
+        gap=solution_gap(solver_results),
+    )
+
+
+def run_child(
+    job_file: str,
+    job_type: type[BaseModel],
+    solve: Callable[[BaseModel, StageTimer, logging.Logger], SolveOutcome],
+) -> int:
+    """Run `solve` on the job of a child process and write its outcome.
+
+    Errors are written to the outcome file, a MemoryError names the memory
+    limit of the child.
+
+    - param job_file: path of the job file written by `run_isolated`
+    - param job_type: model of the job, with `log_file` and `cancel_file`
+    - param solve: solve of the job returning its outcome
+    - returns: exit code
+    """
+    with open(job_file, "rt") as f:
+        job = job_type.model_validate_json(f.read())
+
+    logging.basicConfig(
+        filename=job.log_file,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger("ensys.solve")
+    timer = StageTimer()
+
+    try:
+        outcome = solve(job, timer, logger)
+        exit_code = 0
+    except KeyboardInterrupt:
+        logger.warning("solve cancelled")
+        outcome = SolveOutcome(durations=timer.durations, cancelled=True, error=_CANCELLED_ERROR)
+        exit_code = _EXIT_FAILED
+    except MemoryError:
+        limit = resource.getrlimit(resource.RLIMIT_AS)[0]
+        error = "The solve process ran out of memory"
+        if limit != resource.RLIM_INFINITY:
+            error += f" (limit {limit // 1024**2} MB)"
+        outcome = SolveOutcome(durations=timer.durations, error=f"{error}.")
+        exit_code = _EXIT_FAILED
+    except KeyError as key_error:
+        outcome = SolveOutcome(
+            durations=timer.durations,
+            error=f"It appeared a KeyError for the Key {key_error}.",
+        )
+        exit_code = _EXIT_FAILED
+    except Exception as ex:
+        error = str(ex)
+        if _cancelled(job):
+            # e.g. the solver was interrupted before it found a feasible solution
+            logger.warning(f"solve cancelled: {ex}")
+            error = _CANCELLED_ERROR
+        else:
+            logger.critical(f"solve failed: {ex}")
+        outcome = SolveOutcome(durations=timer.durations, cancelled=_cancelled(job), error=error)
+        exit_code = _EXIT_FAILED
+
+    with open(os.path.join(os.path.dirname(job_file), "solve_outcome.json"), "wt") as f:
+        f.write(outcome.model_dump_json())
+
+    return exit_code
+
+
+def main(job_file: str) -> int:
+    """Entry point of the child process.
+
+    - param job_file: path of the job file written by `run_isolated`
+    - returns: exit code
+    """
+    return run_child(job_file, SolveJob, solve_job)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1]))
@@ -5,16 +5,24 @@ from enum import Enum
 
 from pydantic import BaseModel
 from sqladmin import ModelView
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
 class Status(Enum):
-    """Lifecycle states for simulations (started/finished/failed/stopped)."""
+    """Lifecycle states for simulations (started/finished/failed/stopped/queued).
+
+    LIMIT_REACHED finished on the time or gap limit of the scenario with the
+    best solution found; its gap is stored with the simulation.
+    """
 
     STARTED = 1
     FINISHED = 2
     FAILED = 3
     STOPPED = 4
+    QUEUED = 5
+    LIMIT_REACHED = 6
 
 
 class EnSimulation(BaseModel):
@@ -36,8 +44,22 @@ class EnSimulationDB(SQLModel, table=True):
     status: int = Field(default=Status.STARTED.value)
     status_message: str | None = Field(default=None)
     scenario_id: int = Field(foreign_key="scenarios.id")
+    user_id: int | None = Field(default=None, foreign_key="users.id", index=True)
+    queue: str | None = Field(default=None)
     start_date: datetime = Field(default_factory=datetime.now)
     end_date: datetime | None = Field(default=None)
+    # handed to celery by the scheduler
+    dispatch_date: datetime | None = Field(default=None)
+    fingerprint: str | None = Field(default=None, index=True)
+    result_token: str | None = Field(default=None)
+    stage_timings: dict | None = Field(sa_column=Column(JSONB), default=None)
+    peak_memory_mb: int | None = Field(default=None)
+    # a stopped simulation kept the best solution found so far; gap of the
+    # stored solution, e.g. of a simulation that reached its limit
+    partial: bool = Field(default=False)
+    gap: float | None = Field(default=None)
+    sweep_id: int | None = Field(default=None, foreign_key="sweeps.id", index=True)
+    variant: dict | None = Field(sa_column=Column(JSONB), default=None)
 
     class Config:
         arbitrary_types_allowed = True
@@ -49,8 +71,19 @@ class EnSimulationDB(SQLModel, table=True):
         dump_data["end_date"] = (
             datetime.timestamp(self.end_date) if self.end_date else None
         )
+        dump_data["dispatch_date"] = (
+            datetime.timestamp(self.dispatch_date) if self.dispatch_date else None
+        )
         return dump_data
 
+    def get_result_token(self) -> str:
+        """Return the token of the folder holding this simulation's results.
+
+        Simulations answered from the result cache link to the folder of the
+        run that produced the results instead of owning one themselves.
+        """
+        return self.result_token if self.result_token else self.sim_token
+
     def model_update(self, obj: dict) -> SQLModel:
         """Wrapper around SQLModel update with type hints."""
         return super().model_update(obj)
@@ -70,8 +103,19 @@ class SimulationAdmin(ModelView, model=EnSimulationDB):
         "status",
         "status_message",
         "scenario_id",
+        "user_id",
+        "queue",
         "start_date",
-        "end_date"
+        "end_date",
+        "dispatch_date",
+        "fingerprint",
+        "result_token",
+        "stage_timings",
+        "peak_memory_mb",
+        "partial",
+        "gap",
+        "sweep_id",
+        "variant",
     ]
     name = "Simulation (EnSimulationDB)"
     icon = "fa-solid fa-calculator"
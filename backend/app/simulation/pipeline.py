@@ -0,0 +1,131 @@
+"""
+Simulation Pipeline Module
+========================
+
+This module contains the building blocks of a simulation run which are shared
+between the simulation task and auxiliary tasks (e.g. the LP export) that have
+to rebuild the optimization model from a stored converted model.
+
+The module provides:
+    - Parsing of scenario constraints
+    - Creation of the oemof energy system from an `EnEnergysystem`, optionally
+      aggregated to typical periods
+    - Creation of the oemof model including scenario constraints
+    - Collection of the results of a solved model
+"""
+
+import json
+import logging
+from datetime import datetime
+
+from oemof import solph
+
+from ensys.components import EnEnergysystem
+from .aggregation import aggregate_energysystem
+from ..scenario.model import EnAggregationSettings, EnScenarioDB
+
+
+def load_constraints(scenario: EnScenarioDB) -> list[dict] | None:
+    """Return the parsed constraints of a scenario or None if unset."""
+    if scenario.constraints is None or scenario.constraints == "":
+        return None
+
+    if isinstance(scenario.constraints, str):
+        return json.loads(scenario.constraints)
+
+    return scenario.constraints
+
+
+def create_oemof_energysystem(
+    energysystem: EnEnergysystem,
+    start_date: datetime,
+    time_steps: int,
+    interval: float,
+    aggregation: EnAggregationSettings | None = None,
+) -> solph.EnergySystem:
+    """Create an oemof energy system with all components of `energysystem`.
+
+    With `aggregation` the profiles are reduced to typical periods and the
+    energy system is created in the TSAM mode of oemof.solph, which expands
+    the results to the full time index again.
+
+    - param energysystem: converted energy system
+    - param start_date: first time step
+    - param time_steps: number of time steps
+    - param interval: length of a time step in hours
+    - param aggregation: typical period settings or None for full resolution
+    - returns: populated solph.EnergySystem
+    """
+    tsa_parameters = None
+    if aggregation is not None:
+        energysystem, tsa_parameters = aggregate_energysystem(
+            energysystem, time_steps, interval, aggregation
+        )
+        time_steps = tsa_parameters["timesteps_per_period"] * (max(tsa_parameters["order"]) + 1)
+
+    timeindex = solph.create_time_index(
+        start=start_date,
+        number=time_steps,
+        interval=interval,
+    )
+
+    oemof_es: solph.EnergySystem = solph.EnergySystem(
+        timeindex=timeindex,
+        infer_last_interval=False,
+        tsa_parameters=tsa_parameters,
+    )
+
+    return energysystem.to_oemof(oemof_es)
+
+
+def create_oemof_model(
+    oemof_es: solph.EnergySystem,
+    constraints: list[dict] | None,
+    logger: logging.Logger,
+) -> solph.Model:
+    """Create the optimization model and add the enabled scenario constraints.
+
+    - param oemof_es: populated oemof energy system
+    - param constraints: parsed scenario constraints or None
+    - param logger: logger for unsupported constraint warnings
+    - returns: solph.Model ready to be solved
+    """
+    oemof_model = solph.Model(oemof_es)
+
+    if constraints is not None:
+        for constraint in constraints:
+            logger.info(f"Constraint {constraint}")
+
+            if constraint["enabled"]:
+                if constraint["type"] == "emission_limit":
+                    solph.constraints.emission_limit(
+                        om=oemof_model,
+                        limit=float(constraint["values"]["limit"]),
+                    )
+                # elif weitere constraints
+                else:
+                    logger.warning(f"Constraint type {constraint['type']} not recognized or implemented.")
+
+    return oemof_model
+
+
+def collect_results(
+    oemof_es: solph.EnergySystem,
+    oemof_model: solph.Model,
+    constraints: list[dict] | None,
+):
+    """Store the results of a solved model in the energy system for dumping.
+
+    - param oemof_es: energy system of the model
+    - param oemof_model: solved model
+    - param constraints: parsed scenario constraints or None
+    """
+    oemof_es.results["main"] = solph.processing.results(oemof_model)
+    oemof_es.results["meta"] = solph.processing.meta_results(oemof_model)
+
+    # Todo: Bei mehreren Constraints ist das hier eine Falle!
+
+    if constraints is not None:
+        for single_constraint in constraints:
+            if single_constraint["type"] == "emission_limit" and single_constraint["enabled"]:
+                oemof_es.results["emissions"] = oemof_model.integral_limit_emission_factor()
@@ -0,0 +1,196 @@
+"""
+Solver Progress Module
+====================
+
+This module follows the solver log of a running simulation and extracts the
+convergence information (presolve size, incumbent, best bound, MIP gap and
+elapsed time) from it. The parsed progress is handed to a callback, which
+publishes it as state of the celery task.
+
+The module provides:
+    - The structured progress model
+    - A line parser for Gurobi logs
+    - A background thread tailing the solver log
+"""
+
+import os
+import re
+import threading
+from typing import Callable
+
+from pydantic import BaseModel, Field
+
+_FLOAT = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+_PRESOLVED = re.compile(
+    r"^Presolved:\s+(\d+)\s+rows,\s+(\d+)\s+columns,\s+(\d+)\s+nonzeros"
+)
+# MIP node log: ... Incumbent BestBd Gap | It/Node Time
+_NODE_LINE = re.compile(
+    rf"(?P<incumbent>{_FLOAT}|-)\s+(?P<bound>{_FLOAT})\s+(?P<gap>{_FLOAT}%|-)\s+\S+\s+(?P<time>\d+)s$"
+)
+_BEST_OBJECTIVE = re.compile(
+    rf"^Best objective\s+(?P<incumbent>{_FLOAT}|-),\s+best bound\s+(?P<bound>{_FLOAT}|-),\s+gap\s+(?P<gap>{_FLOAT}%|-)"
+)
+_OPTIMAL_OBJECTIVE = re.compile(rf"^Optimal objective\s+(?P<objective>{_FLOAT})")
+_EXPLORED = re.compile(rf"^Explored .* in (?P<time>{_FLOAT}) seconds")
+_SOLVED = re.compile(rf"^Solved in .* and (?P<time>{_FLOAT}) seconds")
+# Simplex/barrier iteration log: ... Time as last column
+_ITERATION_LINE = re.compile(r"^\s*\d+\s+.*\s(?P<time>\d+)s$")
+
+
+class SolverProgress(BaseModel):
+    """Convergence information of a running solver.
+
+    - fields: phase, presolve size, incumbent, best_bound, gap (relative), elapsed (s)
+    """
+
+    phase: str = Field(default="starting")
+    presolve_rows: int | None = Field(default=None)
+    presolve_columns: int | None = Field(default=None)
+    presolve_nonzeros: int | None = Field(default=None)
+    incumbent: float | None = Field(default=None)
+    best_bound: float | None = Field(default=None)
+    gap: float | None = Field(default=None)
+    elapsed: float | None = Field(default=None)
+
+
+def _to_float(value: str) -> float | None:
+    """Convert a log value to float, mapping '-' to None."""
+    if value == "-":
+        return None
+    if value.endswith("%"):
+        return float(value[:-1]) / 100
+
+    return float(value)
+
+
+def parse_gurobi_line(line: str, progress: SolverProgress) -> bool:
+    """Update `progress` with the information of a single Gurobi log line.
+
+    - param line: log line without trailing newline
+    - param progress: progress object to update in place
+    - returns: True if the line changed the progress
+    """
+    line = line.strip()
+
+    if match := _PRESOLVED.match(line):
+        progress.phase = "presolved"
+        progress.presolve_rows = int(match.group(1))
+        progress.presolve_columns = int(match.group(2))
+        progress.presolve_nonzeros = int(match.group(3))
+        return True
+
+    if match := _BEST_OBJECTIVE.match(line):
+        progress.phase = "finished"
+        progress.incumbent = _to_float(match.group("incumbent"))
+        progress.best_bound = _to_float(match.group("bound"))
+        progress.gap = _to_float(match.group("gap"))
+        return True
+
+    if match := _OPTIMAL_OBJECTIVE.match(line):
+        progress.phase = "finished"
+        progress.incumbent = float(match.group("objective"))
+        progress.best_bound = progress.incumbent
+        progress.gap = 0.0
+        return True
+
+    if match := _EXPLORED.match(line) or _SOLVED.match(line):
+        progress.elapsed = float(match.group("time"))
+        return True
+
+    if match := _NODE_LINE.search(line):
+        progress.phase = "branch_and_bound"
+        progress.incumbent = _to_float(match.group("incumbent"))
+        progress.best_bound = _to_float(match.group("bound"))
+        progress.gap = _to_float(match.group("gap"))
+        progress.elapsed = float(match.group("time"))
+        return True
+
+    if match := _ITERATION_LINE.match(line):
+        if progress.phase in ("starting", "presolved"):
+            progress.phase = "solving"
+        progress.elapsed = float(match.group("time"))
+        return True
+
+    return False
+
+
+class SolverLogTailer(threading.Thread):
+    """Background thread reading a solver log incrementally while it grows.
+
+    - param logfile: path of the solver log
+    - param publish: callback receiving the updated `SolverProgress`
+    - param parse_line: line parser, defaults to the Gurobi parser
+    - param interval: seconds between polls (and minimum publish interval)
+    """
+
+    def __init__(
+        self,
+        logfile: str,
+        publish: Callable[[SolverProgress], None],
+        parse_line: Callable[[str, SolverProgress], bool] = parse_gurobi_line,
+        interval: float = 2.0,
+    ):
+        super().__init__(daemon=True, name="solver-log-tailer")
+        self.logfile = logfile
+        self.publish = publish
+        self.parse_line = parse_line
+        self.interval = interval
+        self.progress = SolverProgress()
+
+        self._position = 0
+        self._buffer = ""
+        self._stop_event = threading.Event()
+
+    def read_new_lines(self) -> bool:
+        """Parse all complete lines appended since the last call.
+
+        - returns: True if the progress changed
+        """
+        if not os.path.isfile(self.logfile):
+            return False
+
+        with open(self.logfile, "rt", errors="replace") as log:
+            log.seek(self._position)
+            chunk = log.read()
+            self._position = log.tell()
+
+        if not chunk:
+            return False
+
+        lines = (self._buffer + chunk).split("\n")
+        # keep an incomplete last line for the next poll
+        self._buffer = lines.pop()
+
+        changed = False
+        for line in lines:
+            changed = self.parse_line(line, self.progress) or changed
+
+        return changed
+
+    def run(self):
+        """Poll the log file until `stop` is called."""
+        while not self._stop_event.wait(self.interval):
+            if self.read_new_lines():
+                self.publish(self.progress)
+
+    def stop(self) -> SolverProgress:
+        """Stop polling, parse the remaining log and publish a final time.
+
+        - returns: the final progress
+        """
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+        changed = self.read_new_lines()
+        if self._buffer:
+            changed = self.parse_line(self._buffer, self.progress) or changed
+            self._buffer = ""
+
+        if changed:
+            self.publish(self.progress)
+
+        return self.progress
+
@@ -0,0 +1,395 @@
+"""
+Rolling Horizon Module
+====================
+
+This module solves long dispatch-only scenarios (e.g. a year in quarter-hourly
+resolution) as a sequence of overlapping windows instead of one monolithic
+model. Every window optimizes `window_hours` plus `overlap_hours` of look-ahead,
+but only the first `window_hours` are kept; the storage levels at the end of
+the kept part are the initial levels of the next window. Storages the user
+marked balanced end the last window at the level the horizon started with.
+
+Without storages the windows are independent of each other and can be solved
+on a pool of processes. The sequences of all windows are stitched onto an
+energy system over the full horizon, so its results are stored and read like
+the results of a monolithic run.
+
+The time limit of the scenario applies to the whole horizon: every window gets
+its share of the remaining time. A window stopped at its limit keeps its best
+solution like a monolithic solve, and a cancelled solve stops before the next
+window.
+
+The module provides:
+    - Validation that a scenario can be split (no investments, no constraints
+      or full load times over the whole horizon)
+    - Slicing of an `EnEnergysystem` to a window
+    - The window solve and the stitching of the window results
+"""
+
+import copy
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+from oemof import solph
+from pydantic import BaseModel
+
+from ensys.common.solver import SOLVER_OPTION_NAMES, SolverStoppedError, solution_gap, solve_model
+from ensys.components import EnEnergysystem, EnFlow, EnInvestment
+from .aggregation import find_profiles
+from .pipeline import collect_results, create_oemof_energysystem, create_oemof_model
+from .timing import StageTimer
+from ..scenario.model import EnRollingHorizonSettings
+
+Labels = tuple[str, str | None]
+
+# Parameter names of the time limit of all solvers.
+_TIME_LIMIT_OPTIONS = {names["timelimit"] for names in SOLVER_OPTION_NAMES.values()}
+# Shortest time limit of a window, a window without time can not find a solution.
+_MIN_WINDOW_SECONDS = 1.0
+
+
+def window_steps(interval: float, settings: EnRollingHorizonSettings) -> tuple[int, int]:
+    """Return the kept and the overlapping time steps of a window."""
+    return max(1, round(settings.window_hours / interval)), round(settings.overlap_hours / interval)
+
+
+def window_options(cmdline_options: dict, seconds: float | None) -> dict:
+    """Return the solver options of a window with its share of the time limit.
+
+    - param cmdline_options: solver options of the whole horizon
+    - param seconds: time limit of the window or None to keep the options
+    - returns: solver options with the time limit of the window
+    """
+    if seconds is None:
+        return cmdline_options
+
+    return {
+        key: max(seconds, _MIN_WINDOW_SECONDS) if key in _TIME_LIMIT_OPTIONS else value
+        for key, value in cmdline_options.items()
+    }
+
+
+def horizon_time_limit(cmdline_options: dict) -> float | None:
+    """Return the time limit of the solver options or None if unlimited."""
+    for key in _TIME_LIMIT_OPTIONS & cmdline_options.keys():
+        return float(cmdline_options[key])
+
+    return None
+
+
+def _contains(node, cls) -> bool:
+    """Return True if an instance of `cls` is found below `node`."""
+    if isinstance(node, cls):
+        return True
+    if isinstance(node, BaseModel):
+        return any(_contains(getattr(node, name), cls) for name in type(node).model_fields)
+    if isinstance(node, dict):
+        return any(_contains(value, cls) for value in node.values())
+    if isinstance(node, list):
+        return any(_contains(value, cls) for value in node)
+
+    return False
+
+
+def _flows(energysystem: EnEnergysystem) -> list[EnFlow]:
+    """Return the flows of all components of `energysystem`."""
+    components = [
+        *energysystem.sources,
+        *energysystem.sinks,
+        *energysystem.converters,
+        *energysystem.generic_storages,
+    ]
+
+    return [
+        flow
+        for component in components
+        for flows in (getattr(component, "inputs", None), getattr(component, "outputs", None))
+        for flow in (flows or {}).values()
+    ]
+
+
+def check_rolling_horizon(energysystem: EnEnergysystem, constraints: list[dict] | None):
+    """Raise ValueError if the scenario can not be solved window by window.
+
+    - param energysystem: converted energy system
+    - param constraints: parsed scenario constraints or None
+    - raises: ValueError for investments, full load times or constraints over
+      the whole horizon
+    """
+    if _contains(energysystem, EnInvestment):
+        raise ValueError("Rolling horizon requires a dispatch-only scenario without investments.")
+
+    # annual energy budgets would apply to every window
+    if any(
+        flow.full_load_time_max is not None or flow.full_load_time_min is not None
+        for flow in _flows(energysystem)
+    ):
+        raise ValueError("Rolling horizon does not support full load times over the whole horizon.")
+
+    if any(constraint["enabled"] for constraint in constraints or []):
+        raise ValueError("Rolling horizon does not support constraints over the whole horizon.")
+
+
+def slice_energysystem(
+    energysystem: EnEnergysystem,
+    time_steps: int,
+    start: int,
+    length: int,
+    storage_levels: dict[str, float] | None = None,
+    keep_balanced: bool = False,
+) -> EnEnergysystem:
+    """Return a copy of `energysystem` restricted to a window.
+
+    - param energysystem: converted energy system over the full horizon
+    - param time_steps: number of time steps of the full horizon
+    - param start: first time step of the window
+    - param length: number of time steps of the window
+    - param storage_levels: relative initial storage levels by label
+    - param keep_balanced: keep the balanced setting of the storages, for a
+      window over the whole horizon
+    - returns: energy system with all profiles cut to the window
+    """
+    window = copy.deepcopy(energysystem)
+
+    for container, key in find_profiles(window, time_steps):
+        if isinstance(container, BaseModel):
+            setattr(container, key, getattr(container, key)[start:start + length])
+        else:
+            container[key] = container[key][start:start + length]
+
+    for storage in window.generic_storages:
+        # the end of a window is no end of the horizon, the last window of
+        # several is balanced by `solve_window` against the start of the horizon
+        storage.balanced = storage.balanced and keep_balanced
+        if storage_levels is not None and storage.label in storage_levels:
+            storage.initial_storage_level = storage_levels[storage.label]
+
+    return window
+
+
+def solve_window(
+    window: EnEnergysystem,
+    start_date: datetime,
+    length: int,
+    kept: int,
+    interval: float,
+    solver: str,
+    cmdline_options: dict,
+    final_levels: dict[str, float] | None = None,
+    cancel_file: str | None = None,
+) -> tuple[dict[Labels, dict], dict, dict[str, float]]:
+    """Solve a single window.
+
+    A window stopped at its time limit or by a cancellation keeps its best
+    solution; the meta results tell whether the limit was reached and the gap.
+
+    - param window: energy system sliced to the window
+    - param start_date: first time step of the window
+    - param length: number of time steps of the window
+    - param kept: number of time steps kept from this window
+    - param interval: length of a time step in hours
+    - param solver: solver name
+    - param cmdline_options: solver options
+    - param final_levels: relative storage levels by label the window has to
+      end with, e.g. the initial levels of balanced storages in the last window
+    - param cancel_file: file whose existence tells that the solve was cancelled
+    - returns: results keyed by labels, meta results and the relative storage
+      levels after the kept time steps
+    - raises: RuntimeError if the solve was cancelled before the window
+    """
+    if cancel_file is not None and os.path.exists(cancel_file):
+        raise RuntimeError(f"The solve was cancelled before the window starting at {start_date}.")
+
+    oemof_es = create_oemof_energysystem(window, start_date, length, interval)
+    oemof_model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    capacities = {storage.label: storage.nominal_storage_capacity for storage in window.generic_storages}
+    for label, level in (final_levels or {}).items():
+        oemof_model.GenericStorageBlock.storage_content[
+            oemof_es.groups[label], oemof_model.TIMEPOINTS.at(-1)
+        ].fix(level * capacities[label])
+
+    limit_reached = False
+    try:
+        solver_results = solve_model(oemof_model, solver=solver, cmdline_options=cmdline_options)
+    except SolverStoppedError as stopped:
+        cancelled = cancel_file is not None and os.path.exists(cancel_file)
+        if not (cancelled or stopped.limit_reached):
+            raise
+        limit_reached = stopped.limit_reached
+        solver_results = stopped.solver_results
+    collect_results(oemof_es, oemof_model, None)
+    oemof_es.results["meta"]["limit_reached"] = limit_reached
+    oemof_es.results["meta"]["gap"] = solution_gap(solver_results)
+
+    results = solph.processing.convert_keys_to_strings(
+        oemof_es.results["main"], keep_none_type=True
+    )
+
+    storage_levels = {}
+    for storage in window.generic_storages:
+        if storage.nominal_storage_capacity:
+            content = results[(storage.label, None)]["sequences"]["storage_content"].iloc[kept]
+            storage_levels[storage.label] = float(content) / storage.nominal_storage_capacity
+
+    return results, oemof_es.results["meta"], storage_levels
+
+
+def stitch_results(
+    oemof_es: solph.EnergySystem,
+    window_results: list[dict[Labels, dict]],
+    kept_steps: list[int],
+) -> dict:
+    """Combine the kept parts of the window results over the full horizon.
+
+    - param oemof_es: energy system over the full horizon
+    - param window_results: results of the windows keyed by labels
+    - param kept_steps: kept time steps of each window
+    - returns: results keyed by the nodes of `oemof_es`
+    """
+    nodes = {str(node.label): node for node in oemof_es.nodes}
+    stitched = {}
+
+    for labels in window_results[0]:
+        parts = [
+            # the last window also keeps the final time point
+            results[labels]["sequences"].iloc[: kept + 1 if index == len(window_results) - 1 else kept]
+            for index, (results, kept) in enumerate(zip(window_results, kept_steps))
+        ]
+        sequences = pd.concat(parts)
+        sequences.index = oemof_es.timeindex[: len(sequences)]
+
+        key = tuple(nodes[label] if label is not None else None for label in labels)
+        stitched[key] = {
+            "sequences": sequences,
+            "scalars": window_results[0][labels]["scalars"],
+        }
+
+    return stitched
+
+
+def solve_rolling_horizon(
+    energysystem: EnEnergysystem,
+    start_date: datetime,
+    time_steps: int,
+    interval: float,
+    constraints: list[dict] | None,
+    solver: str,
+    cmdline_options: dict,
+    settings: EnRollingHorizonSettings,
+    timer: StageTimer,
+    logger: logging.Logger,
+    cancel_file: str | None = None,
+) -> solph.EnergySystem:
+    """Solve a scenario window by window and return the stitched energy system.
+
+    The meta results hold the meta results of every window, whether a window
+    reached its limit and the largest gap of the windows.
+
+    - param energysystem: converted energy system over the full horizon
+    - param start_date: first time step
+    - param time_steps: number of time steps of the full horizon
+    - param interval: length of a time step in hours
+    - param constraints: parsed scenario constraints or None
+    - param solver: solver name
+    - param cmdline_options: solver options
+    - param settings: rolling horizon settings of the scenario
+    - param timer: stage timer of the solve
+    - param logger: logger of the solve process
+    - param cancel_file: file whose existence tells that the solve was cancelled
+    - returns: energy system over the full horizon with stitched results
+    """
+    check_rolling_horizon(energysystem, constraints)
+    kept_per_window, overlap = window_steps(interval, settings)
+
+    starts = list(range(0, time_steps, kept_per_window))
+    kept_steps = [min(kept_per_window, time_steps - start) for start in starts]
+    lengths = [min(kept_per_window + overlap, time_steps - start) for start in starts]
+
+    time_limit = horizon_time_limit(cmdline_options)
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+
+    def window_args(
+        index: int,
+        storage_levels: dict[str, float] | None,
+        final_levels: dict[str, float] | None = None,
+        seconds: float | None = None,
+    ) -> tuple:
+        start = starts[index]
+        return (
+            slice_energysystem(
+                energysystem, time_steps, start, lengths[index], storage_levels, keep_balanced=len(starts) == 1
+            ),
+            start_date + timedelta(hours=start * interval),
+            lengths[index],
+            kept_steps[index],
+            interval,
+            solver,
+            window_options(cmdline_options, seconds),
+            final_levels,
+            cancel_file,
+        )
+
+    logger.info(f"rolling horizon with {len(starts)} windows of {kept_per_window}+{overlap} steps")
+
+    capacities = {storage.label: storage.nominal_storage_capacity for storage in energysystem.generic_storages}
+    window_results = []
+    window_meta = []
+    with timer.stage("solve"):
+        if not energysystem.generic_storages and settings.parallel_windows > 1:
+            # without storages nothing is carried from one window to the next;
+            # the windows run in rounds of `parallel_windows`
+            rounds = math.ceil(len(starts) / settings.parallel_windows)
+            seconds = time_limit / rounds if time_limit is not None else None
+            with ProcessPoolExecutor(max_workers=settings.parallel_windows) as pool:
+                solved = list(
+                    pool.map(solve_window, *zip(*(window_args(i, None, None, seconds) for i in range(len(starts)))))
+                )
+            for results, meta, _ in solved:
+                window_results.append(results)
+                window_meta.append(meta)
+        else:
+            storage_levels = None
+            # relative levels of the balanced storages at the start of the horizon
+            initial_levels = {
+                storage.label: storage.initial_storage_level
+                for storage in energysystem.generic_storages
+                if storage.balanced
+            }
+            for index in range(len(starts)):
+                final_levels = initial_levels if index == len(starts) - 1 and index > 0 else None
+                # the remaining time is shared by the remaining windows
+                seconds = (
+                    (deadline - time.monotonic()) / (len(starts) - index) if deadline is not None else None
+                )
+                results, meta, storage_levels = solve_window(
+                    *window_args(index, storage_levels, final_levels, seconds)
+                )
+                if index == 0:
+                    for label, level in initial_levels.items():
+                        if level is None:
+                            content = results[(label, None)]["sequences"]["storage_content"].iloc[0]
+                            initial_levels[label] = float(content) / capacities[label]
+                window_results.append(results)
+                window_meta.append(meta)
+                logger.info(f"window {index + 1}/{len(starts)} solved")
+
+    with timer.stage("results"):
+        oemof_es = create_oemof_energysystem(energysystem, start_date, time_steps, interval)
+        oemof_es.results = {
+            "main": stitch_results(oemof_es, window_results, kept_steps),
+            # the window objectives include the overlaps, so there is no total
+            "meta": {
+                "objective": None,
+                "windows": window_meta,
+                "limit_reached": any(meta["limit_reached"] for meta in window_meta),
+                "gap": max((meta["gap"] for meta in window_meta if meta["gap"] is not None), default=None),
+            },
+        }
+
+    return oemof_es
@@ -5,10 +5,12 @@ Simulation Router Module
 This module provides API endpoints for managing energy system simulations,
 including starting, stopping, and monitoring simulation tasks.
 """
+import os
 import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
 from sqlmodel import Session
 from starlette import status
 
@@ -17,9 +19,13 @@ from .service import (
     stop_simulation,
     delete_simulation,
     read_simulation_status,
+    read_simulation_progress,
+    read_simulation_admission,
     read_scenario_simulations,
     read_simulation,
     create_and_start_simulation,
+    request_lp_export,
+    read_lp_export_path,
 )
 from ..db import get_db_session
 from ..models.base import GeneralDataModel
@@ -36,7 +42,7 @@ async def start_simulation_endpoint(
     token: Annotated[str, Depends(oauth2_scheme)],
     db=Depends(get_db_session),
 ) -> MessageResponse:
-    """Start a simulation for the scenario and launch its task.
+    """Queue a simulation for the scenario; the scheduler launches its task.
 
     - param scenario_id: scenario id to simulate
     - param token: bearer token from OAuth2
@@ -49,8 +55,14 @@ async def start_simulation_endpoint(
         scenario_id=scenario_id, db=db, user=user, simulation_token=str(uuid.uuid4())
     )
 
+    if task_id is None:
+        return MessageResponse(
+            data=f"Simulation with id:{sim_id} finished from cached results.",
+            success=True,
+        )
+
     return MessageResponse(
-        data=f"Simulation with id:{sim_id} and task id:{task_id} started.",
+        data=f"Simulation with id:{sim_id} and task id:{task_id} queued.",
         success=True,
     )
 
@@ -76,6 +88,53 @@ async def get_simulation_status_endpoint(
     )
 
 
+@simulation_router.get("/progress/{simulation_id}", response_model=DataResponse)
+async def get_simulation_progress_endpoint(
+    simulation_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """Return the live solver progress of a running simulation.
+
+    - param simulation_id: simulation id to check
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with the parsed progress (empty if none yet)
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    progress = read_simulation_progress(simulation_id=simulation_id, user=user, db=db)
+    items = [progress] if progress is not None else []
+
+    return DataResponse(
+        data=GeneralDataModel(items=items, totalCount=len(items)),
+        success=True,
+    )
+
+
+@simulation_router.get("/estimate/{scenario_id}", response_model=DataResponse)
+async def get_simulation_estimate_endpoint(
+    scenario_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """Return the estimated model size and admission decision for a scenario.
+
+    - param scenario_id: scenario id to estimate
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with the estimate, admission and target queue
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    admission = read_simulation_admission(scenario_id=scenario_id, user=user, db=db)
+
+    return DataResponse(
+        data=GeneralDataModel(items=[admission], totalCount=1),
+        success=True,
+    )
+
+
 @simulation_router.post("s/stop/{scenario_id}", response_model=MessageResponse)
 async def stop_simulations_endpoint(
     scenario_id: int,
@@ -173,6 +232,63 @@ async def get_simulation_endpoint(
     )
 
 
+@simulation_router.post("/{simulation_id}/lp", response_model=MessageResponse)
+async def request_lp_export_endpoint(
+    simulation_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> MessageResponse:
+    """Schedule the compressed LP export of a finished simulation.
+
+    - param simulation_id: simulation id to export
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: MessageResponse whether the export exists or was scheduled
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    if request_lp_export(simulation_id=simulation_id, user=user, db=db):
+        return MessageResponse(
+            data=f"LP export for simulation {simulation_id} is available.",
+            success=True,
+        )
+
+    return MessageResponse(
+        data=f"LP export for simulation {simulation_id} scheduled.", success=True
+    )
+
+
+@simulation_router.get("/{simulation_id}/lp")
+async def get_lp_export_endpoint(
+    simulation_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> FileResponse:
+    """Download the gzip compressed LP file of a simulation.
+
+    - param simulation_id: simulation id to download the LP file for
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: FileResponse with the compressed LP file
+    - raises: HTTPException 404 if no export exists
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    simulation = read_simulation(simulation_id=simulation_id, user=user, db=db)
+    lp_file = read_lp_export_path(simulation)
+
+    if not os.path.isfile(lp_file):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="LP export not found."
+        )
+
+    return FileResponse(
+        lp_file,
+        media_type="application/gzip",
+        filename=f"simulation_{simulation_id}.lp.gz",
+    )
+
+
 @simulation_router.delete("/{simulation_id}")
 async def delete_simulation_endpoint(
     simulation_id: int,
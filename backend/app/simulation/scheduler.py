@@ -0,0 +1,277 @@
+"""
+Simulation Scheduler Module
+=========================
+
+This module sits in front of `start_task`. New simulations are stored as
+QUEUED and only handed to Celery when their queue has a free worker slot, so
+the order of execution is decided here and not by the FIFO of the broker.
+
+Jobs are classified by their estimated model size into a small and a large
+queue, which are served by separate workers; interactive small models thus
+never wait behind batch runs. Within a queue, free slots go to the user with the fewest running
+simulations (oldest job first), which dispatches round-robin across users.
+
+Sweeps are not queued here, their chunks run on the large queue as soon as the
+sweep starts. The chunks of running sweeps are counted as running jobs of the
+large queue and of the owner of the sweep, so a sweep takes its share of the
+slots and of the per-user limit.
+
+A simulation keeps its slot until its task has ended and set the final
+status, also when it was cancelled. Simulations whose task ended without
+doing so (e.g. it crashed before it could update the row, or its worker was
+killed or restarted) are reaped periodically, comparing the rows with the
+state of their celery task and their age.
+
+The module provides:
+    - Size classification into the small and large queue
+    - Selection of the next simulation (fair share across users)
+    - Counting the running chunks of sweeps
+    - Detection of running simulations whose task no longer runs
+    - The scheduler enforcing per-user running and queued limits
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Callable
+
+from celery import states
+from fastapi import HTTPException
+from sqlalchemy import func, text
+from sqlmodel import Session, select
+from starlette import status
+
+from ..scenario.model import EnScenarioDB
+from ..sweep.model import EnSweepDB
+from .estimator import ModelEstimate
+from .model import EnSimulationDB, Status
+
+SMALL_QUEUE = "small"
+LARGE_QUEUE = "large"
+
+# Key of the postgres advisory lock serializing concurrent dispatchers.
+_DISPATCH_LOCK = 7_311_042
+
+
+def classify_queue(estimate: ModelEstimate, small_max_size: int, deferred: bool = False) -> str:
+    """Return the queue for a scenario of the estimated size.
+
+    - param estimate: predicted model size of the scenario
+    - param small_max_size: upper bound of variables + constraints for small jobs
+    - param deferred: admission deferred the scenario to the large queue
+    - returns: SMALL_QUEUE or LARGE_QUEUE
+    """
+    if not deferred and estimate.variables + estimate.constraints < small_max_size:
+        return SMALL_QUEUE
+
+    return LARGE_QUEUE
+
+
+def select_next(
+    queued: list[EnSimulationDB],
+    running_per_user: Counter,
+    max_running_per_user: int,
+) -> EnSimulationDB | None:
+    """Pick the next simulation to start from a queue.
+
+    - param queued: queued simulations ordered from oldest to newest
+    - param running_per_user: number of running simulations per user id
+    - param max_running_per_user: concurrent run limit per user
+    - returns: oldest simulation of the user with the fewest running jobs
+    """
+    selected = None
+
+    for simulation in queued:
+        running = running_per_user[simulation.user_id]
+        if running >= max_running_per_user:
+            continue
+
+        if selected is None or running < running_per_user[selected.user_id]:
+            selected = simulation
+
+    return selected
+
+
+def running_sweep_chunks(sweeps: list[tuple[int, int, int]]) -> Counter:
+    """Count the running sweep chunks per user.
+
+    A sweep runs `max_parallel` chunks until fewer variants are left than
+    chunks, each variant is solved by one chunk.
+
+    - param sweeps: user id, max_parallel and number of unfinished variants
+      of each running sweep
+    - returns: number of running chunks per user id
+    """
+    chunks = Counter()
+
+    for user_id, max_parallel, unfinished in sweeps:
+        chunks[user_id] += min(max_parallel, unfinished)
+
+    return chunks
+
+
+def find_stale(
+    running: list[EnSimulationDB],
+    task_state: Callable[[str], str],
+    now: datetime,
+    max_age_seconds: float = 0,
+) -> list[EnSimulationDB]:
+    """Return the running simulations whose task no longer runs.
+
+    - param running: simulations in the STARTED state
+    - param task_state: celery state of the task with the given id
+    - param now: current time
+    - param max_age_seconds: time since the dispatch after which a running
+      simulation is stale regardless of its task state, e.g. when the task
+      was lost with its worker (0 = no age limit)
+    - returns: simulations whose task ended or which exceeded the age
+    """
+    stale = []
+
+    for simulation in running:
+        dispatched = simulation.dispatch_date or simulation.start_date
+        too_old = max_age_seconds and (now - dispatched).total_seconds() > max_age_seconds
+        if too_old or task_state(simulation.sim_token) in states.READY_STATES:
+            stale.append(simulation)
+
+    return stale
+
+
+class SimulationScheduler:
+    """Fair-share dispatcher for queued simulations.
+
+    - param slots: worker slots per queue name
+    - param max_running_per_user: concurrent run limit per user
+    - param max_queued_per_user: limit of waiting simulations per user
+    """
+
+    def __init__(
+        self,
+        slots: dict[str, int],
+        max_running_per_user: int,
+        max_queued_per_user: int,
+    ):
+        self.slots = slots
+        self.max_running_per_user = max_running_per_user
+        self.max_queued_per_user = max_queued_per_user
+
+    def check_queue_limit(self, user_id: int, db: Session):
+        """Raise HTTP 429 if the user already has too many queued simulations."""
+        queued = db.exec(
+            select(func.count(EnSimulationDB.id))
+            .where(EnSimulationDB.user_id == user_id)
+            .where(EnSimulationDB.status == Status.QUEUED.value)
+        ).one()
+
+        if queued >= self.max_queued_per_user:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many queued simulations (limit {self.max_queued_per_user}).",
+            )
+
+    def reap(
+        self,
+        db: Session,
+        task_state: Callable[[str], str],
+        max_age_seconds: float = 0,
+    ) -> list[EnSimulationDB]:
+        """Finish the running simulations whose task no longer runs.
+
+        Simulations whose task was revoked before it started are stopped, the
+        others failed.
+
+        - param db: SQLModel session, committed by this method
+        - param task_state: celery state of the task with the given id
+        - param max_age_seconds: see `find_stale`
+        - returns: list of reaped simulations
+        """
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _DISPATCH_LOCK})
+
+        running = db.exec(
+            select(EnSimulationDB)
+            .where(EnSimulationDB.status == Status.STARTED.value)
+            .where(EnSimulationDB.sweep_id.is_(None))
+        ).all()
+
+        now = datetime.now()
+        stale = find_stale(running, task_state, now, max_age_seconds)
+        for simulation in stale:
+            if task_state(simulation.sim_token) == states.REVOKED:
+                simulation.status = Status.STOPPED.value
+                simulation.status_message = "Simulation was canceled by user request."
+            else:
+                simulation.status = Status.FAILED.value
+                simulation.status_message = (
+                    "The simulation task ended without a result, "
+                    "e.g. its worker ran out of memory or was restarted."
+                )
+            simulation.end_date = now
+
+        db.commit()
+
+        return stale
+
+    def dispatch(
+        self, db: Session, start: Callable[[EnSimulationDB], object]
+    ) -> list[EnSimulationDB]:
+        """Start queued simulations while their queue has free slots.
+
+        - param db: SQLModel session, committed by this method
+        - param start: callable enqueuing the celery task of a simulation
+        - returns: list of started simulations
+        """
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _DISPATCH_LOCK})
+
+        # sweep variants are scheduled by their sweep
+        running = db.exec(
+            select(EnSimulationDB)
+            .where(EnSimulationDB.status == Status.STARTED.value)
+            .where(EnSimulationDB.sweep_id.is_(None))
+        ).all()
+        queued = list(
+            db.exec(
+                select(EnSimulationDB)
+                .where(EnSimulationDB.status == Status.QUEUED.value)
+                .order_by(EnSimulationDB.start_date, EnSimulationDB.id)
+            ).all()
+        )
+
+        # unfinished variants of the running sweeps, by sweep
+        sweeps = db.exec(
+            select(EnScenarioDB.user_id, EnSweepDB.max_parallel, func.count(EnSimulationDB.id))
+            .join(EnSweepDB, EnSimulationDB.sweep_id == EnSweepDB.id)
+            .join(EnScenarioDB, EnSweepDB.scenario_id == EnScenarioDB.id)
+            .where(EnSweepDB.status == Status.STARTED.value)
+            .where(EnSimulationDB.status == Status.STARTED.value)
+            .group_by(EnSweepDB.id, EnScenarioDB.user_id, EnSweepDB.max_parallel)
+        ).all()
+        sweep_chunks = running_sweep_chunks(sweeps)
+
+        running_per_user = Counter(simulation.user_id for simulation in running) + sweep_chunks
+        running_per_queue = Counter(simulation.queue for simulation in running)
+        # sweep chunks are routed to the large queue
+        running_per_queue[LARGE_QUEUE] += sweep_chunks.total()
+
+        dispatched = []
+        for queue, slots in self.slots.items():
+            candidates = [simulation for simulation in queued if simulation.queue == queue]
+
+            while running_per_queue[queue] < slots:
+                simulation = select_next(
+                    candidates, running_per_user, self.max_running_per_user
+                )
+                if simulation is None:
+                    break
+
+                candidates.remove(simulation)
+                simulation.status = Status.STARTED.value
+                simulation.dispatch_date = datetime.now()
+                running_per_queue[queue] += 1
+                running_per_user[simulation.user_id] += 1
+                dispatched.append(simulation)
+
+        db.commit()
+
+        for simulation in dispatched:
+            start(simulation)
+
+        return dispatched
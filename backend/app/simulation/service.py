@@ -9,6 +9,8 @@ It handles the business logic for simulation operations including:
 - Simulation data management
 """
 
+import json
+import os
 from datetime import datetime
 
 from fastapi import HTTPException
@@ -17,10 +19,126 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from starlette import status
 
+from .aggregation import aggregated_time_steps
+from .artifacts import enforce_quota
+from .diagnostics import lp_export_path
+from .estimator import ModelEstimate, SimulationAdmission, admit, estimate_energysystem
+from .fingerprint import find_cached_simulation, scenario_fingerprint
 from .model import EnSimulationDB, Status
-from ..celery import start_task, celery_app
+from .pipeline import load_constraints
+from .progress import SolverProgress
+from .rolling import check_rolling_horizon, window_steps
+from .scheduler import classify_queue
+from ..auxillary import convert_gui_json_to_ensys
+from ..celery import celery_app, dispatch_simulations, lp_export_task, scheduler
+from ..core.config import get_settings
+from ..scenario.model import DiagnosticsLevel, EnScenarioDB
 from ..user.model import EnUserDB
 
+_settings = get_settings()
+
+
+def estimate_scenario(scenario: EnScenarioDB) -> SimulationAdmission:
+    """Estimate the model size of a scenario and decide on its admission.
+
+    Scenarios which can not be converted are not admitted, the reason names
+    the error.
+
+    - param scenario: scenario to estimate
+    - returns: SimulationAdmission including the queue the simulation would use
+    """
+    time_steps = scenario.time_steps
+    try:
+        simulation_settings = scenario.get_simulation_settings()
+        energysystem = convert_gui_json_to_ensys(
+            flowchart_data=json.loads(scenario.modeling_data or "{}")
+        )
+
+        if simulation_settings.aggregation is not None:
+            time_steps = aggregated_time_steps(
+                time_steps, scenario.interval, simulation_settings.aggregation
+            )
+        if simulation_settings.rolling_horizon is not None:
+            check_rolling_horizon(energysystem, load_constraints(scenario))
+            # only one window is built at a time
+            time_steps = min(
+                time_steps,
+                sum(window_steps(scenario.interval, simulation_settings.rolling_horizon)),
+            )
+    except ValueError as ex:
+        return SimulationAdmission(
+            estimate=ModelEstimate(), admitted=False, reason=str(ex)
+        )
+    # the conversion raises plain exceptions and KeyErrors for bad GUI data
+    except Exception as ex:
+        logger.info(f"Scenario {scenario.id} can not be converted: {ex!r}")
+        return SimulationAdmission(
+            estimate=ModelEstimate(),
+            admitted=False,
+            reason=f"The scenario can not be converted: {ex!r}",
+        )
+
+    estimate = estimate_energysystem(energysystem, time_steps=time_steps)
+
+    admission = admit(
+        estimate,
+        max_memory_mb=_settings.admission_max_memory_mb,
+        max_integer_variables=_settings.admission_max_integer_variables,
+    )
+    if admission.admitted:
+        admission.queue = classify_queue(
+            estimate,
+            small_max_size=_settings.scheduler_small_max_size,
+            deferred=admission.deferred,
+        )
+
+    return admission
+
+
+def read_simulation_admission(
+    scenario_id: int, user: EnUserDB, db: Session
+) -> SimulationAdmission:
+    """Return the size estimate and admission decision for a scenario.
+
+    - param scenario_id: scenario to estimate
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: SimulationAdmission
+    - raises: HTTPException 401/404 on auth or missing scenario
+    """
+    if not user.check_user_rights(scenario_id=scenario_id, db=db):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authorized.")
+
+    scenario = db.get(EnScenarioDB, scenario_id)
+    if scenario is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Scenario not found.")
+
+    return estimate_scenario(scenario)
+
+
+def check_disk_quota(user: EnUserDB, db: Session):
+    """Reject a new simulation if the folders of the user exceed the quota.
+
+    Heavy files of superseded runs are evicted first.
+
+    - param user: authenticated user
+    - param db: SQLModel session
+    - raises: HTTPException 507 if the user is still above the quota
+    """
+    quota_mb = _settings.artifacts_user_quota_mb
+    if not quota_mb:
+        return
+
+    usage = enforce_quota(_settings.local_datadir, db, user.id, quota_mb)
+    if usage > quota_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+            detail=(
+                f"Your simulations use {usage // (1024 * 1024)} MB of {quota_mb} MB. "
+                "Delete old scenarios or simulations to start new ones."
+            ),
+        )
+
 
 def create_and_start_simulation(
     user: EnUserDB,
@@ -28,28 +146,61 @@ def create_and_start_simulation(
     scenario_id: int,
     simulation_token: str,
 ) -> tuple[int | None, str | None]:
-    """Create a simulation entry and enqueue the celery task.
+    """Create a simulation entry and queue it for the scheduler.
+
+    When a finished simulation with the same input fingerprint exists, the new
+    simulation is finished immediately and linked to the existing results
+    instead of enqueuing a task.
 
     - param user: authenticated user
     - param scenario_id: scenario to simulate
     - param simulation_token: optional token (auto-generated)
     - param db: SQLModel session
-    - returns: tuple of simulation id and celery task id
-    - raises: HTTPException 401/409 on auth or db errors
+    - returns: tuple of simulation id and celery task id (None if cached)
+    - raises: HTTPException 401/409 on auth or db errors, 409 if the model
+      exceeds the worker budget, 429 if the user has too many queued
+      simulations, 507 if the user exceeds the disk quota
     """
     if not user.check_user_rights(scenario_id=scenario_id, db=db):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authorized.")
 
     stop_simulations_for_scenario(scenario_id=scenario_id, user=user, db=db)
 
+    scenario = db.get(EnScenarioDB, scenario_id)
+    fingerprint = scenario_fingerprint(scenario)
+    cached_simulation = find_cached_simulation(
+        fingerprint=fingerprint, datadir=_settings.local_datadir, db=db
+    )
+
     # Create new simulation
     simulation = EnSimulationDB(
         sim_token=simulation_token,
+        status=Status.QUEUED.value,
         start_date=datetime.now(),
         end_date=None,
         scenario_id=scenario_id,
+        user_id=user.id,
+        fingerprint=fingerprint,
     )
 
+    if cached_simulation is not None:
+        simulation.status = Status.FINISHED.value
+        simulation.status_message = (
+            f"Results reused from simulation {cached_simulation.id}."
+        )
+        simulation.result_token = cached_simulation.get_result_token()
+        simulation.end_date = datetime.now()
+    else:
+        scheduler.check_queue_limit(user_id=user.id, db=db)
+        check_disk_quota(user=user, db=db)
+
+        admission = estimate_scenario(scenario)
+        if not admission.admitted:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=admission.reason
+            )
+        simulation.queue = admission.queue
+
     db.add(simulation)
     try:
         db.commit()
@@ -62,10 +213,15 @@ def create_and_start_simulation(
 
     db.refresh(simulation)
 
-    task = start_task(simulation=simulation)
-    logger.info("Task UUID:", task.id)
+    if cached_simulation is not None:
+        logger.info(f"Simulation {simulation.id} reused results of {cached_simulation.id}")
+        return simulation.id, None
+
+    dispatch_simulations()
+    logger.info(f"Simulation {simulation.id} queued in {simulation.queue}")
 
-    return simulation.id, task.id
+    # the celery task id is the simulation token
+    return simulation.id, simulation.sim_token
 
 
 def read_simulation_status(simulation_id: int, user: EnUserDB, db: Session) -> int:
@@ -74,6 +230,25 @@ def read_simulation_status(simulation_id: int, user: EnUserDB, db: Session) -> i
     return read_simulation(simulation_id=simulation_id, user=user, db=db).status
 
 
+def read_simulation_progress(
+    simulation_id: int, user: EnUserDB, db: Session
+) -> SolverProgress | None:
+    """Return the solver progress published by a running simulation task.
+
+    - param simulation_id: simulation to inspect
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: SolverProgress or None if no progress was published yet
+    """
+    simulation = read_simulation(simulation_id=simulation_id, user=user, db=db)
+    task_result = celery_app.AsyncResult(simulation.sim_token)
+
+    if task_result.state != "PROGRESS" or not isinstance(task_result.info, dict):
+        return None
+
+    return SolverProgress(**task_result.info)
+
+
 def read_simulation(
     simulation_id: int,
     user: EnUserDB,
@@ -106,8 +281,11 @@ def read_scenario_simulations(
 ) -> list[EnSimulationDB]:
     """List simulations for a scenario if the user is authorized."""
     if user.check_user_rights(scenario_id=scenario_id, db=db):
-        statement = select(EnSimulationDB).where(
-            EnSimulationDB.scenario_id == scenario_id
+        # variants of parameter sweeps are listed with their sweep
+        statement = (
+            select(EnSimulationDB)
+            .where(EnSimulationDB.scenario_id == scenario_id)
+            .where(EnSimulationDB.sweep_id.is_(None))
         )
 
         return list(db.exec(statement).all())
@@ -120,13 +298,22 @@ def stop_simulation(
     user: EnUserDB,
     db: Session,
 ) -> EnSimulationDB:
-    """Cancel a running simulation and mark it stopped."""
+    """Cancel a simulation.
+
+    A queued simulation is stopped right away. A running task receives
+    SIGUSR1, interrupts its solver and keeps the best solution found so far
+    as partial result. Its simulation stays STARTED, and thereby keeps its
+    worker slot, until the task has ended and marked it stopped.
+    """
     simulation = read_simulation(simulation_id=simulation_id, user=user, db=db)
 
-    celery_app.control.revoke(task_id=simulation.sim_token, terminate=True)
-    simulation.status = Status.STOPPED.value
-    simulation.status_message = "Simulation was canceled by user request."
-    simulation.end_date = datetime.now()
+    celery_app.control.revoke(task_id=simulation.sim_token, terminate=True, signal="SIGUSR1")
+    if simulation.status == Status.STARTED.value:
+        simulation.status_message = "Cancellation was requested by the user."
+    else:
+        simulation.status = Status.STOPPED.value
+        simulation.status_message = "Simulation was canceled by user request."
+        simulation.end_date = datetime.now()
 
     try:
         db.commit()
@@ -157,7 +344,7 @@ def stop_simulations_for_scenario(
 
     if simulations is not None:
         for simulation in simulations:
-            if simulation.status is Status.STARTED.value:
+            if simulation.status in (Status.STARTED.value, Status.QUEUED.value):
                 stop_simulation(simulation_id=simulation.id, user=user, db=db)
                 
             try:
@@ -173,6 +360,56 @@ def stop_simulations_for_scenario(
     return simulations
 
 
+def request_lp_export(simulation_id: int, user: EnUserDB, db: Session) -> bool:
+    """Schedule the LP export of a finished simulation if not yet available.
+
+    - param simulation_id: simulation to export
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: True if the export already exists, False if it was scheduled
+    - raises: HTTPException 409 if the simulation is not finished, solved
+      window by window or the scenario disabled diagnostics
+    """
+    simulation = read_simulation(simulation_id=simulation_id, user=user, db=db)
+    scenario = db.get(EnScenarioDB, simulation.scenario_id)
+
+    if simulation.status not in (Status.FINISHED.value, Status.LIMIT_REACHED.value):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Simulation has not finished."
+        )
+
+    if simulation.sweep_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="LP export is not available for sweep variants.",
+        )
+
+    simulation_settings = scenario.get_simulation_settings()
+    if simulation_settings.rolling_horizon is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="LP export is not available for rolling horizon scenarios.",
+        )
+
+    if simulation_settings.diagnostics_level is DiagnosticsLevel.NONE:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="LP export is disabled for this scenario.",
+        )
+
+    if os.path.isfile(read_lp_export_path(simulation)):
+        return True
+
+    lp_export_task.delay(simulation.id)
+
+    return False
+
+
+def read_lp_export_path(simulation: EnSimulationDB) -> str:
+    """Return the path of the compressed LP export of a simulation."""
+    return lp_export_path(_settings.local_datadir, simulation.get_result_token())
+
+
 def delete_simulation(simulation_id: int, user: EnUserDB, db: Session) -> bool:
     """Delete a simulation if the user is authorized.
 
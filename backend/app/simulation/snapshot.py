@@ -0,0 +1,215 @@
+"""
+Input Snapshot Module
+===================
+
+This module writes the inputs of a run, the GUI modeling data and the
+converted `EnModel`, in a compact form next to its results and restores them
+for reruns and debugging.
+
+The profiles of both documents, lists of at least `MIN_SERIES_LENGTH`
+numbers, are stored once as binary float64 array; identical profiles of the
+modeling data and the converted model share their values. The documents
+themselves keep a compact JSON skeleton referencing the profiles:
+
+    <run folder>/snapshot/
+        modeling_data.json
+        converted_model.json
+        series.npy
+
+A reference `{"$series": [offset, length]}` restores a list of floats,
+`{"$int_series": [offset, length]}` a list of integers. GUI profiles often
+mix both (e.g. `0` next to `0.25`); `{"$mixed_series": [offset, length,
+runs]}` stores them as floats with the alternating lengths of the float and
+integer runs, starting with floats. The restored documents equal the written
+ones.
+
+The module provides:
+    - Writing the snapshot of a run
+    - Restoring the modeling data and the converted model, including the
+      JSON files of runs written before the snapshot was introduced
+"""
+
+import json
+import os
+
+import numpy as np
+
+from ensys.components import EnModel
+from .artifacts import open_artifact
+
+SNAPSHOT_FOLDER = "snapshot"
+MODELING_DATA_FILE = "modeling_data.json"
+CONVERTED_MODEL_FILE = "converted_model.json"
+SERIES_FILE = "series.npy"
+# Shorter lists stay in the skeleton.
+MIN_SERIES_LENGTH = 24
+
+_FLOAT_SERIES = "$series"
+_INT_SERIES = "$int_series"
+_MIXED_SERIES = "$mixed_series"
+# Integers above are not exact as float64.
+_MAX_EXACT_INT = 2**53
+
+
+def _exact_ints(value: list) -> bool:
+    """Return True if the integers of `value` are exact as float64."""
+    return all(-_MAX_EXACT_INT < item < _MAX_EXACT_INT for item in value if type(item) is int)
+
+
+def _int_runs(value: list) -> list[int]:
+    """Return the alternating lengths of float and integer runs of `value`."""
+    runs = []
+    kind = float
+    length = 0
+    for item in value:
+        if type(item) is not kind:
+            runs.append(length)
+            kind = type(item)
+            length = 0
+        length += 1
+    runs.append(length)
+
+    return runs
+
+
+class _SeriesWriter:
+    """Collects the profiles of the documents, each distinct profile once."""
+
+    def __init__(self):
+        self.arrays: list[np.ndarray] = []
+        self.offsets: dict[bytes, int] = {}
+        self.length = 0
+
+    def add(self, array: np.ndarray) -> list[int]:
+        key = array.tobytes()
+        if key not in self.offsets:
+            self.offsets[key] = self.length
+            self.arrays.append(array)
+            self.length += len(array)
+
+        return [self.offsets[key], len(array)]
+
+    def skeleton(self, value):
+        """Return `value` with its profiles replaced by references."""
+        if isinstance(value, dict):
+            return {key: self.skeleton(item) for key, item in value.items()}
+
+        if isinstance(value, list):
+            if len(value) >= MIN_SERIES_LENGTH:
+                kinds = {type(item) for item in value}
+                if kinds == {float}:
+                    return {_FLOAT_SERIES: self.add(np.array(value, dtype=np.float64))}
+                if kinds == {int} and _exact_ints(value):
+                    return {_INT_SERIES: self.add(np.array(value, dtype=np.float64))}
+                if kinds == {int, float} and _exact_ints(value):
+                    return {_MIXED_SERIES: [*self.add(np.array(value, dtype=np.float64)), _int_runs(value)]}
+
+            return [self.skeleton(item) for item in value]
+
+        return value
+
+
+def _restore(value, series: np.ndarray, arrays: bool = False):
+    """Return `value` with its references replaced by the profiles.
+
+    With `arrays`, float profiles are restored as read-only views of
+    `series` instead of lists.
+    """
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if _FLOAT_SERIES in value:
+                offset, length = value[_FLOAT_SERIES]
+                profile = series[offset:offset + length]
+                return profile if arrays else profile.tolist()
+            if _INT_SERIES in value:
+                offset, length = value[_INT_SERIES]
+                return series[offset:offset + length].astype(np.int64).tolist()
+            if _MIXED_SERIES in value:
+                offset, length, runs = value[_MIXED_SERIES]
+                profile = series[offset:offset + length].tolist()
+                start = 0
+                for index, run in enumerate(runs):
+                    # odd runs hold the integers
+                    if index % 2:
+                        profile[start:start + run] = [int(item) for item in profile[start:start + run]]
+                    start += run
+                return profile
+
+        return {key: _restore(item, series, arrays) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_restore(item, series, arrays) for item in value]
+
+    return value
+
+
+def write_snapshot(folder: str, modeling_data: dict, model: EnModel) -> str:
+    """Write the input snapshot of a run.
+
+    - param folder: simulation or sweep folder
+    - param modeling_data: GUI modeling data of the scenario
+    - param model: converted model of the run
+    - returns: folder of the written snapshot
+    """
+    path = os.path.join(folder, SNAPSHOT_FOLDER)
+    os.makedirs(path, exist_ok=True)
+
+    writer = _SeriesWriter()
+    documents = {
+        MODELING_DATA_FILE: writer.skeleton(modeling_data),
+        CONVERTED_MODEL_FILE: writer.skeleton(model.model_dump(mode="json")),
+    }
+
+    series = np.concatenate(writer.arrays) if writer.arrays else np.empty(0, dtype=np.float64)
+    np.save(os.path.join(path, SERIES_FILE), series)
+    for name, document in documents.items():
+        with open(os.path.join(path, name), "wt") as f:
+            f.write(json.dumps(document, separators=(",", ":")))
+
+    return path
+
+
+def has_snapshot(folder: str) -> bool:
+    """Return True if the run folder holds an input snapshot."""
+    return os.path.isfile(os.path.join(folder, SNAPSHOT_FOLDER, SERIES_FILE))
+
+
+def _read_document(folder: str, name: str, arrays: bool = False):
+    path = os.path.join(folder, SNAPSHOT_FOLDER)
+    with open_artifact(os.path.join(path, name)) as f:
+        skeleton = json.loads(f.read())
+
+    return _restore(skeleton, np.load(os.path.join(path, SERIES_FILE), mmap_mode="r"), arrays)
+
+
+def read_modeling_data(folder: str) -> dict:
+    """Return the GUI modeling data of a run folder.
+
+    - param folder: simulation or sweep folder
+    - returns: modeling data as written by `write_snapshot`
+    - raises: FileNotFoundError if the folder holds no modeling data
+    """
+    if has_snapshot(folder):
+        return _read_document(folder, MODELING_DATA_FILE)
+
+    with open_artifact(os.path.join(folder, MODELING_DATA_FILE)) as f:
+        return json.loads(f.read())
+
+
+def read_converted_model(path: str) -> EnModel:
+    """Return the converted model of a run.
+
+    The model was validated before it was written, so it is constructed
+    without validation; its profiles are memory-mapped from the snapshot.
+
+    - param path: simulation or sweep folder, or a converted model JSON file
+    - returns: EnModel as written by `write_snapshot`
+    - raises: FileNotFoundError if there is no converted model
+    """
+    if os.path.isdir(path):
+        if has_snapshot(path):
+            return EnModel.construct_trusted(_read_document(path, CONVERTED_MODEL_FILE, arrays=True))
+        path = os.path.join(path, CONVERTED_MODEL_FILE)
+
+    with open_artifact(path) as f:
+        return EnModel.construct_trusted(json.loads(f.read()))
@@ -0,0 +1,162 @@
+"""
+Solver Interface Module
+=====================
+
+This module selects the pyomo interface a simulation is solved with and maps
+the solver options of a scenario onto it.
+
+The shell interface of Gurobi (`gurobi`) writes the model as LP file, lets
+Gurobi parse it and reads a solution file back. The in-memory interfaces
+(`gurobi_direct`, `gurobi_persistent`) pass the model to `gurobipy` without
+this text round-trip, which saves a large part of the build-to-solution time
+of big models. They need `gurobipy`, so the shell interface stays the fallback
+where it is not installed; workers report the interface of each solver when
+they start. HiGHS is always solved in memory (APPSI) and needs
+no license, so it runs on every worker.
+
+The scenario options (`solver_kwargs`, e.g. `MIP_GAP`, `threads` or
+`timelimit`) are normalized to the parameter names of the solver; the model is
+solved with `ensys.common.solver.solve_model`.
+
+The number of threads of a solve is taken from the thread budget of the
+worker, divided among the solves it runs at the same time.
+
+A solve that stopped at its time limit, or at a gap limit above the default
+tolerance of the solvers, ends with the best solution found and the gap it
+achieved instead of a proven optimum.
+
+The module provides:
+    - Selection of the in-memory interface of a solver
+    - The interfaces a worker solves with
+    - The thread share of a solve
+    - The log and scenario options of a solve
+    - Whether a solve ended on its time or gap limit
+"""
+
+import importlib.util
+import os
+
+from ensys.common.solver import normalize_solver_options, solver_available
+from ensys.common.types import Solver
+
+# Shell interfaces and their in-memory counterpart.
+IN_MEMORY_INTERFACES = {Solver.gurobi: Solver.gurobi_direct}
+
+GUROBI_INTERFACES = (Solver.gurobi, Solver.gurobi_direct, Solver.gurobi_persistent)
+
+# Solvers a scenario can select, reported with their interface on a worker.
+SCENARIO_SOLVERS = (Solver.gurobi, Solver.highs, Solver.cbc)
+
+# Relative MIP gap at which Gurobi and HiGHS stop by default.
+DEFAULT_MIP_GAP = 1e-4
+
+
+def gurobipy_available() -> bool:
+    """Return True if the Python API of Gurobi is installed."""
+    return importlib.util.find_spec("gurobipy") is not None
+
+
+def solver_interface(solver: Solver, in_memory: bool = True) -> Solver:
+    """Return the pyomo interface to solve with.
+
+    - param solver: solver selected in the scenario
+    - param in_memory: prefer the in-memory interface of the solver
+    - returns: the in-memory interface if requested and installed, else `solver`
+    """
+    if in_memory and solver in IN_MEMORY_INTERFACES and gurobipy_available():
+        return IN_MEMORY_INTERFACES[solver]
+
+    return solver
+
+
+def solver_interfaces(in_memory: bool = True) -> dict[str, str | None]:
+    """Return the interface each scenario solver is solved with on this worker.
+
+    - param in_memory: prefer the in-memory interfaces, see `solver_interface`
+    - returns: mapping of solver to its pyomo interface, None if the
+      interface can not be used here
+    """
+    interfaces = {}
+    for solver in SCENARIO_SOLVERS:
+        interface = solver_interface(solver, in_memory)
+        interfaces[solver.value] = interface.value if solver_available(interface) else None
+
+    return interfaces
+
+
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    return len(os.sched_getaffinity(0))
+
+
+def solver_threads(
+    requested: int | None, budget: int, concurrency: int, parallel: int = 1
+) -> int:
+    """Return the threads of a solve within the thread budget of the worker.
+
+    The budget is divided evenly among the solves the worker runs at the same
+    time, so concurrent solves do not oversubscribe the CPUs.
+
+    - param requested: threads requested by the scenario or None
+    - param budget: solver threads of the worker
+    - param concurrency: number of solves the worker runs at the same time
+    - param parallel: processes of this solve, e.g. parallel rolling horizon
+      windows
+    - returns: number of threads, at least 1
+    """
+    share = max(1, budget // (max(1, concurrency) * max(1, parallel)))
+    if requested is None:
+        return share
+
+    return min(requested, share)
+
+
+def solver_options(
+    solver: Solver,
+    log_file: str,
+    solver_kwargs: dict | None = None,
+    threads: int | None = None,
+) -> dict:
+    """Return the options passed to the solver interface.
+
+    - param solver: pyomo interface of the solve
+    - param log_file: path of the solver log
+    - param solver_kwargs: extra options of the scenario or None
+    - param threads: threads of the solve within the thread budget or None
+    - returns: log options of Gurobi and HiGHS and the scenario options with
+      the parameter names of the solver
+    """
+    solver_kwargs = dict(solver_kwargs or {})
+    if threads is not None:
+        solver_kwargs["threads"] = threads
+
+    if solver in GUROBI_INTERFACES:
+        options = {"LogFile": log_file, "LogToConsole": 0, "OutputFlag": 1}
+    elif solver == Solver.highs:
+        options = {"log_file": log_file, "log_to_console": False, "output_flag": True}
+        # the LP algorithm codes are Gurobi specific
+        solver_kwargs.pop("method", None)
+    else:
+        options = {}
+
+    return {**options, **normalize_solver_options(solver, solver_kwargs)}
+
+
+def reached_limit(stopped_at_limit: bool, gap: float | None, mip_gap: float | None) -> bool:
+    """Return True if a solve ended on its time or gap limit.
+
+    - param stopped_at_limit: the solver stopped at its time limit
+    - param gap: relative gap of the solution or None if unknown
+    - param mip_gap: gap limit of the scenario or None
+    - returns: True if the solution is not proven optimal within the default
+      tolerance of the solvers
+    """
+    if stopped_at_limit:
+        return True
+
+    return (
+        mip_gap is not None
+        and mip_gap > DEFAULT_MIP_GAP
+        and gap is not None
+        and gap > DEFAULT_MIP_GAP
+    )
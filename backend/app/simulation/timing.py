@@ -0,0 +1,120 @@
+"""
+Simulation Timing Module
+======================
+
+This module measures the duration of the individual stages of a simulation
+run (conversion, validation, model build, solve, ...). The durations are
+reported to Prometheus and kept in a dict which is persisted on the
+simulation record.
+
+The module provides:
+    - Size classification of scenarios for metric labels
+    - The queue wait of a simulation
+    - A stage timer used inside the simulation task
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from prometheus_client import Histogram
+
+from ensys.components import EnEnergysystem
+
+# Upper bounds for time_steps * component_count and the resulting size label.
+SIZE_BUCKETS = (
+    (50_000, "xs"),
+    (500_000, "s"),
+    (5_000_000, "m"),
+    (50_000_000, "l"),
+)
+
+
+def size_bucket(time_steps: int, component_count: int) -> str:
+    """Classify a scenario by the product of time steps and components.
+
+    - param time_steps: number of time steps of the scenario
+    - param component_count: number of nodes in the energy system, see
+      `node_count`
+    - returns: size label (xs, s, m, l, xl)
+    """
+    size = time_steps * component_count
+
+    for upper_bound, label in SIZE_BUCKETS:
+        if size < upper_bound:
+            return label
+
+    return "xl"
+
+
+def node_count(energysystem: EnEnergysystem) -> int:
+    """Return the number of busses and components of a converted energy system."""
+    return (
+        len(energysystem.busses)
+        + len(energysystem.sinks)
+        + len(energysystem.sources)
+        + len(energysystem.converters)
+        + len(energysystem.generic_storages)
+    )
+
+
+def queue_wait_seconds(enqueued: datetime, started: datetime) -> float:
+    """Return the time a simulation waited between its creation and its task.
+
+    - param enqueued: creation time of the simulation
+    - param started: start time of its task
+    - returns: seconds, never negative if the clocks of the API and the
+      worker differ
+    """
+    return max(0.0, (started - enqueued).total_seconds())
+
+
+class StageTimer:
+    """Collect stage durations of a simulation run and report them.
+
+    - param histogram: Prometheus histogram labelled by stage and size, or
+      None until `report` is called
+    - param size: size label of the simulated scenario
+    """
+
+    def __init__(self, histogram: Histogram | None = None, size: str = "unknown"):
+        self.histogram = histogram
+        self.size = size
+        self.durations: dict[str, float] = {}
+        # stages recorded before the histogram was known
+        self._pending: list[tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the wall time of the enclosed block as stage `name`.
+
+        The duration is recorded even if the block raises, so failed runs
+        still show where the time was spent.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self, histogram: Histogram, size: str):
+        """Report to `histogram` with the label `size` from now on.
+
+        Stages recorded before the size was known, e.g. the conversion the
+        size is taken from, are reported right away.
+        """
+        self.histogram = histogram
+        self.size = size
+
+        for name, duration in self._pending:
+            self.histogram.labels(stage=name, size=self.size).observe(duration)
+        self._pending.clear()
+
+    def record(self, name: str, duration: float):
+        """Add a measured duration in seconds for the stage `name`."""
+        self.durations[name] = round(self.durations.get(name, 0.0) + duration, 3)
+
+        if self.histogram is not None:
+            self.histogram.labels(stage=name, size=self.size).observe(duration)
+        else:
+            self._pending.append((name, duration))
@@ -0,0 +1,171 @@
+"""
+Simulation Warm Start Module
+==========================
+
+This module provides a MIP start for a new simulation from the stored solution
+of the last finished simulation of the same scenario. Scenarios are usually
+edited in small steps, so most variables of the previous solution still exist
+in the new model and give the solver an incumbent right from the start.
+
+Variables are matched by name and component labels: the processed oemof
+results use the pyomo variable names as columns (`flow`, `status`, `invest`,
+`storage_content`, ...) and are keyed by the nodes of the variable index.
+
+The module provides:
+    - Lookup of the previous finished simulation of a scenario
+    - Loading of the stored solution from its result store or dump
+    - Assignment of the solution to the variables of a new model
+"""
+
+import math
+import os
+
+from oemof import solph
+from pyomo.core import Var
+from sqlmodel import Session, select
+
+from ensys.common.types import Solver
+from .model import EnSimulationDB, Status
+from ..results.store import DUMP_FILE, ResultStore, has_result_store, has_results
+
+# Solvers whose pyomo interface accepts `warmstart=True` in solve().
+WARMSTART_SOLVERS = (
+    Solver.cbc,
+    Solver.cplex,
+    Solver.gurobi,
+    Solver.gurobi_direct,
+    Solver.gurobi_persistent,
+    Solver.highs,
+)
+
+# (variable name, component labels, time step or period) -> value
+Solution = dict[tuple[str, tuple[str, ...], int], float]
+
+
+def supports_warm_start(solver: Solver) -> bool:
+    """Return True if the solver interface can use a MIP start."""
+    return solver in WARMSTART_SOLVERS
+
+
+def find_previous_simulation(
+    scenario_id: int, simulation_id: int, datadir: str, db: Session
+) -> EnSimulationDB | None:
+    """Return the newest finished simulation of the scenario with results.
+
+    - param scenario_id: scenario of the new simulation
+    - param simulation_id: the new simulation, excluded from the lookup
+    - param datadir: root directory of the simulation folders
+    - param db: SQLModel session
+    - returns: EnSimulationDB whose solution can be reused or None
+    """
+    candidates = db.exec(
+        select(EnSimulationDB)
+        .where(EnSimulationDB.scenario_id == scenario_id)
+        .where(EnSimulationDB.id != simulation_id)
+        .where(EnSimulationDB.sweep_id.is_(None))
+        # the best solution of a run that reached its limit is a good start
+        .where(EnSimulationDB.status.in_((Status.FINISHED.value, Status.LIMIT_REACHED.value)))
+        .order_by(EnSimulationDB.end_date.desc())
+    ).all()
+
+    for candidate in candidates:
+        if has_results(os.path.join(datadir, candidate.get_result_token(), "dump")):
+            return candidate
+
+    return None
+
+
+def solution_from_results(results: dict) -> Solution:
+    """Flatten processed oemof results into a variable lookup.
+
+    Sequences are stored per time step position, scalars (e.g. `invest`) with
+    position 0, which is the only period of the models built here.
+
+    - param results: `solph.processing.results` of a solved model
+    - returns: dict keyed by variable name, component labels and position
+    """
+    solution: Solution = {}
+
+    for (node, other), data in results.items():
+        labels = (str(node),) if other is None else (str(node), str(other))
+
+        for name, series in data["sequences"].items():
+            for position, value in enumerate(series.to_numpy(dtype=float)):
+                if not math.isnan(value):
+                    solution[(name, labels, position)] = float(value)
+
+        scalars = data.get("scalars")
+        if scalars is not None:
+            for name, value in scalars.items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if not math.isnan(value):
+                    solution[(name, labels, 0)] = value
+
+    return solution
+
+
+def load_previous_solution(datadir: str, simulation: EnSimulationDB) -> Solution:
+    """Read the results of `simulation` and return its solution.
+
+    - param datadir: root directory of the simulation folders
+    - param simulation: finished simulation with a dump
+    - returns: flattened solution, see `solution_from_results`
+    """
+    return load_solution(os.path.join(datadir, simulation.get_result_token(), "dump"))
+
+
+def load_solution(dump_path: str) -> Solution:
+    """Read the results in `dump_path` and return their solution.
+
+    - param dump_path: dump folder of a finished simulation
+    - returns: flattened solution, see `solution_from_results`
+    """
+    if has_result_store(dump_path):
+        return solution_from_results(ResultStore(dump_path).results())
+
+    energysystem = solph.EnergySystem()
+    energysystem.restore(dpath=dump_path, filename=DUMP_FILE)
+
+    return solution_from_results(energysystem.results["main"])
+
+
+def apply_warm_start(oemof_model: solph.Model, solution: Solution) -> tuple[int, int]:
+    """Set the values of all model variables found in `solution`.
+
+    Fixed variables are left untouched, integer and binary values are rounded.
+
+    - param oemof_model: built but unsolved model
+    - param solution: solution of a previous run
+    - returns: tuple of assigned variables and assigned integer variables
+    """
+    assigned = 0
+    assigned_integer = 0
+
+    for var in oemof_model.component_data_objects(Var):
+        if var.fixed:
+            continue
+
+        index = var.index()
+        if not isinstance(index, tuple) or len(index) < 2:
+            continue
+
+        key = (
+            var.parent_component().local_name,
+            tuple(str(node) for node in index[:-1]),
+            index[-1],
+        )
+        value = solution.get(key)
+        if value is None:
+            continue
+
+        if var.is_continuous():
+            var.set_value(value, skip_validation=True)
+        else:
+            var.set_value(round(value), skip_validation=True)
+            assigned_integer += 1
+        assigned += 1
+
+    return assigned, assigned_integer
@@ -0,0 +1,15 @@
+"""
+Parameter Sweep Module
+====================
+
+This package runs studies in which a few parameters of a base scenario are
+varied over a grid. All variants share one converted energy system and are
+solved by a bounded number of parallel Celery tasks.
+
+The module includes:
+    - Sweep models and the parameter grid definition
+    - Application of parameter values to an energy system
+    - Isolated solve of a chunk of variants
+    - Sweep service layer
+    - Sweep API endpoints
+"""
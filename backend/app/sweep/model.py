@@ -0,0 +1,131 @@
+"""Sweep models for parameter studies over a base scenario."""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, model_validator
+from sqladmin import ModelView
+from sqlalchemy import Column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from ..simulation.model import Status
+
+
+class SweepParameterType(Enum):
+    """Kinds of parameters which can be varied in a sweep."""
+
+    ATTRIBUTE = "attribute"
+    EMISSION_LIMIT = "emission_limit"
+    DEMAND_SCALING = "demand_scaling"
+
+
+class EnSweepParameter(BaseModel):
+    """Single dimension of the parameter grid.
+
+    - ATTRIBUTE: sets `path` (dotted, e.g. `outputs.el.nominal_value.ep_costs`)
+      of the component labelled `component`
+    - EMISSION_LIMIT: replaces the limit of the emission constraint
+    - DEMAND_SCALING: scales the demand of the sink `component` (all sinks if unset)
+    """
+
+    type: SweepParameterType = Field(default=SweepParameterType.ATTRIBUTE)
+    component: str | None = Field(default=None)
+    path: str | None = Field(default=None)
+    values: list[float] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def check_attribute_target(self):
+        """Require component and path for attribute parameters."""
+        if self.type is SweepParameterType.ATTRIBUTE and (
+            not self.component or not self.path
+        ):
+            raise ValueError("Attribute parameters need a component and a path.")
+        return self
+
+    @property
+    def name(self) -> str:
+        """Column name of the parameter in variants and the summary table."""
+        if self.type is SweepParameterType.ATTRIBUTE:
+            return f"{self.component}.{self.path}"
+        if self.component:
+            return f"{self.type.value}.{self.component}"
+        return self.type.value
+
+
+class EnSweep(BaseModel):
+    """Sweep payload with base scenario, parameter grid and parallelism."""
+
+    name: str = Field(min_length=1, max_length=100)
+    scenario_id: int = Field()
+    parameters: list[EnSweepParameter] = Field(min_length=1)
+    max_parallel: int | None = Field(default=None, ge=1)
+
+    @model_validator(mode="after")
+    def check_unique_parameters(self):
+        """Reject grids which vary the same parameter twice."""
+        names = [parameter.name for parameter in self.parameters]
+        if len(names) != len(set(names)):
+            raise ValueError("Each parameter may only appear once in a sweep.")
+        return self
+
+
+class EnSweepDB(SQLModel, table=True):
+    """DB model for sweeps with grid, status and the combined summary."""
+
+    __tablename__ = "sweeps"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(min_length=1, max_length=100)
+    sweep_token: str = Field()
+    scenario_id: int = Field(foreign_key="scenarios.id")
+    status: int = Field(default=Status.STARTED.value)
+    status_message: str | None = Field(default=None)
+    parameters: list | None = Field(sa_column=Column(JSONB), default=None)
+    variant_count: int = Field(default=0)
+    max_parallel: int = Field(default=1)
+    start_date: datetime = Field(default_factory=datetime.now)
+    end_date: datetime | None = Field(default=None)
+    summary: list | None = Field(sa_column=Column(JSONB), default=None)
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def get_parameters(self) -> list[EnSweepParameter]:
+        """Return the parsed parameter grid."""
+        return [EnSweepParameter(**parameter) for parameter in self.parameters or []]
+
+    def model_dump(self, *args, **kwargs) -> dict:
+        """Return sweep dict with timestamps as epoch floats."""
+        dump_data = super().model_dump(*args, **kwargs)
+        dump_data["start_date"] = datetime.timestamp(self.start_date)
+        dump_data["end_date"] = (
+            datetime.timestamp(self.end_date) if self.end_date else None
+        )
+        return dump_data
+
+
+class SweepAdmin(ModelView, model=EnSweepDB):
+    column_list = [
+        "id",
+        "name",
+        "sweep_token",
+        "scenario_id",
+        "status",
+        "status_message",
+        "variant_count",
+        "max_parallel",
+        "start_date",
+        "end_date",
+    ]
+    name = "Sweep (EnSweepDB)"
+    icon = "fa-solid fa-table-cells"
+    name_plural = "Sweeps"
+    category = "Energysystems"
+    category_icon = "fa-solid fa-bolt"
+    can_view_details = True
+    can_edit = False
+    can_create = False
+    can_delete = False
+    can_retrieve = True
+    can_export = False
@@ -0,0 +1,169 @@
+"""
+Sweep Router Module
+=================
+
+This module provides API endpoints for parameter sweeps: starting a sweep
+over a base scenario and reading its variants and combined summary.
+"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from .model import EnSweep
+from .service import (
+    create_and_start_sweep,
+    delete_sweep,
+    read_sweep,
+    read_scenario_sweeps,
+    read_sweep_simulations,
+)
+from ..db import get_db_session
+from ..models.base import GeneralDataModel
+from ..models.response import DataResponse, MessageResponse
+from ..security import oauth2_scheme
+from ..user.service import read_user_by_token
+
+sweep_router = APIRouter(prefix="/sweep", tags=["sweep"])
+
+
+@sweep_router.post("", response_model=MessageResponse)
+async def start_sweep_endpoint(
+    sweep_data: EnSweep,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> MessageResponse:
+    """Start a parameter sweep over a base scenario.
+
+    - param sweep_data: base scenario, parameter grid and parallelism
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: MessageResponse with the sweep id and variant count
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    sweep = create_and_start_sweep(sweep_data=sweep_data, user=user, db=db)
+    return MessageResponse(
+        data=f"Sweep with id:{sweep.id} and {sweep.variant_count} variants started.",
+        success=True,
+    )
+
+
+@sweep_router.get("s/{scenario_id}", response_model=DataResponse)
+async def get_sweeps_endpoint(
+    scenario_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """List sweeps of a scenario.
+
+    - param scenario_id: scenario id to list sweeps for
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with sweeps and totalCount
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    sweeps = read_scenario_sweeps(scenario_id=scenario_id, user=user, db=db)
+    return DataResponse(
+        data=GeneralDataModel(items=sweeps, totalCount=len(sweeps)),
+        success=True,
+    )
+
+
+@sweep_router.get("/{sweep_id}", response_model=DataResponse)
+async def get_sweep_endpoint(
+    sweep_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """Fetch a single sweep with status and grid.
+
+    - param sweep_id: sweep id to fetch
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with the sweep
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    sweep = read_sweep(sweep_id=sweep_id, user=user, db=db)
+    return DataResponse(
+        data=GeneralDataModel(items=[sweep], totalCount=1),
+        success=True,
+    )
+
+
+@sweep_router.get("/{sweep_id}/simulations", response_model=DataResponse)
+async def get_sweep_simulations_endpoint(
+    sweep_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """List the variant simulations of a sweep.
+
+    The results of a variant are read via the results endpoints of its
+    simulation id.
+
+    - param sweep_id: sweep id
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with simulations and totalCount
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    simulations = read_sweep_simulations(sweep_id=sweep_id, user=user, db=db)
+    return DataResponse(
+        data=GeneralDataModel(items=simulations, totalCount=len(simulations)),
+        success=True,
+    )
+
+
+@sweep_router.get("/{sweep_id}/summary", response_model=DataResponse)
+async def get_sweep_summary_endpoint(
+    sweep_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> DataResponse:
+    """Return the summary table of a finished sweep.
+
+    Each row holds the simulation id, the parameter values of the variant,
+    its status, objective value and the gap of its solution.
+
+    - param sweep_id: sweep id
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: DataResponse with one row per variant (empty while running)
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    sweep = read_sweep(sweep_id=sweep_id, user=user, db=db)
+    rows = sweep.summary or []
+
+    return DataResponse(
+        data=GeneralDataModel(items=rows, totalCount=len(rows)),
+        success=True,
+    )
+
+
+@sweep_router.delete("/{sweep_id}")
+async def delete_sweep_endpoint(
+    sweep_id: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db=Depends(get_db_session),
+) -> MessageResponse:
+    """Delete a sweep and its variant simulations.
+
+    - param sweep_id: sweep id to delete
+    - param token: bearer token from OAuth2
+    - param db: SQLModel session dependency
+    - returns: MessageResponse when deletion succeeds
+    - raises: HTTPException 409 if the sweep cannot be deleted
+    """
+    user = read_user_by_token(token=token, db=db)
+
+    if delete_sweep(sweep_id=sweep_id, user=user, db=db):
+        return MessageResponse(data="Sweep deleted.", success=True)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Could not delete Sweep."
+        )
@@ -0,0 +1,298 @@
+"""
+Sweep Chunk Runner Module
+=======================
+
+This module solves a chunk of sweep variants in an isolated child process,
+started with `run_isolated` like the solve of a single simulation. The
+variants of a chunk are solved one after another in the same child, so
+consecutive variants still share the build cache and the MIP start, while
+their Pyomo models never exist in the Celery worker. A chunk exceeding the
+memory or CPU limit of its child only ends the child.
+
+The child appends the outcome of every variant to a file as soon as its
+results are written, so the variants solved before the child was killed or
+cancelled keep their results.
+
+The module provides:
+    - Job and variant outcome models exchanged with the child
+    - Solving a single variant and a chunk of variants
+    - The entry point of the child process
+"""
+
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from ensys.components import EnModel
+from .model import EnSweepParameter
+from ..scenario.model import EnAggregationSettings
+from ..simulation.isolation import SolveOutcome, run_child
+from ..simulation.timing import StageTimer
+
+if TYPE_CHECKING:
+    from ..simulation.buildcache import BuildCache
+    from ..simulation.warmstart import Solution
+
+
+class SweepVariantJob(BaseModel):
+    """Single variant of a chunk.
+
+    - fields: simulation id, parameter values, result folder and solver
+      options (including the solver log) of the variant
+    """
+
+    simulation_id: int = Field()
+    variant: dict[str, float] = Field(default_factory=dict)
+    dump_path: str = Field()
+    cmdline_options: dict = Field(default_factory=dict)
+
+
+class SweepChunkJob(BaseModel):
+    """Input of the child process of a chunk.
+
+    - fields: path of the converted base model (sweep folder), file the
+      variant outcomes are appended to, log file, time index, optional
+      aggregation, base constraints, parameter grid, variants, solver, whether
+      to presolve, to start each variant from the previous solution and to
+      keep the pickled dumps, file whose existence tells the child that the
+      chunk was cancelled
+    """
+
+    converted_model: str = Field()
+    outcome_file: str = Field()
+    log_file: str | None = Field(default=None)
+    start_date: datetime = Field()
+    time_steps: int = Field()
+    interval: float = Field()
+    aggregation: EnAggregationSettings | None = Field(default=None)
+    constraints: list[dict] | None = Field(default=None)
+    parameters: list[EnSweepParameter] = Field(default_factory=list)
+    variants: list[SweepVariantJob] = Field(default_factory=list)
+    solver: str = Field()
+    presolve: bool = Field(default=False)
+    warm_start: bool = Field(default=False)
+    keep_dump: bool = Field(default=False)
+    cancel_file: str | None = Field(default=None)
+
+
+class VariantOutcome(BaseModel):
+    """Result of a single variant.
+
+    - fields: simulation id, objective, relative gap of the solution,
+      limit_reached, partial (cancelled, the incumbent was kept), error,
+      stage durations
+    """
+
+    simulation_id: int = Field()
+    objective: float | None = Field(default=None)
+    gap: float | None = Field(default=None)
+    limit_reached: bool = Field(default=False)
+    partial: bool = Field(default=False)
+    error: str | None = Field(default=None)
+    durations: dict[str, float] = Field(default_factory=dict)
+
+
+def read_variant_outcomes(outcome_file: str) -> dict[int, VariantOutcome]:
+    """Return the outcomes a chunk wrote by simulation id.
+
+    - param outcome_file: file the child appended the outcomes to
+    - returns: outcome of every variant the child finished
+    """
+    if not os.path.exists(outcome_file):
+        return {}
+
+    with open(outcome_file, "rt") as f:
+        outcomes = [VariantOutcome.model_validate_json(line) for line in f if line.strip()]
+
+    return {outcome.simulation_id: outcome for outcome in outcomes}
+
+
+def _cancelled(job: SweepChunkJob) -> bool:
+    """Return True if the parent cancelled the chunk."""
+    return job.cancel_file is not None and os.path.exists(job.cancel_file)
+
+
+def solve_variant(
+    job: SweepChunkJob,
+    variant: SweepVariantJob,
+    base_model: EnModel,
+    timer: StageTimer,
+    logger: logging.Logger,
+    solution: "Solution | None" = None,
+    build_cache: "BuildCache | None" = None,
+) -> tuple[VariantOutcome, dict]:
+    """Solve a single variant and write its results.
+
+    A variant with the model structure of a previous variant in `build_cache`
+    updates and re-solves its model instead of building a new one.
+
+    - param job: chunk of the variant
+    - param variant: variant to solve
+    - param base_model: converted base model shared by all variants
+    - param timer: stage timer of this variant
+    - param logger: logger of the child process
+    - param solution: solution of the previous variant used as MIP start
+    - param build_cache: built models of the previous variants or None
+    - returns: outcome and processed results of the variant
+    """
+    # imported here, the parent only needs the models of this module
+    from ensys.common.presolve import presolve
+    from ensys.common.solver import SolverStoppedError, solution_gap, solve_model
+    from .variants import apply_variant
+    from ..results.store import DUMP_FILE, write_result_store
+    from ..simulation.buildcache import BuiltModel, structure_key, update_model
+    from ..simulation.pipeline import collect_results, create_oemof_energysystem, create_oemof_model
+    from ..simulation.warmstart import apply_warm_start
+
+    built = None
+    key = None
+    with timer.stage("to_oemof"):
+        energysystem, variant_constraints = apply_variant(
+            base_model.energysystem, job.constraints, job.parameters, variant.variant
+        )
+        if job.presolve and not variant_constraints:
+            energysystem, report = presolve(energysystem)
+            logger.info(f"presolve: {report}")
+
+        # aggregated profiles depend on the coefficients, so they are always rebuilt
+        if build_cache is not None and job.aggregation is None:
+            key = structure_key(
+                energysystem,
+                variant_constraints,
+                {
+                    "start_date": job.start_date,
+                    "time_steps": job.time_steps,
+                    "interval": job.interval,
+                },
+            )
+            built = build_cache.get(key)
+
+        if built is None:
+            oemof_es = create_oemof_energysystem(
+                energysystem=energysystem,
+                start_date=job.start_date,
+                time_steps=job.time_steps,
+                interval=job.interval,
+                aggregation=job.aggregation,
+            )
+
+    solve_kwargs = {}
+    if built is not None:
+        with timer.stage("update"):
+            update_model(built, energysystem)
+        oemof_es, oemof_model = built.oemof_es, built.model
+        # the variables still hold the solution of the previous variant
+        if solution:
+            solve_kwargs["warmstart"] = True
+    else:
+        with timer.stage("build"):
+            oemof_model = create_oemof_model(
+                oemof_es=oemof_es, constraints=variant_constraints, logger=logger
+            )
+        if key is not None:
+            build_cache.put(key, BuiltModel(oemof_es, oemof_model))
+
+        if solution:
+            with timer.stage("warm_start"):
+                if apply_warm_start(oemof_model, solution)[1] > 0:
+                    solve_kwargs["warmstart"] = True
+
+    partial = False
+    limit_reached = False
+    with timer.stage("solve"):
+        try:
+            solver_results = solve_model(
+                oemof_model,
+                solver=job.solver,
+                solve_kwargs=solve_kwargs,
+                cmdline_options=variant.cmdline_options,
+            )
+        except SolverStoppedError as stopped:
+            if _cancelled(job):
+                logger.warning(f"variant cancelled, keep the incumbent with a gap of {stopped.gap}")
+                partial = True
+            elif stopped.limit_reached:
+                limit_reached = True
+            else:
+                raise
+            solver_results = stopped.solver_results
+
+    with timer.stage("results"):
+        collect_results(oemof_es, oemof_model, variant_constraints)
+
+    with timer.stage("dump"):
+        write_result_store(oemof_es, variant.dump_path)
+        if job.keep_dump:
+            oemof_es.dump(dpath=variant.dump_path, filename=DUMP_FILE)
+
+    outcome = VariantOutcome(
+        simulation_id=variant.simulation_id,
+        objective=oemof_es.results["meta"]["objective"],
+        gap=solution_gap(solver_results),
+        limit_reached=limit_reached,
+        partial=partial,
+    )
+
+    return outcome, oemof_es.results["main"]
+
+
+def solve_chunk(job: SweepChunkJob, timer: StageTimer, logger: logging.Logger) -> SolveOutcome:
+    """Solve the variants of a chunk one after another.
+
+    Failing variants are recorded and do not stop the chunk; a cancelled
+    chunk stops after the running variant.
+
+    - param job: input of the chunk
+    - param timer: stage timer of the chunk
+    - param logger: logger of the child process
+    - returns: SolveOutcome of the chunk, the variants are in `outcome_file`
+    """
+    from ..simulation.buildcache import BuildCache
+    from ..simulation.snapshot import read_converted_model
+    from ..simulation.warmstart import solution_from_results
+
+    with timer.stage("load"):
+        base_model = read_converted_model(job.converted_model)
+
+    solution = None
+    build_cache = BuildCache()
+
+    for variant in job.variants:
+        if _cancelled(job):
+            break
+
+        variant_timer = StageTimer()
+        try:
+            outcome, results = solve_variant(
+                job, variant, base_model, variant_timer, logger, solution, build_cache
+            )
+            if job.warm_start:
+                solution = solution_from_results(results)
+        except MemoryError:
+            raise
+        except Exception as ex:
+            logger.critical(f"variant {variant.simulation_id} failed: {ex}")
+            outcome = VariantOutcome(simulation_id=variant.simulation_id, error=str(ex))
+
+        outcome.durations = dict(variant_timer.durations)
+        with open(job.outcome_file, "at") as f:
+            f.write(outcome.model_dump_json() + "\n")
+
+    return SolveOutcome(durations=timer.durations, cancelled=_cancelled(job))
+
+
+def main(job_file: str) -> int:
+    """Entry point of the child process of a chunk.
+
+    - param job_file: path of the job file written by `run_isolated`
+    - returns: exit code
+    """
+    return run_child(job_file, SweepChunkJob, solve_chunk)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1]))
@@ -0,0 +1,180 @@
+"""
+Sweep Service Module
+==================
+
+This module provides the service layer for parameter sweeps. It handles:
+- Expanding the parameter grid and creating the variant simulations
+- Starting the sweep task
+- Reading sweeps, their variants and the summary table
+"""
+
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from starlette import status
+
+from .model import EnSweep, EnSweepDB
+from .variants import expand_grid
+from ..celery import celery_app, chunk_task_id, sweep_task
+from ..core.config import get_settings
+from ..scenario.model import EnScenarioDB
+from ..simulation.model import EnSimulationDB, Status
+from ..simulation.service import estimate_scenario
+from ..user.model import EnUserDB
+
+_settings = get_settings()
+
+
+def create_and_start_sweep(sweep_data: EnSweep, user: EnUserDB, db: Session) -> EnSweepDB:
+    """Create a sweep with one simulation per variant and start it.
+
+    - param sweep_data: base scenario, parameter grid and parallelism
+    - param user: authenticated user
+    - param db: SQLModel session
+    - returns: created `EnSweepDB`
+    - raises: HTTPException 401/409 on auth, grid size, model size or db errors
+    """
+    if not user.check_user_rights(scenario_id=sweep_data.scenario_id, db=db):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authorized.")
+
+    variants = expand_grid(sweep_data.parameters)
+    if len(variants) > _settings.sweep_max_variants:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Sweep has {len(variants)} variants, the limit is {_settings.sweep_max_variants}.",
+        )
+
+    scenario = db.get(EnScenarioDB, sweep_data.scenario_id)
+    if scenario.get_simulation_settings().rolling_horizon is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Sweeps do not support rolling horizon scenarios.",
+        )
+
+    # variants share the structure of the base scenario
+    admission = estimate_scenario(scenario)
+    if not admission.admitted:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=admission.reason)
+
+    max_parallel = min(
+        sweep_data.max_parallel or _settings.sweep_max_parallel,
+        _settings.sweep_max_parallel,
+    )
+
+    sweep = EnSweepDB(
+        name=sweep_data.name,
+        sweep_token=str(uuid.uuid4()),
+        scenario_id=sweep_data.scenario_id,
+        parameters=[parameter.model_dump(mode="json") for parameter in sweep_data.parameters],
+        variant_count=len(variants),
+        max_parallel=max_parallel,
+        start_date=datetime.now(),
+    )
+
+    db.add(sweep)
+    try:
+        db.commit()
+        db.refresh(sweep)
+
+        for variant in variants:
+            db.add(
+                EnSimulationDB(
+                    sim_token=str(uuid.uuid4()),
+                    start_date=datetime.now(),
+                    scenario_id=sweep.scenario_id,
+                    sweep_id=sweep.id,
+                    variant=variant,
+                )
+            )
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Database integrity error for create_sweep.",
+        ) from exc
+
+    db.refresh(sweep)
+
+    sweep_task.delay(sweep.id)
+
+    return sweep
+
+
+def read_sweep(sweep_id: int, user: EnUserDB, db: Session) -> EnSweepDB:
+    """Fetch a sweep after authorizing access.
+
+    - param sweep_id: target sweep id
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: `EnSweepDB`
+    - raises: HTTPException 404/401 on missing or unauthorized
+    """
+    sweep = db.get(EnSweepDB, sweep_id)
+
+    if sweep is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No Sweep found."
+        )
+    elif not user.check_user_rights(scenario_id=sweep.scenario_id, db=db):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authorized.")
+    else:
+        return sweep
+
+
+def read_scenario_sweeps(scenario_id: int, user: EnUserDB, db: Session) -> list[EnSweepDB]:
+    """List sweeps of a scenario if the user is authorized."""
+    if not user.check_user_rights(scenario_id=scenario_id, db=db):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authorized.")
+
+    return list(
+        db.exec(select(EnSweepDB).where(EnSweepDB.scenario_id == scenario_id)).all()
+    )
+
+
+def read_sweep_simulations(sweep_id: int, user: EnUserDB, db: Session) -> list[EnSimulationDB]:
+    """List the variant simulations of a sweep."""
+    sweep = read_sweep(sweep_id=sweep_id, user=user, db=db)
+
+    return list(
+        db.exec(
+            select(EnSimulationDB)
+            .where(EnSimulationDB.sweep_id == sweep.id)
+            .order_by(EnSimulationDB.id)
+        ).all()
+    )
+
+
+def delete_sweep(sweep_id: int, user: EnUserDB, db: Session) -> bool:
+    """Delete a sweep and its variant simulations.
+
+    The chunks of a running sweep are revoked with SIGUSR1, which cancels
+    their solve processes.
+
+    - param sweep_id: id to delete
+    - param user: requesting user
+    - param db: SQLModel session
+    - returns: True when deleted
+    """
+    sweep = read_sweep(sweep_id=sweep_id, user=user, db=db)
+
+    if sweep.status == Status.STARTED.value:
+        for index in range(sweep.max_parallel):
+            celery_app.control.revoke(
+                task_id=chunk_task_id(sweep, index), terminate=True, signal="SIGUSR1"
+            )
+
+    for simulation in read_sweep_simulations(sweep_id=sweep.id, user=user, db=db):
+        db.delete(simulation)
+    db.delete(sweep)
+
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+
+    return True
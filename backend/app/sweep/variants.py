@@ -0,0 +1,140 @@
+"""
+Sweep Variant Module
+==================
+
+This module expands the parameter grid of a sweep into variants and applies
+the values of a variant to a copy of the converted base energy system.
+
+The module provides:
+    - Cartesian expansion of the parameter grid
+    - Lookup of components by label
+    - Application of attribute, emission limit and demand scaling parameters
+"""
+
+import copy
+import itertools
+
+from ensys.common.timeseries import TimeSeries
+from ensys.components import EnEnergysystem
+from .model import EnSweepParameter, SweepParameterType
+
+_COMPONENT_LISTS = ("busses", "sinks", "sources", "converters", "generic_storages")
+
+
+def expand_grid(parameters: list[EnSweepParameter]) -> list[dict[str, float]]:
+    """Return all combinations of the parameter values.
+
+    - param parameters: dimensions of the grid
+    - returns: list of variants, each mapping parameter name to value
+    """
+    names = [parameter.name for parameter in parameters]
+
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(parameter.values for parameter in parameters))
+    ]
+
+
+def find_component(energysystem: EnEnergysystem, label: str):
+    """Return the component with `label` or raise a KeyError."""
+    for list_name in _COMPONENT_LISTS:
+        for component in getattr(energysystem, list_name):
+            if component.label == label:
+                return component
+
+    raise KeyError(label)
+
+
+def set_path(target, path: str, value: float):
+    """Set the dotted `path` below `target` to `value`.
+
+    Path segments address attributes of components and keys of dicts
+    (e.g. `outputs.el.nominal_value.ep_costs`).
+    """
+    *parents, last = path.split(".")
+
+    for segment in parents:
+        target = target[segment] if isinstance(target, dict) else getattr(target, segment)
+        if target is None:
+            raise KeyError(f"{path} is not set in the base scenario")
+
+    if isinstance(target, dict):
+        target[last] = value
+    else:
+        setattr(target, last, value)
+
+
+def _scale(value, factor: float):
+    """Scale a scalar or a sequence by `factor`."""
+    if isinstance(value, TimeSeries):
+        return TimeSeries.validate(value.array * factor)
+    if isinstance(value, list):
+        return [item * factor for item in value]
+
+    return value * factor
+
+
+def scale_demand(energysystem: EnEnergysystem, component: str | None, factor: float):
+    """Scale the demand of one sink or of all sinks.
+
+    Fixed profiles are scaled via `fix`, other inflows via a numeric
+    `nominal_value`.
+    """
+    if component:
+        sinks = [find_component(energysystem, component)]
+    else:
+        sinks = energysystem.sinks
+
+    for sink in sinks:
+        for flow in sink.inputs.values():
+            if flow.fix is not None:
+                flow.fix = _scale(flow.fix, factor)
+            elif isinstance(flow.nominal_value, float):
+                flow.nominal_value = flow.nominal_value * factor
+
+
+def set_emission_limit(constraints: list[dict] | None, limit: float) -> list[dict]:
+    """Return constraints with the emission limit replaced (or added)."""
+    constraints = copy.deepcopy(constraints) if constraints else []
+
+    for constraint in constraints:
+        if constraint["type"] == "emission_limit":
+            constraint["enabled"] = True
+            constraint["values"] = {**constraint.get("values", {}), "limit": limit}
+            return constraints
+
+    constraints.append(
+        {"type": "emission_limit", "enabled": True, "values": {"limit": limit}}
+    )
+
+    return constraints
+
+
+def apply_variant(
+    energysystem: EnEnergysystem,
+    constraints: list[dict] | None,
+    parameters: list[EnSweepParameter],
+    variant: dict[str, float],
+) -> tuple[EnEnergysystem, list[dict] | None]:
+    """Apply the values of a variant to a copy of the base energy system.
+
+    - param energysystem: converted base energy system (left unchanged)
+    - param constraints: base scenario constraints
+    - param parameters: dimensions of the grid
+    - param variant: parameter values of this variant
+    - returns: tuple of variant energy system and constraints
+    - raises: KeyError if a component or path does not exist
+    """
+    energysystem = energysystem.model_copy(deep=True)
+
+    for parameter in parameters:
+        value = float(variant[parameter.name])
+
+        if parameter.type is SweepParameterType.ATTRIBUTE:
+            set_path(find_component(energysystem, parameter.component), parameter.path, value)
+        elif parameter.type is SweepParameterType.EMISSION_LIMIT:
+            constraints = set_emission_limit(constraints, value)
+        elif parameter.type is SweepParameterType.DEMAND_SCALING:
+            scale_demand(energysystem, parameter.component, value)
+
+    return energysystem, constraints
@@ -0,0 +1,39 @@
+import copy
+
+from backend.app.auxillary import convert_gui_json_to_ensys
+from backend.benchmarks.samples import SampleDrawflow, sample_drawflow, sample_energysystem
+from ensys.components import EnFlow
+
+TIME_STEPS = 48
+
+
+def test_convert_gui_json_to_ensys():
+    flowchart_data = sample_drawflow(TIME_STEPS, districts=2)
+    unchanged = copy.deepcopy(flowchart_data)
+
+    energysystem = convert_gui_json_to_ensys(flowchart_data)
+
+    assert energysystem == sample_energysystem(TIME_STEPS, districts=2)
+    assert flowchart_data == unchanged
+
+
+def test_convert_gui_json_to_ensys_flow_per_port():
+    drawflow = SampleDrawflow()
+    gas = drawflow.add("gas", "bus", inputs=1, outputs=1)
+    el = drawflow.add("el", "bus", inputs=1, outputs=1)
+    heat = drawflow.add("heat", "bus", inputs=1, outputs=1)
+    chp = drawflow.add("chp", "converter", inputs=1, outputs=2)
+    drawflow.data[chp]["data"]["ports"]["outputs"][0]["timeSeries"] = 0.4
+    drawflow.data[chp]["data"]["ports"]["outputs"][1]["timeSeries"] = 0.5
+    drawflow.connect(gas, "output_1", chp, "input_1")
+    drawflow.connect(chp, "output_1", el, "input_1", nominal_value=100, constraint_emission_factor="0.2")
+    drawflow.connect(chp, "output_2", heat, "input_1", nominal_value="120", constraint_other=None)
+
+    converter = convert_gui_json_to_ensys(drawflow.data).converters[0]
+
+    assert converter.inputs == {"gas": EnFlow()}
+    assert converter.outputs == {
+        "el": EnFlow(nominal_value=100, custom_properties={"emission_factor": 0.2}),
+        "heat": EnFlow(nominal_value=120),
+    }
+    assert converter.conversion_factors == {"el": 0.4, "heat": 0.5}
@@ -0,0 +1,77 @@
+import logging
+from datetime import datetime
+
+import numpy as np
+import pytest
+from oemof import solph
+
+from backend.app.results.store import ResultStore, has_result_store, has_results, write_result_store
+from backend.app.simulation.pipeline import collect_results, create_oemof_energysystem, create_oemof_model
+from backend.app.simulation.warmstart import load_solution, solution_from_results
+from ensys.common.solver import solve_model, solver_available
+from ensys.common.types import Solver
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnGenericStorage, EnInvestment, EnSink, EnSource
+
+TIME_STEPS = 6
+DEMAND = [0.2, 0.5, 0.8, 0.4, 0.6, 0.3]
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+def _solved_energysystem() -> solph.EnergySystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1.0, fix=DEMAND)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=EnInvestment(ep_costs=0.01),
+            inflow_conversion_factor=1.0,
+            outflow_conversion_factor=1.0,
+        )
+    )
+
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), TIME_STEPS, 1.0)
+    oemof_model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    solve_model(oemof_model, Solver.highs)
+    collect_results(oemof_es, oemof_model, None)
+
+    return oemof_es
+
+
+@requires_highs
+def test_store_round_trips_results(tmp_path):
+    oemof_es = _solved_energysystem()
+    assert not has_results(str(tmp_path))
+
+    write_result_store(oemof_es, str(tmp_path))
+    store = ResultStore(str(tmp_path))
+
+    assert has_result_store(str(tmp_path))
+    assert store.nodes["battery"] == "GenericStorage"
+    assert store.nodes["el"] == "Bus"
+
+    expected = solph.views.node(oemof_es.results["main"], node=oemof_es.groups["el"])["sequences"]
+    actual = store.node("el")["sequences"]
+    assert [(tuple(str(n) for n in key), name) for key, name in expected.columns] == list(actual.columns)
+    np.testing.assert_array_equal(expected.to_numpy(), actual.to_numpy())
+    assert list(actual.index) == list(expected.index)
+
+    np.testing.assert_array_equal(
+        store.flow("el", "demand")["flow"].to_numpy()[:TIME_STEPS], DEMAND
+    )
+    assert list(store.node("battery")["scalars"]) == list(
+        solph.views.node(oemof_es.results["main"], node=oemof_es.groups["battery"])["scalars"]
+    )
+
+
+@requires_highs
+def test_store_serves_warm_start_solution(tmp_path):
+    oemof_es = _solved_energysystem()
+    write_result_store(oemof_es, str(tmp_path))
+
+    assert load_solution(str(tmp_path)) == solution_from_results(oemof_es.results["main"])
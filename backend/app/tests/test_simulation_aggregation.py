@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime
+
+import numpy as np
+
+from backend.app.scenario.model import EnAggregationSettings
+from backend.app.simulation.aggregation import aggregate_energysystem, cluster_periods, disaggregate_sequence
+from backend.app.simulation.pipeline import create_oemof_energysystem, create_oemof_model
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnGenericStorage, EnInvestment, EnSink, EnSource
+
+DAYS = 6
+TIME_STEPS = DAYS * 24
+SUNNY = [max(0.0, np.sin((hour - 6) / 12 * np.pi)) for hour in range(24)]
+CLOUDY = [0.2 * value for value in SUNNY]
+# sunny, cloudy, sunny, cloudy, sunny, sunny
+PV = SUNNY + CLOUDY + SUNNY + CLOUDY + SUNNY + SUNNY
+DEMAND = [0.5] * TIME_STEPS
+
+AGGREGATION = EnAggregationSettings(typical_periods=2, hours_per_period=24)
+
+
+def _energysystem() -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="pv", outputs={"el": EnFlow(nominal_value=EnInvestment(ep_costs=100), max=PV)}))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1.0, fix=DEMAND)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=EnInvestment(ep_costs=50),
+            inflow_conversion_factor=0.95,
+            outflow_conversion_factor=0.95,
+        )
+    )
+
+    return energysystem
+
+
+def test_cluster_periods_groups_similar_days():
+    order, medoids = cluster_periods(np.array([PV, DEMAND]), steps=24, typical_periods=2)
+
+    assert order == [0, 1, 0, 1, 0, 0]
+    assert medoids == [0, 1]
+
+
+def test_aggregate_energysystem_reduces_profiles():
+    base = _energysystem()
+
+    aggregated, tsa_parameters = aggregate_energysystem(base, TIME_STEPS, 1.0, AGGREGATION)
+
+    assert tsa_parameters == {"timesteps_per_period": 24, "order": [0, 1, 0, 1, 0, 0]}
+    assert aggregated.sources[0].outputs["el"].max == SUNNY + CLOUDY
+    assert aggregated.sinks[0].inputs["el"].fix == [0.5] * 48
+    assert list(disaggregate_sequence(aggregated.sources[0].outputs["el"].max, tsa_parameters)) == PV
+    # the converted energy system is kept at full resolution
+    assert base.sources[0].outputs["el"].max == PV
+
+
+def test_aggregated_model_uses_typical_periods():
+    oemof_es = create_oemof_energysystem(
+        _energysystem(), datetime(2025, 1, 1), TIME_STEPS, 1.0, aggregation=AGGREGATION
+    )
+    model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    assert model.TSAM_MODE
+    assert len(model.TIMESTEPS) == 48
@@ -0,0 +1,56 @@
+import json
+import os
+
+from backend.app.results.store import DUMP_FILE, MANIFEST_FILE, result_store_path
+from backend.app.simulation.artifacts import compress_artifacts, evict_heavy_files, folder_size, open_artifact
+from backend.app.simulation.diagnostics import LP_EXPORT_FILENAME
+
+
+def _write(path: str, content: str = "x" * 4096):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wt") as f:
+        f.write(content)
+
+
+def _run_folder(folder: str, result_store: bool = True):
+    _write(os.path.join(folder, "converted_model.json"), json.dumps({"energysystem": [0.5] * 1000}, indent=4))
+    _write(os.path.join(folder, "log", "simulation_1.log"))
+    _write(os.path.join(folder, "log", "solver.log"))
+    _write(os.path.join(folder, "dump", DUMP_FILE))
+    _write(os.path.join(folder, "dump", LP_EXPORT_FILENAME))
+    if result_store:
+        _write(os.path.join(result_store_path(os.path.join(folder, "dump")), MANIFEST_FILE), "{}")
+
+
+def test_compressed_artifacts_stay_readable(tmp_path):
+    folder = str(tmp_path)
+    _run_folder(folder)
+    size = folder_size(folder)
+
+    assert compress_artifacts(folder) > 0
+    assert folder_size(folder) < size
+    assert not os.path.exists(os.path.join(folder, "converted_model.json"))
+
+    with open_artifact(os.path.join(folder, "converted_model.json")) as f:
+        assert json.loads(f.read()) == {"energysystem": [0.5] * 1000}
+    # the result store is read memory-mapped
+    assert os.path.isfile(os.path.join(result_store_path(os.path.join(folder, "dump")), MANIFEST_FILE))
+
+
+def test_eviction_keeps_results(tmp_path):
+    folder = str(tmp_path)
+    _run_folder(folder)
+    compress_artifacts(folder)
+
+    assert evict_heavy_files(folder) > 0
+    assert sorted(os.listdir(os.path.join(folder, "dump"))) == ["results"]
+    assert os.listdir(os.path.join(folder, "log")) == ["simulation_1.log.gz"]
+
+
+def test_eviction_keeps_dump_without_result_store(tmp_path):
+    folder = str(tmp_path)
+    _run_folder(folder, result_store=False)
+
+    evict_heavy_files(folder)
+
+    assert os.listdir(os.path.join(folder, "dump")) == [DUMP_FILE]
@@ -0,0 +1,87 @@
+import logging
+from datetime import datetime
+
+import pytest
+
+from backend.app.simulation.buildcache import BuildCache, BuiltModel, structure_key, update_model
+from backend.app.simulation.pipeline import create_oemof_energysystem, create_oemof_model
+from ensys.common.solver import solve_model, solver_available
+from ensys.common.types import Solver
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnGenericStorage, EnInvestment, EnSink, EnSource
+
+TIME_STEPS = 6
+TIME_INDEX = {"start_date": datetime(2025, 1, 1), "time_steps": TIME_STEPS, "interval": 1.0}
+DEMAND = [0.2, 0.5, 0.8, 0.4, 0.6, 0.3]
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+def _energysystem(grid_costs: float = 0.3, demand: float = 1.0, ep_costs: float = 0.1) -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=grid_costs)}))
+    energysystem.add(
+        EnSource(
+            label="pv",
+            outputs={"el": EnFlow(nominal_value=EnInvestment(ep_costs=ep_costs), max=[0, 0.5, 1, 0.5, 0, 0])},
+        )
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=demand, fix=DEMAND)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=EnInvestment(ep_costs=ep_costs / 2),
+            inflow_conversion_factor=1.0,
+            outflow_conversion_factor=1.0,
+            storage_costs=0.01,
+        )
+    )
+
+    return energysystem
+
+
+def _built(energysystem: EnEnergysystem) -> BuiltModel:
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), TIME_STEPS, 1.0)
+
+    return BuiltModel(oemof_es, create_oemof_model(oemof_es, None, logging.getLogger(__name__)))
+
+
+def test_structure_key_ignores_mutable_coefficients():
+    key = structure_key(_energysystem(), None, TIME_INDEX)
+
+    assert key == structure_key(_energysystem(0.5, 2.0, 0.05), None, TIME_INDEX)
+    assert key != structure_key(_energysystem(), [{"type": "emission_limit"}], TIME_INDEX)
+    assert key != structure_key(_energysystem(), None, {**TIME_INDEX, "time_steps": 24})
+
+    unfixed = _energysystem()
+    unfixed.sinks[0].inputs["el"].fix = None
+    assert key != structure_key(unfixed, None, TIME_INDEX)
+
+
+@requires_highs
+@pytest.mark.parametrize("coefficients", [(0.5, 2.0, 0.05), (0.1, 1.5, 0.5)])
+def test_updated_model_solves_like_a_new_model(coefficients):
+    built = _built(_energysystem())
+    solve_model(built.model, Solver.highs)
+
+    update_model(built, _energysystem(*coefficients))
+    solve_model(built.model, Solver.highs)
+
+    rebuilt = _built(_energysystem(*coefficients))
+    solve_model(rebuilt.model, Solver.highs)
+
+    assert built.model.objective() == pytest.approx(rebuilt.model.objective())
+
+
+def test_cache_drops_least_recently_used_model():
+    cache = BuildCache(size=2)
+    cache.put("a", BuiltModel(None, None))
+    cache.put("b", BuiltModel(None, None))
+    cache.get("a")
+    cache.put("c", BuiltModel(None, None))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
@@ -0,0 +1,153 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from backend.app.project.model import EnProjectDB
+from backend.app.scenario.model import EnScenarioDB
+from backend.app.simulation.diagnostics import write_compressed_lp
+from backend.app.simulation.isolation import SolveJob, build_model, load_energysystem
+from backend.app.simulation.model import EnSimulationDB, Status
+from backend.app.simulation.router import get_lp_export_endpoint
+from backend.app.simulation.service import read_lp_export_path, request_lp_export
+from backend.app.simulation.timing import StageTimer
+from backend.app.user.model import EnUserDB
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnModel, EnSink, EnSource
+
+TIME_STEPS = 4
+
+
+def _job(tmp_path, presolve: bool = False) -> SolveJob:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    # removed by the presolve, its flow is zero in every time step
+    energysystem.add(EnSource(label="pv", outputs={"el": EnFlow(nominal_value=0.0, variable_costs=0.1)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=5.0, fix=[0.5] * TIME_STEPS)}))
+
+    os.makedirs(tmp_path, exist_ok=True)
+    converted_model = os.path.join(tmp_path, "converted_model.json")
+    with open(converted_model, "wt") as f:
+        f.write(EnModel(energysystem=energysystem).model_dump_json())
+
+    return SolveJob(
+        converted_model=converted_model,
+        dump_path=os.path.join(tmp_path, "dump"),
+        start_date=datetime(2025, 1, 1),
+        time_steps=TIME_STEPS,
+        interval=1.0,
+        solver="highs",
+        presolve=presolve,
+    )
+
+
+def _write_lp(job: SolveJob) -> str:
+    logger = logging.getLogger(__name__)
+    energysystem = load_energysystem(job, StageTimer(), logger)
+    _, oemof_model = build_model(job, energysystem, StageTimer(), logger)
+
+    return write_compressed_lp(oemof_model, os.path.join(job.dump_path, "oemof_model.lp.gz"))
+
+
+def test_write_compressed_lp_round_trip(tmp_path):
+    lp_file = _write_lp(_job(tmp_path))
+
+    with gzip.open(lp_file, "rt") as f:
+        lp = f.read()
+
+    assert lp.startswith("\\* Source Pyomo model name=")
+    assert "\nmin \nobjective:" in lp and lp.rstrip().endswith("end")
+    assert "flow(grid_el_0)" in lp
+    # the export is renamed when complete
+    assert os.listdir(os.path.dirname(lp_file)) == ["oemof_model.lp.gz"]
+
+
+def test_lp_export_applies_the_presolve(tmp_path):
+    with gzip.open(_write_lp(_job(tmp_path / "full")), "rt") as f:
+        assert "flow(pv_el_0)" in f.read()
+
+    with gzip.open(_write_lp(_job(tmp_path / "presolved", presolve=True)), "rt") as f:
+        assert "flow(pv_el_0)" not in f.read()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        yield session
+
+
+def _simulation(db: Session, status: Status, simulation_settings: dict | None = None) -> EnSimulationDB:
+    # recent SQLModel versions only store timezone aware datetimes
+    now = datetime.now(timezone.utc)
+    user = EnUserDB(username="pytest", password="TestASas12,.", mail="test@localhost.de", date_joined=now)
+    db.add(user)
+    db.commit()
+    project = EnProjectDB(user_id=user.id, name="project", country="Germany", date_created=now, date_updated=now)
+    db.add(project)
+    db.commit()
+    scenario = EnScenarioDB(
+        name="scenario",
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        time_steps=TIME_STEPS,
+        project_id=project.id,
+        user_id=user.id,
+        simulation_settings=json.dumps(simulation_settings or {}),
+    )
+    db.add(scenario)
+    db.commit()
+    simulation = EnSimulationDB(
+        sim_token="lp-export-test", status=status.value, scenario_id=scenario.id, user_id=user.id, start_date=now
+    )
+    db.add(simulation)
+    db.commit()
+
+    return simulation
+
+
+def test_request_lp_export_conflicts(db):
+    simulation = _simulation(db, Status.STARTED)
+    user = db.get(EnUserDB, simulation.user_id)
+
+    with pytest.raises(HTTPException) as missing:
+        request_lp_export(simulation.id + 1, user, db)
+    assert missing.value.status_code == 404
+
+    with pytest.raises(HTTPException) as running:
+        request_lp_export(simulation.id, user, db)
+    assert running.value.status_code == 409
+
+    simulation.status = Status.FINISHED.value
+    db.commit()
+    scenario = db.get(EnScenarioDB, simulation.scenario_id)
+    for settings, detail in (
+        ({"diagnostics_level": "none"}, "disabled"),
+        ({"rolling_horizon": {"window_hours": 24}}, "rolling horizon"),
+    ):
+        scenario.simulation_settings = json.dumps(settings)
+        db.commit()
+
+        with pytest.raises(HTTPException, match=detail) as conflict:
+            request_lp_export(simulation.id, user, db)
+        assert conflict.value.status_code == 409
+
+
+def test_get_lp_export_without_export(db):
+    simulation = _simulation(db, Status.FINISHED)
+    token = db.get(EnUserDB, simulation.user_id).get_token()
+
+    assert not os.path.isfile(read_lp_export_path(simulation))
+    with pytest.raises(HTTPException) as missing:
+        asyncio.run(get_lp_export_endpoint(simulation.id, token, db))
+
+    assert missing.value.status_code == 404
+    assert missing.value.detail == "LP export not found."
@@ -0,0 +1,94 @@
+import json
+import logging
+from datetime import datetime
+
+from pyomo.environ import Var
+
+from backend.app.scenario.model import EnScenarioDB
+from backend.app.simulation.estimator import ModelEstimate, admit, estimate_energysystem
+from backend.app.simulation.pipeline import create_oemof_energysystem, create_oemof_model
+from backend.app.simulation.service import estimate_scenario
+from ensys.components import (
+    EnBus,
+    EnConverter,
+    EnEnergysystem,
+    EnFlow,
+    EnGenericStorage,
+    EnInvestment,
+    EnNonConvex,
+    EnSink,
+    EnSource,
+)
+
+TIME_STEPS = 24
+
+
+def _energysystem() -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnBus(label="gas"))
+    energysystem.add(EnSource(label="grid", outputs={"gas": EnFlow(variable_costs=0.05)}))
+    energysystem.add(EnSource(label="pv", outputs={"el": EnFlow(nominal_value=EnInvestment(ep_costs=600))}))
+    energysystem.add(
+        EnConverter(
+            label="chp",
+            inputs={"gas": EnFlow()},
+            outputs={"el": EnFlow(nominal_value=10.0, min=0.3, nonconvex=EnNonConvex(startup_costs=5))},
+            conversion_factors={"el": 0.4},
+        )
+    )
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=EnInvestment(ep_costs=300),
+            inflow_conversion_factor=0.95,
+            outflow_conversion_factor=0.95,
+        )
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=5.0, fix=[0.5] * TIME_STEPS)}))
+
+    return energysystem
+
+
+def test_estimate_matches_built_model():
+    energysystem = _energysystem()
+    estimate = estimate_energysystem(energysystem, TIME_STEPS)
+
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), TIME_STEPS, 1.0)
+    model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    variables = list(model.component_data_objects(Var))
+    integer_variables = [variable for variable in variables if not variable.is_continuous()]
+
+    assert abs(estimate.variables - len(variables)) <= 0.1 * len(variables)
+    assert abs(estimate.constraints - model.nconstraints()) <= 0.1 * model.nconstraints()
+    assert estimate.integer_variables == len(integer_variables)
+
+
+def test_admit_rejects_memory_and_defers_integers():
+    rejected = admit(ModelEstimate(memory_mb=9_000), max_memory_mb=8_000, max_integer_variables=100)
+    deferred = admit(ModelEstimate(integer_variables=500), max_memory_mb=8_000, max_integer_variables=100)
+
+    assert not rejected.admitted and "memory" in rejected.reason
+    assert deferred.admitted and deferred.deferred
+    assert admit(ModelEstimate(), max_memory_mb=8_000, max_integer_variables=100).reason is None
+
+
+def test_estimate_scenario_rejects_invalid_components():
+    modeling_data = {"1": {"name": "Heat pump", "class": "heatPump", "data": {}, "inputs": {}, "outputs": {}}}
+    scenario = EnScenarioDB(
+        name="Invalid",
+        start_date=datetime(2025, 1, 1),
+        time_steps=TIME_STEPS,
+        interval=1.0,
+        project_id=1,
+        user_id=1,
+        modeling_data=json.dumps(modeling_data),
+    )
+
+    admission = estimate_scenario(scenario)
+
+    assert not admission.admitted
+    assert "can not be converted" in admission.reason
@@ -0,0 +1,68 @@
+import json
+from datetime import datetime
+
+from backend.app.scenario.model import EnScenarioDB
+from backend.app.simulation.fingerprint import fingerprint_inputs, scenario_fingerprint
+
+MODELING_DATA = {
+    "1": {"name": "Bus", "class": "bus", "data": {}, "inputs": {}, "outputs": {}},
+    "2": {"name": "Sink", "class": "sink", "data": {"name": "Sink"}, "inputs": {}, "outputs": {}},
+}
+
+
+def _scenario(**kwargs) -> EnScenarioDB:
+    scenario_data = {
+        "name": "Fingerprint",
+        "start_date": datetime(2025, 1, 1),
+        "time_steps": 8760,
+        "interval": 1.0,
+        "project_id": 1,
+        "user_id": 1,
+        "constraints": "",
+        "modeling_data": json.dumps(MODELING_DATA),
+    }
+    scenario_data.update(kwargs)
+
+    return EnScenarioDB(**scenario_data)
+
+
+def test_fingerprint_ignores_formatting():
+    pretty_data = json.dumps(dict(reversed(MODELING_DATA.items())), indent=4)
+
+    assert scenario_fingerprint(_scenario()) == scenario_fingerprint(
+        _scenario(modeling_data=pretty_data, name="Copy")
+    )
+
+
+def test_fingerprint_changes_with_inputs():
+    fingerprint = scenario_fingerprint(_scenario())
+
+    assert fingerprint != scenario_fingerprint(_scenario(time_steps=24))
+    assert fingerprint != scenario_fingerprint(_scenario(interval=0.25))
+    assert fingerprint != scenario_fingerprint(_scenario(start_date=datetime(2026, 1, 1)))
+
+
+def test_fingerprint_includes_solver_options_but_not_threads():
+    fingerprint = scenario_fingerprint(_scenario())
+
+    assert fingerprint == scenario_fingerprint(
+        _scenario(simulation_settings=json.dumps({"solver_options": {"threads": 4}}))
+    )
+    assert fingerprint != scenario_fingerprint(
+        _scenario(simulation_settings=json.dumps({"solver_options": {"mip_gap": 0.05}}))
+    )
+
+
+def test_fingerprint_includes_presolve():
+    fingerprint = scenario_fingerprint(_scenario())
+
+    assert fingerprint == scenario_fingerprint(_scenario(simulation_settings=json.dumps({"presolve": False})))
+    assert fingerprint != scenario_fingerprint(_scenario(simulation_settings=json.dumps({"presolve": True})))
+    assert fingerprint_inputs(_scenario())["presolve"] is False
+
+
+def test_fingerprint_includes_solver():
+    fingerprint = scenario_fingerprint(_scenario())
+
+    assert fingerprint == scenario_fingerprint(_scenario(simulation_settings=json.dumps({"solver": "gurobi"})))
+    assert fingerprint != scenario_fingerprint(_scenario(simulation_settings=json.dumps({"solver": "highs"})))
@@ -0,0 +1,128 @@
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from backend.app.results.store import has_result_store
+from backend.app.simulation.isolation import (
+    SolveCancellation,
+    SolveJob,
+    SolveLimits,
+    SolveProcessError,
+    run_isolated,
+)
+from backend.benchmarks.samples import sample_energysystem
+from ensys.common.solver import solver_available
+from ensys.common.types import Solver
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnModel, EnSink, EnSource
+
+TIME_STEPS = 4
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+def _job(tmp_path) -> SolveJob:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=5.0, fix=[0.5] * TIME_STEPS)}))
+
+    converted_model = os.path.join(tmp_path, "converted_model.json")
+    with open(converted_model, "wt") as f:
+        f.write(EnModel(energysystem=energysystem).model_dump_json())
+
+    return SolveJob(
+        converted_model=converted_model,
+        dump_path=str(tmp_path),
+        start_date=datetime(2025, 1, 1),
+        time_steps=TIME_STEPS,
+        interval=1.0,
+        # not installed, the child fails in the solve stage
+        solver="missing_solver",
+    )
+
+
+def test_failed_solve_reports_stages_and_peak_memory(tmp_path):
+    with pytest.raises(SolveProcessError) as error:
+        run_isolated(_job(tmp_path), workdir=str(tmp_path), limits=SolveLimits())
+
+    assert "missing_solver" in str(error.value)
+    assert {"to_oemof", "build", "solve"} <= set(error.value.outcome.durations)
+    assert error.value.outcome.peak_memory_mb > 0
+
+
+def test_memory_limit_fails_child_not_worker(tmp_path):
+    # depending on where the allocation fails this is a MemoryError or an
+    # interpreter error, either way only the child fails
+    with pytest.raises(SolveProcessError) as error:
+        run_isolated(_job(tmp_path), workdir=str(tmp_path), limits=SolveLimits(memory_mb=200))
+
+    assert error.value.outcome.peak_memory_mb < 200
+
+
+def _mip_job(tmp_path) -> SolveJob:
+    time_steps = 2000
+    energysystem = sample_energysystem(time_steps, unit_commitment=True)
+
+    converted_model = os.path.join(tmp_path, "converted_model.json")
+    with open(converted_model, "wt") as f:
+        f.write(EnModel(energysystem=energysystem).model_dump_json())
+
+    return SolveJob(
+        converted_model=converted_model,
+        dump_path=str(tmp_path),
+        start_date=datetime(2025, 1, 1),
+        time_steps=time_steps,
+        interval=1.0,
+        solver="highs",
+        cmdline_options={"log_file": os.path.join(tmp_path, "solver.log")},
+    )
+
+
+def _cancel_at_first_solution(cancellation: SolveCancellation, solver_log: str):
+    # a row of the branch and bound table with a finite best solution
+    first_solution = re.compile(r"%\s+\S+\s+\d")
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if os.path.exists(solver_log):
+            with open(solver_log, "rt") as f:
+                if first_solution.search(f.read()):
+                    break
+        time.sleep(0.1)
+    cancellation.cancel()
+
+
+@requires_highs
+def test_cancelled_solve_keeps_incumbent(tmp_path):
+    job = _mip_job(tmp_path)
+    cancellation = SolveCancellation(os.path.join(tmp_path, "solve_cancel"), grace_seconds=60)
+    threading.Thread(
+        target=_cancel_at_first_solution,
+        args=(cancellation, job.cmdline_options["log_file"]),
+        daemon=True,
+    ).start()
+
+    outcome = run_isolated(job, workdir=str(tmp_path), limits=SolveLimits(), cancellation=cancellation)
+
+    assert outcome.cancelled and outcome.partial
+    assert outcome.error is None
+    assert outcome.gap > 0
+    assert has_result_store(str(tmp_path))
+    assert not os.path.exists(os.path.join(tmp_path, "tmp"))
+    assert not os.path.exists(cancellation.cancel_file)
+
+
+@requires_highs
+def test_cancelled_solve_without_solution(tmp_path):
+    job = _job(tmp_path).model_copy(update={"solver": "highs"})
+    cancellation = SolveCancellation(os.path.join(tmp_path, "solve_cancel"), grace_seconds=60)
+    cancellation.cancel()
+
+    outcome = run_isolated(job, workdir=str(tmp_path), limits=SolveLimits(), cancellation=cancellation)
+
+    assert outcome.cancelled and not outcome.partial
+    assert "cancelled" in outcome.error
+    assert not has_result_store(str(tmp_path))
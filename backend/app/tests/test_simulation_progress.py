@@ -0,0 +1,51 @@
+from backend.app.simulation.progress import SolverLogTailer, SolverProgress, parse_gurobi_line
+
+GUROBI_LOG = """Optimize a model with 52562 rows, 43803 columns and 122645 nonzeros
+Presolve time: 0.12s
+Presolved: 35041 rows, 35042 columns, 87602 nonzeros
+
+ Expl Unexpl |  Obj  Depth IntInf | Incumbent    BestBd   Gap | It/Node Time
+
+     0     0 123450.000    0    2          - 123450.000      -     -    1s
+H    0     0                    130000.00000 123450.000  5.04%     -    1s
+*    5     2               3    124000.00000 123600.000  0.32%  10.0    3s
+
+Explored 7 nodes (12100 simplex iterations) in 3.41 seconds (2.10 work units)
+Best objective 1.240000000000e+05, best bound 1.239000000000e+05, gap 0.0806%
+"""
+
+
+def test_parse_gurobi_node_log():
+    progress = SolverProgress()
+
+    for line in GUROBI_LOG.splitlines()[:9]:
+        parse_gurobi_line(line, progress)
+
+    assert progress.phase == "branch_and_bound"
+    assert progress.presolve_rows == 35041
+    assert progress.presolve_columns == 35042
+    assert progress.incumbent == 124000.0
+    assert progress.best_bound == 123600.0
+    assert abs(progress.gap - 0.0032) < 1e-9
+    assert progress.elapsed == 3.0
+
+
+def test_tailer_reads_incrementally(tmp_path):
+    logfile = tmp_path / "solver.log"
+    published = []
+    tailer = SolverLogTailer(logfile=str(logfile), publish=published.append)
+
+    # the solver is still writing the incumbent line
+    split_at = GUROBI_LOG.index("130000.00000")
+    logfile.write_text(GUROBI_LOG[:split_at])
+
+    assert tailer.read_new_lines()
+    assert tailer.progress.incumbent is None
+
+    with open(logfile, "at") as log:
+        log.write(GUROBI_LOG[split_at:])
+
+    final_progress = tailer.stop()
+    assert final_progress.phase == "finished"
+    assert final_progress.best_bound == 123900.0
+    assert published[-1] is final_progress
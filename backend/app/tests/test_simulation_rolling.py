@@ -0,0 +1,221 @@
+import logging
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from pyomo.core import Var, minimize
+from pyomo.core.base.symbol_map import SymbolMap
+from pyomo.opt import Solution, SolverResults, SolverStatus, TerminationCondition
+
+from backend.app.scenario.model import EnRollingHorizonSettings
+from backend.app.simulation.pipeline import create_oemof_energysystem
+from backend.app.simulation.rolling import (
+    check_rolling_horizon,
+    horizon_time_limit,
+    slice_energysystem,
+    solve_rolling_horizon,
+    stitch_results,
+    window_options,
+)
+from backend.app.simulation.timing import StageTimer
+from ensys.common import solver as solver_module
+from ensys.common.solver import Solver, solver_available
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnGenericStorage, EnInvestment, EnSink, EnSource
+
+TIME_STEPS = 8
+
+
+def _energysystem(pv_nominal_value=1.0) -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(
+        EnSource(label="pv", outputs={"el": EnFlow(nominal_value=pv_nominal_value, max=list(range(TIME_STEPS)))})
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1.0, fix=[0.5] * TIME_STEPS)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=4.0,
+            initial_storage_level=0.5,
+            inflow_conversion_factor=0.95,
+            outflow_conversion_factor=0.95,
+        )
+    )
+
+    return energysystem
+
+
+def test_slice_energysystem_cuts_profiles_and_carries_storage():
+    base = _energysystem()
+
+    window = slice_energysystem(base, TIME_STEPS, start=4, length=3, storage_levels={"battery": 0.25})
+
+    assert window.sources[0].outputs["el"].max == [4, 5, 6]
+    assert window.sinks[0].inputs["el"].fix == [0.5] * 3
+    assert window.generic_storages[0].initial_storage_level == 0.25
+    assert not window.generic_storages[0].balanced
+    assert base.sources[0].outputs["el"].max == list(range(TIME_STEPS))
+
+
+def test_slice_energysystem_keeps_balanced_over_the_whole_horizon():
+    window = slice_energysystem(_energysystem(), TIME_STEPS, start=0, length=TIME_STEPS, keep_balanced=True)
+
+    assert window.generic_storages[0].balanced
+
+
+def test_check_rolling_horizon_requires_dispatch_only():
+    check_rolling_horizon(_energysystem(), None)
+
+    with pytest.raises(ValueError, match="investments"):
+        check_rolling_horizon(_energysystem(pv_nominal_value=EnInvestment(ep_costs=100)), None)
+
+    with pytest.raises(ValueError, match="constraints"):
+        check_rolling_horizon(_energysystem(), [{"type": "emission_limit", "enabled": True, "values": {}}])
+
+    for limit in ("full_load_time_max", "full_load_time_min"):
+        energysystem = _energysystem()
+        setattr(energysystem.sources[0].outputs["el"], limit, 1000)
+        with pytest.raises(ValueError, match="full load times"):
+            check_rolling_horizon(energysystem, None)
+
+
+@pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+def test_solve_rolling_horizon_balances_the_last_window():
+    energysystem = _energysystem()
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=10)}))
+
+    oemof_es = solve_rolling_horizon(
+        energysystem,
+        datetime(2025, 1, 1),
+        TIME_STEPS,
+        1.0,
+        None,
+        Solver.highs.value,
+        {},
+        EnRollingHorizonSettings(window_hours=3, overlap_hours=1),
+        StageTimer(),
+        logging.getLogger(__name__),
+    )
+
+    battery = next(node for node in oemof_es.nodes if node.label == "battery")
+    content = oemof_es.results["main"][(battery, None)]["sequences"]["storage_content"]
+
+    assert content.iloc[-1] == pytest.approx(0.5 * 4.0)
+
+
+def test_stitch_results_keeps_window_parts():
+    oemof_es = create_oemof_energysystem(_energysystem(), datetime(2025, 1, 1), TIME_STEPS, 1.0)
+
+    def window(values):
+        return {
+            ("pv", "el"): {"sequences": pd.DataFrame({"flow": values}), "scalars": pd.Series(dtype=float)},
+        }
+
+    # two windows of 4 kept steps with 2 steps overlap, the last with the end point
+    stitched = stitch_results(
+        oemof_es,
+        [window([0, 1, 2, 3, 9, 9]), window([4, 5, 6, 7, None])],
+        kept_steps=[4, 4],
+    )
+
+    pv = next(node for node in oemof_es.nodes if node.label == "pv")
+    el = next(node for node in oemof_es.nodes if node.label == "el")
+    sequences = stitched[(pv, el)]["sequences"]
+
+    assert sequences["flow"].tolist()[:TIME_STEPS] == list(range(TIME_STEPS))
+    assert list(sequences.index) == list(oemof_es.timeindex)
+
+
+def test_window_options_share_the_time_limit():
+    options = {"TimeLimit": 60, "MIPGap": 0.01}
+
+    assert horizon_time_limit(options) == 60
+    assert horizon_time_limit({"time_limit": 30}) == 30
+    assert horizon_time_limit({"MIPGap": 0.01}) is None
+    assert window_options(options, 20) == {"TimeLimit": 20, "MIPGap": 0.01}
+    assert window_options(options, None) is options
+    # a window always gets some time
+    assert window_options(options, -5)["TimeLimit"] > 0
+
+
+class _TimeLimitSolver:
+    """Pyomo solver interface whose solves stop at their time limit with an incumbent."""
+
+    def __init__(self, time_limits: list):
+        self.time_limits = time_limits
+        self.options = {}
+
+    def solve(self, model, load_solutions=True, **kwargs):
+        self.time_limits.append(self.options["TimeLimit"])
+
+        symbol_map = SymbolMap()
+        solution = Solution()
+        for var in model.component_data_objects(Var):
+            solution.variable[symbol_map.getSymbol(var, lambda v: v.name)] = {"Value": 1.0}
+
+        solver_results = SolverResults()
+        solver_results.solver.status = SolverStatus.aborted
+        solver_results.solver.termination_condition = TerminationCondition.maxTimeLimit
+        solver_results.problem.sense = minimize
+        solver_results.problem.upper_bound = 1.2
+        solver_results.problem.lower_bound = 0.9
+        solver_results.problem.number_of_solutions = 1
+        solver_results.solution.insert(solution)
+        solver_results._smap = symbol_map
+
+        return solver_results
+
+
+def _dispatch_energysystem() -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=10)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1.0, fix=[0.5] * TIME_STEPS)}))
+
+    return energysystem
+
+
+def test_solve_rolling_horizon_keeps_windows_stopped_at_the_time_limit(monkeypatch):
+    time_limits = []
+    monkeypatch.setattr(solver_module, "SolverFactory", lambda name: _TimeLimitSolver(time_limits))
+
+    oemof_es = solve_rolling_horizon(
+        _dispatch_energysystem(),
+        datetime(2025, 1, 1),
+        TIME_STEPS,
+        1.0,
+        None,
+        Solver.gurobi_direct.value,
+        {"TimeLimit": 30},
+        EnRollingHorizonSettings(window_hours=3, overlap_hours=1),
+        StageTimer(),
+        logging.getLogger(__name__),
+    )
+
+    # three windows share the time limit of the whole horizon, the time a
+    # window did not use is passed on to the remaining windows
+    assert time_limits == pytest.approx([10, 15, 30], abs=1)
+    assert oemof_es.results["meta"]["limit_reached"]
+    assert oemof_es.results["meta"]["gap"] == pytest.approx(0.25)
+
+
+def test_solve_rolling_horizon_stops_when_cancelled(tmp_path):
+    cancel_file = tmp_path / "solve_cancel"
+    cancel_file.touch()
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        solve_rolling_horizon(
+            _dispatch_energysystem(),
+            datetime(2025, 1, 1),
+            TIME_STEPS,
+            1.0,
+            None,
+            Solver.highs.value,
+            {},
+            EnRollingHorizonSettings(window_hours=3, overlap_hours=1),
+            StageTimer(),
+            logging.getLogger(__name__),
+            cancel_file=str(cancel_file),
+        )
@@ -0,0 +1,90 @@
+from collections import Counter
+from datetime import datetime, timedelta
+
+from celery import states
+
+from backend.app.simulation.estimator import ModelEstimate
+from backend.app.simulation.model import EnSimulationDB, Status
+from backend.app.simulation.scheduler import (
+    LARGE_QUEUE,
+    SMALL_QUEUE,
+    classify_queue,
+    find_stale,
+    running_sweep_chunks,
+    select_next,
+)
+
+
+def _queued(simulation_id: int, user_id: int) -> EnSimulationDB:
+    return EnSimulationDB(
+        id=simulation_id,
+        sim_token=f"token-{simulation_id}",
+        status=Status.QUEUED.value,
+        scenario_id=1,
+        user_id=user_id,
+        queue=LARGE_QUEUE,
+    )
+
+
+def test_classify_queue_by_size():
+    small = ModelEstimate(variables=8760 * 10, constraints=8760 * 8)
+    large = ModelEstimate(variables=35040 * 10, constraints=35040 * 8)
+
+    assert classify_queue(small, small_max_size=500_000) == SMALL_QUEUE
+    assert classify_queue(large, small_max_size=500_000) == LARGE_QUEUE
+    assert classify_queue(small, small_max_size=500_000, deferred=True) == LARGE_QUEUE
+
+
+def test_select_next_round_robin_across_users():
+    # user 1 submitted a batch before user 2 submitted a single job
+    queued = [_queued(1, 1), _queued(2, 1), _queued(3, 1), _queued(4, 2)]
+    running = Counter()
+    order = []
+
+    while (simulation := select_next(queued, running, max_running_per_user=2)) is not None:
+        queued.remove(simulation)
+        running[simulation.user_id] += 1
+        order.append(simulation.id)
+
+    assert order == [1, 4, 2]
+    # the third job of user 1 waits for a free run of that user
+    assert [simulation.id for simulation in queued] == [3]
+
+
+def test_running_sweep_chunks_count_against_the_user():
+    # user 1 runs a sweep with 3 chunks, the second sweep has a single variant left
+    chunks = running_sweep_chunks([(1, 3, 10), (1, 4, 1), (2, 2, 2)])
+
+    assert chunks == Counter({1: 4, 2: 2})
+    assert chunks.total() == 6
+
+    # the sweep of user 1 takes its share, so a job of user 3 goes first
+    queued = [_queued(1, 1), _queued(2, 3)]
+    assert select_next(queued, chunks, max_running_per_user=5).id == 2
+    assert select_next(queued[:1], chunks, max_running_per_user=4) is None
+
+
+def test_find_stale_running_simulations():
+    now = datetime(2025, 1, 1, 12)
+    running = [_queued(simulation_id, user_id=1) for simulation_id in range(1, 6)]
+    for simulation in running:
+        simulation.status = Status.STARTED.value
+        # queued for a day, dispatched recently
+        simulation.start_date = now - timedelta(days=1)
+        simulation.dispatch_date = now - timedelta(minutes=10)
+    # dispatched before the worker was restarted, the task id is unknown
+    running[4].dispatch_date = now - timedelta(hours=3)
+
+    task_states = {
+        "token-1": states.PENDING,
+        "token-2": states.FAILURE,
+        "token-3": states.REVOKED,
+        "token-4": states.STARTED,
+        "token-5": states.PENDING,
+    }
+
+    stale = find_stale(running, task_states.get, now)
+    assert [simulation.id for simulation in stale] == [2, 3]
+
+    stale = find_stale(running, task_states.get, now, max_age_seconds=3600)
+    assert [simulation.id for simulation in stale] == [2, 3, 5]
@@ -0,0 +1,97 @@
+import json
+import os
+
+import numpy as np
+
+from backend.app.simulation.artifacts import compress_artifacts
+from backend.app.simulation.snapshot import (
+    SERIES_FILE,
+    SNAPSHOT_FOLDER,
+    read_converted_model,
+    read_modeling_data,
+    write_snapshot,
+)
+from backend.benchmarks.samples import load_profile, sample_energysystem
+from ensys.components import EnModel
+
+TIME_STEPS = 168
+
+
+def _modeling_data() -> dict:
+    return {
+        "drawflow": {
+            "Home": {
+                "data": {
+                    "1": {"name": "demand", "data": {"timeSeries": load_profile("demandprofile.csv", TIME_STEPS)}},
+                    "2": {"name": "steps", "data": {"timeSeries": list(range(TIME_STEPS)), "short": [1, 2.5]}},
+                }
+            }
+        }
+    }
+
+
+def test_snapshot_restores_inputs(tmp_path):
+    folder = str(tmp_path)
+    model = EnModel(energysystem=sample_energysystem(TIME_STEPS, districts=2))
+    modeling_data = _modeling_data()
+
+    write_snapshot(folder, modeling_data, model)
+
+    assert read_converted_model(folder) == model
+    restored = read_modeling_data(folder)
+    assert restored == modeling_data
+    assert json.dumps(restored) == json.dumps(modeling_data)
+
+
+def test_snapshot_stores_profiles_once(tmp_path):
+    folder = str(tmp_path)
+    model = EnModel(energysystem=sample_energysystem(TIME_STEPS, districts=4))
+
+    write_snapshot(folder, _modeling_data(), model)
+
+    # demand, feed-in and the integer steps of the modeling data; the districts
+    # and both documents share the demand profile
+    series = np.load(os.path.join(folder, SNAPSHOT_FOLDER, SERIES_FILE))
+    assert len(series) <= 4 * TIME_STEPS
+    with open(os.path.join(folder, SNAPSHOT_FOLDER, "converted_model.json"), "rt") as f:
+        assert len(f.read()) < len(model.model_dump_json(context={"shared_timeseries": False})) / 3
+
+
+def test_snapshot_is_readable_after_compression(tmp_path):
+    folder = str(tmp_path)
+    model = EnModel(energysystem=sample_energysystem(TIME_STEPS))
+    write_snapshot(folder, _modeling_data(), model)
+
+    compress_artifacts(folder)
+
+    assert read_converted_model(folder) == model
+
+
+def test_converted_model_of_older_runs(tmp_path):
+    folder = str(tmp_path)
+    model = EnModel(energysystem=sample_energysystem(TIME_STEPS))
+    with open(os.path.join(folder, "converted_model.json"), "wt") as f:
+        f.write(model.model_dump_json(indent=4))
+
+    assert read_converted_model(folder) == model
+    assert read_converted_model(os.path.join(folder, "converted_model.json")) == model
+
+
+def test_snapshot_stores_mixed_profiles(tmp_path):
+    folder = str(tmp_path)
+    model = EnModel(energysystem=sample_energysystem(TIME_STEPS))
+    # the GUI writes the whole numbers of a profile, e.g. the nights of the
+    # feed-in, as integers
+    feedin = [int(value) if value.is_integer() else value for value in load_profile("feedinprofile.csv", TIME_STEPS)]
+    modeling_data = {"1": {"name": "pv", "data": {"timeSeries": feedin}}}
+
+    write_snapshot(folder, modeling_data, model)
+
+    restored = read_modeling_data(folder)
+    assert json.dumps(restored) == json.dumps(modeling_data)
+    assert [type(value) for value in restored["1"]["data"]["timeSeries"]] == [type(value) for value in feedin]
+    # the feed-in of the modeling data shares the profile of the converted model
+    series = np.load(os.path.join(folder, SNAPSHOT_FOLDER, SERIES_FILE))
+    assert len(series) == 2 * TIME_STEPS
+    with open(os.path.join(folder, SNAPSHOT_FOLDER, "modeling_data.json"), "rt") as f:
+        assert "$mixed_series" in f.read()
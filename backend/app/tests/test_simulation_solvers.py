@@ -0,0 +1,251 @@
+import logging
+import os
+from datetime import datetime
+
+import pytest
+
+from pydantic import ValidationError
+from pyomo.core import Var, minimize
+from pyomo.core.base.symbol_map import SymbolMap
+from pyomo.opt import Solution, SolverResults, SolverStatus, TerminationCondition
+
+from backend.app.results.automatic_cost_calc import cost_calculation_from_energysystem
+from backend.app.scenario.model import EnScenario, EnSimulationSettings, EnSolverOptions
+from backend.app.simulation import solvers
+from backend.app.simulation.pipeline import collect_results, create_oemof_energysystem, create_oemof_model
+from backend.app.simulation.solvers import reached_limit, solver_interface, solver_options, solver_threads
+from backend.benchmarks.samples import sample_energysystem
+from ensys.common import solver as solver_module
+from ensys.common.solver import SolverStoppedError, solve_model, solver_available
+from ensys.common.types import Solver
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnSink, EnSource
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+def test_solver_interface_prefers_in_memory_interface(monkeypatch):
+    monkeypatch.setattr(solvers, "gurobipy_available", lambda: True)
+
+    assert solver_interface(Solver.gurobi) == Solver.gurobi_direct
+    assert solver_interface(Solver.gurobi, in_memory=False) == Solver.gurobi
+    assert solver_interface(Solver.gurobi_persistent) == Solver.gurobi_persistent
+    assert solver_interface(Solver.cbc) == Solver.cbc
+
+
+def test_solver_interface_falls_back_without_gurobipy(monkeypatch):
+    monkeypatch.setattr(solvers, "gurobipy_available", lambda: False)
+
+    assert solver_interface(Solver.gurobi) == Solver.gurobi
+
+
+def test_solver_interfaces_report_the_chosen_interface(monkeypatch):
+    monkeypatch.setattr(solvers, "gurobipy_available", lambda: True)
+    monkeypatch.setattr(solvers, "solver_available", lambda solver: solver != Solver.cbc)
+
+    assert solvers.solver_interfaces() == {"gurobi": "gurobi_direct", "highs": "highs", "cbc": None}
+    assert solvers.solver_interfaces(in_memory=False)["gurobi"] == "gurobi"
+
+
+def test_solver_options_use_gurobi_parameter_names():
+    options = solver_options(
+        Solver.gurobi_direct, "solver.log", {"MIP_GAP": 0.01, "threads": 4, "Presolve": 2}
+    )
+
+    assert options == {
+        "LogFile": "solver.log",
+        "LogToConsole": 0,
+        "OutputFlag": 1,
+        "MIPGap": 0.01,
+        "Threads": 4,
+        "Presolve": 2,
+    }
+    assert solver_options(Solver.cbc, "solver.log", {"ratioGap": 0.01}) == {"ratioGap": 0.01}
+
+
+def test_solver_options_use_highs_option_names():
+    options = solver_options(Solver.highs, "solver.log", {"threads": 2, "timelimit": 60, "MIP_GAP": 0.01})
+
+    assert options == {
+        "log_file": "solver.log",
+        "log_to_console": False,
+        "output_flag": True,
+        "threads": 2,
+        "time_limit": 60,
+        "mip_rel_gap": 0.01,
+    }
+
+
+def test_solver_options_are_whitelisted():
+    options = EnSolverOptions(mip_gap=0.01, time_limit=600, method=2, threads=8)
+    assert solver_options(Solver.highs, "solver.log", options.model_dump(exclude_none=True), threads=2) == {
+        "log_file": "solver.log",
+        "log_to_console": False,
+        "output_flag": True,
+        "mip_rel_gap": 0.01,
+        "time_limit": 600,
+        "threads": 2,
+    }
+
+    with pytest.raises(ValidationError):
+        EnSolverOptions.model_validate({"Presolve": 2})
+    with pytest.raises(ValidationError):
+        EnScenario(
+            name="Scenario",
+            start_date=0,
+            project_id=1,
+            simulation_settings='{"solver_options": {"mip_gap": 2}}',
+        )
+
+
+def test_scenario_selects_a_supported_solver():
+    assert EnSimulationSettings().solver == Solver.gurobi
+    assert EnSimulationSettings.model_validate_json('{"solver": "highs"}').solver == Solver.highs
+
+    with pytest.raises(ValidationError, match="not supported"):
+        EnSimulationSettings(solver=Solver.kiwi)
+
+
+def test_solver_threads_divide_the_budget():
+    assert solver_threads(None, budget=16, concurrency=4) == 4
+    assert solver_threads(2, budget=16, concurrency=4) == 2
+    assert solver_threads(8, budget=16, concurrency=4) == 4
+    assert solver_threads(None, budget=16, concurrency=2, parallel=4) == 2
+    assert solver_threads(None, budget=2, concurrency=4) == 1
+
+
+@requires_highs
+def test_highs_solves_in_memory(tmp_path):
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=2.0, fix=[0.5, 1.0])}))
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), 2, 1.0)
+    oemof_model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    log_file = os.path.join(tmp_path, "solver.log")
+    solve_model(oemof_model, Solver.highs, cmdline_options=solver_options(Solver.highs, log_file, {"threads": 1}))
+    collect_results(oemof_es, oemof_model, None)
+
+    assert oemof_es.results["meta"]["objective"] == pytest.approx(0.9)
+    assert oemof_model.dual is None
+    # solved without writing an LP file
+    assert os.listdir(tmp_path) == ["solver.log"]
+
+
+def test_reached_limit():
+    assert reached_limit(True, 0.2, None)
+    assert reached_limit(False, 0.02, mip_gap=0.05)
+    # proven optimal within the default tolerance of the solvers
+    assert not reached_limit(False, 0.0, mip_gap=0.05)
+    assert not reached_limit(False, 0.02, mip_gap=None)
+    assert not reached_limit(False, None, mip_gap=0.05)
+
+
+@requires_highs
+def test_highs_time_limit_keeps_incumbent(tmp_path):
+    time_steps = 2000
+    oemof_es = create_oemof_energysystem(
+        sample_energysystem(time_steps, unit_commitment=True), datetime(2025, 1, 1), time_steps, 1.0
+    )
+    oemof_model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+    log_file = os.path.join(tmp_path, "solver.log")
+    with pytest.raises(SolverStoppedError) as stopped:
+        solve_model(
+            oemof_model,
+            Solver.highs,
+            cmdline_options=solver_options(Solver.highs, log_file, {"time_limit": 2, "threads": 1}),
+        )
+    collect_results(oemof_es, oemof_model, None)
+
+    assert stopped.value.limit_reached
+    assert stopped.value.gap > 0
+    assert oemof_es.results["meta"]["objective"] > 0
+    assert cost_calculation_from_energysystem(oemof_es).sum().sum() > 0
+
+
+class _StoppedSolver:
+    """Pyomo solver interface whose solve stopped, with an incumbent if `objective` is set."""
+
+    def __init__(self, termination_condition, objective: float | None = 1.2, bound: float | None = 0.9):
+        self.termination_condition = termination_condition
+        self.objective = objective
+        self.bound = bound
+        self.options = {}
+
+    def solve(self, model, load_solutions=True, **kwargs):
+        assert not load_solutions
+
+        symbol_map = SymbolMap()
+        solution = Solution()
+        if self.objective is not None:
+            # SolCount > 0: the values of the incumbent, as the Gurobi interfaces report them
+            for var in model.component_data_objects(Var):
+                solution.variable[symbol_map.getSymbol(var, lambda v: v.name)] = {"Value": 1.0}
+
+        solver_results = SolverResults()
+        solver_results.solver.status = SolverStatus.aborted
+        solver_results.solver.termination_condition = self.termination_condition
+        solver_results.problem.sense = minimize
+        solver_results.problem.upper_bound = self.objective
+        solver_results.problem.lower_bound = self.bound
+        solver_results.problem.number_of_solutions = 0 if self.objective is None else 1
+        solver_results.solution.insert(solution)
+        solver_results._smap = symbol_map
+
+        return solver_results
+
+
+def _small_model():
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=2.0, fix=[0.5, 1.0])}))
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), 2, 1.0)
+
+    return create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+
+def test_gurobi_interrupt_keeps_incumbent(monkeypatch):
+    # gurobipy reports an interrupted solve as aborted with termination condition error
+    monkeypatch.setattr(solver_module, "SolverFactory", lambda name: _StoppedSolver(TerminationCondition.error))
+    oemof_model = _small_model()
+
+    with pytest.raises(SolverStoppedError) as stopped:
+        solve_model(oemof_model, Solver.gurobi_direct)
+
+    assert not stopped.value.limit_reached
+    assert stopped.value.gap == pytest.approx(0.25)
+    assert [var.value for var in oemof_model.flow.values() if not var.fixed] == [1.0, 1.0]
+    assert oemof_model.solver_results is stopped.value.solver_results
+
+
+def test_gurobi_interrupt_without_incumbent_fails(monkeypatch):
+    monkeypatch.setattr(
+        solver_module, "SolverFactory", lambda name: _StoppedSolver(TerminationCondition.error, None, None)
+    )
+    oemof_model = _small_model()
+
+    with pytest.raises(RuntimeError) as failed:
+        solve_model(oemof_model, Solver.gurobi_direct)
+
+    assert not isinstance(failed.value, SolverStoppedError)
+    assert [var.value for var in oemof_model.flow.values() if not var.fixed] == [None, None]
+
+
+@pytest.mark.parametrize(
+    "solver, bound", [(Solver.gurobi, 0.9), (Solver.gurobi_direct, 0.9), (Solver.cbc, 0.9), (Solver.cbc, None)]
+)
+def test_time_limit_keeps_incumbent(monkeypatch, solver, bound):
+    # Gurobi and CBC report a reached time limit as aborted with maxTimeLimit
+    monkeypatch.setattr(
+        solver_module, "SolverFactory", lambda name: _StoppedSolver(TerminationCondition.maxTimeLimit, 1.2, bound)
+    )
+    oemof_model = _small_model()
+
+    with pytest.raises(SolverStoppedError) as stopped:
+        solve_model(oemof_model, solver, cmdline_options={"TimeLimit": 2})
+
+    assert stopped.value.limit_reached
+    assert reached_limit(stopped.value.limit_reached, stopped.value.gap, mip_gap=None)
+    assert [var.value for var in oemof_model.flow.values() if not var.fixed] == [1.0, 1.0]
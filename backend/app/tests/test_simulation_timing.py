@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+import pytest
+from prometheus_client import CollectorRegistry, Histogram
+
+from backend.app.simulation.timing import StageTimer, node_count, queue_wait_seconds, size_bucket
+from ensys.components import EnBus, EnConverter, EnEnergysystem, EnFlow, EnGenericStorage, EnSink, EnSource
+
+
+def _histogram() -> tuple[Histogram, CollectorRegistry]:
+    registry = CollectorRegistry()
+    histogram = Histogram("stage_seconds", "Stage durations", ["stage", "size"], registry=registry)
+
+    return histogram, registry
+
+
+def _observed(registry: CollectorRegistry, stage: str, size: str) -> float | None:
+    return registry.get_sample_value("stage_seconds_count", {"stage": stage, "size": size})
+
+
+def test_size_bucket_labels():
+    assert size_bucket(time_steps=8760, component_count=5) == "xs"
+    assert size_bucket(time_steps=8760, component_count=50) == "s"
+    assert size_bucket(time_steps=35040, component_count=100) == "m"
+    assert size_bucket(time_steps=35040, component_count=1000) == "l"
+    assert size_bucket(time_steps=35040, component_count=2000) == "xl"
+
+
+def test_node_count_counts_converted_components():
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnBus(label="gas"))
+    energysystem.add(EnSource(label="grid", outputs={"gas": EnFlow()}))
+    energysystem.add(
+        EnConverter(label="chp", inputs={"gas": EnFlow()}, outputs={"el": EnFlow()}, conversion_factors={"el": 0.4})
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1.0, fix=[0.5] * 4)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=4.0,
+            inflow_conversion_factor=0.95,
+            outflow_conversion_factor=0.95,
+        )
+    )
+
+    assert node_count(energysystem) == 6
+
+
+def test_queue_wait_seconds():
+    created = datetime(2025, 1, 1, 12)
+
+    assert queue_wait_seconds(created, created + timedelta(minutes=2, seconds=3)) == 123
+    # the clock of the worker is behind the clock of the API
+    assert queue_wait_seconds(created, created - timedelta(seconds=1)) == 0
+
+
+def test_stage_timer_records_stages():
+    histogram, registry = _histogram()
+    timer = StageTimer(histogram=histogram, size="s")
+
+    with timer.stage("build"):
+        pass
+    with pytest.raises(ValueError):
+        with timer.stage("solve"):
+            raise ValueError("infeasible")
+    timer.record("solve", 1.5)
+
+    # failing stages are recorded and repeated stages add up
+    assert set(timer.durations) == {"build", "solve"}
+    assert timer.durations["solve"] == pytest.approx(1.5, abs=0.01)
+    assert _observed(registry, "build", "s") == 1
+    assert _observed(registry, "solve", "s") == 2
+
+
+def test_stage_timer_reports_stages_once_the_size_is_known():
+    histogram, registry = _histogram()
+    timer = StageTimer()
+
+    timer.record("convert", 0.2)
+    timer.durations["queue"] = 4.0
+    timer.report(histogram, "m")
+    timer.record("build", 1.0)
+
+    assert _observed(registry, "convert", "m") == 1
+    assert _observed(registry, "build", "m") == 1
+    # the queue wait is no stage of the task
+    assert _observed(registry, "queue", "m") is None
+    assert timer.durations == {"convert": 0.2, "queue": 4.0, "build": 1.0}
@@ -0,0 +1,60 @@
+import logging
+from datetime import datetime
+
+import pandas as pd
+
+from backend.app.simulation.pipeline import create_oemof_energysystem, create_oemof_model
+from backend.app.simulation.warmstart import apply_warm_start, solution_from_results
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnNonConvex, EnSink, EnSource
+
+TIME_STEPS = 4
+
+
+def _model():
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(
+        EnSource(
+            label="gen",
+            outputs={"el": EnFlow(nominal_value=10.0, min=0.2, variable_costs=0.3, nonconvex=EnNonConvex())},
+        )
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=5.0, fix=[0.5] * TIME_STEPS)}))
+
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), TIME_STEPS, 1.0)
+
+    return create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+
+
+def _results() -> dict:
+    index = pd.date_range("2025-01-01", periods=TIME_STEPS, freq="h")
+
+    return {
+        ("gen", "el"): {
+            "sequences": pd.DataFrame({"flow": [2.5] * TIME_STEPS, "status": [0.9999] * TIME_STEPS}, index=index),
+            "scalars": pd.Series(dtype=float),
+        },
+        ("el", "demand"): {
+            "sequences": pd.DataFrame({"flow": [2.5] * TIME_STEPS}, index=index),
+            "scalars": pd.Series(dtype=float),
+        },
+        ("removed", "el"): {
+            "sequences": pd.DataFrame({"flow": [1.0] * TIME_STEPS}, index=index),
+            "scalars": pd.Series(dtype=float),
+        },
+    }
+
+
+def test_warm_start_matches_variables_by_label():
+    model = _model()
+
+    assigned, assigned_integer = apply_warm_start(model, solution_from_results(_results()))
+
+    # fixed demand flows and components missing in the new model are skipped
+    assert assigned == 2 * TIME_STEPS
+    assert assigned_integer == TIME_STEPS
+
+    gen = next(node for node in model.es.nodes if node.label == "gen")
+    bus = next(node for node in model.es.nodes if node.label == "el")
+    assert model.flow[gen, bus, 0].value == 2.5
+    assert model.NonConvexFlowBlock.status[gen, bus, 0].value == 1
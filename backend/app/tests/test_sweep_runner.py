@@ -0,0 +1,76 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from backend.app.results.store import has_result_store
+from backend.app.simulation.isolation import SolveLimits, SolveProcessError, run_isolated
+from backend.app.sweep import runner
+from backend.app.sweep.model import EnSweepParameter, SweepParameterType
+from backend.app.sweep.runner import SweepChunkJob, SweepVariantJob, read_variant_outcomes
+from ensys.common.solver import solver_available
+from ensys.common.types import Solver
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnModel, EnSink, EnSource
+
+TIME_STEPS = 4
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+def _job(tmp_path, variants: list[dict], solver: str = "highs") -> SweepChunkJob:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="grid", outputs={"el": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=5.0, fix=[0.5] * TIME_STEPS)}))
+
+    converted_model = os.path.join(tmp_path, "converted_model.json")
+    with open(converted_model, "wt") as f:
+        f.write(EnModel(energysystem=energysystem).model_dump_json())
+
+    return SweepChunkJob(
+        converted_model=converted_model,
+        outcome_file=os.path.join(tmp_path, "variant_outcomes.jsonl"),
+        start_date=datetime(2025, 1, 1),
+        time_steps=TIME_STEPS,
+        interval=1.0,
+        parameters=[
+            EnSweepParameter(type=SweepParameterType.DEMAND_SCALING, component="demand", values=[1.0, 2.0]),
+        ],
+        variants=[
+            SweepVariantJob(
+                simulation_id=simulation_id,
+                variant=variant,
+                dump_path=os.path.join(tmp_path, str(simulation_id)),
+            )
+            for simulation_id, variant in enumerate(variants, start=1)
+        ],
+        solver=solver,
+    )
+
+
+@requires_highs
+def test_chunk_solves_variants_in_child(tmp_path):
+    job = _job(tmp_path, [{"demand_scaling.demand": 1.0}, {"demand_scaling.demand": 2.0}, {}])
+
+    outcome = run_isolated(job, workdir=str(tmp_path), limits=SolveLimits(), entry=runner.__name__)
+    variant_outcomes = read_variant_outcomes(job.outcome_file)
+
+    assert outcome.error is None and outcome.peak_memory_mb > 0
+    assert variant_outcomes[1].objective == pytest.approx(0.3 * 2.5 * TIME_STEPS)
+    assert variant_outcomes[2].objective == pytest.approx(0.3 * 5.0 * TIME_STEPS)
+    assert {"update", "solve", "dump"} <= set(variant_outcomes[2].durations)
+    assert has_result_store(job.variants[1].dump_path)
+    # a failing variant does not stop the chunk
+    assert "demand_scaling.demand" in variant_outcomes[3].error
+
+
+def test_killed_chunk_reports_error_and_peak_memory(tmp_path):
+    job = _job(tmp_path, [{"demand_scaling.demand": 1.0}], solver="missing_solver")
+
+    with pytest.raises(SolveProcessError) as error:
+        run_isolated(job, workdir=str(tmp_path), limits=SolveLimits(memory_mb=200), entry=runner.__name__)
+
+    # the parent maps the variants without an outcome to the error of the child
+    assert error.value.outcome.peak_memory_mb is not None
+    assert read_variant_outcomes(job.outcome_file) == {}
+    assert not os.path.exists(os.path.join(tmp_path, "tmp"))
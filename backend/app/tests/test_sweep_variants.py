@@ -0,0 +1,42 @@
+from backend.app.sweep.model import EnSweepParameter, SweepParameterType
+from backend.app.sweep.variants import apply_variant, expand_grid
+from ensys.components import EnBus, EnEnergysystem, EnFlow, EnInvestment, EnSink, EnSource
+
+PARAMETERS = [
+    EnSweepParameter(component="pv", path="outputs.el.nominal_value.ep_costs", values=[500, 800]),
+    EnSweepParameter(type=SweepParameterType.DEMAND_SCALING, component="demand", values=[1.0, 1.5]),
+    EnSweepParameter(type=SweepParameterType.EMISSION_LIMIT, values=[1000]),
+]
+
+
+def _energysystem() -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(EnSource(label="pv", outputs={"el": EnFlow(nominal_value=EnInvestment(ep_costs=600))}))
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=10.0, fix=[0.5, 1.0])}))
+
+    return energysystem
+
+
+def test_expand_grid_builds_all_combinations():
+    variants = expand_grid(PARAMETERS)
+
+    assert len(variants) == 4
+    assert variants[-1] == {
+        "pv.outputs.el.nominal_value.ep_costs": 800,
+        "demand_scaling.demand": 1.5,
+        "emission_limit": 1000,
+    }
+
+
+def test_apply_variant_keeps_base_unchanged():
+    base = _energysystem()
+
+    energysystem, constraints = apply_variant(base, None, PARAMETERS, expand_grid(PARAMETERS)[-1])
+
+    assert energysystem.sources[0].outputs["el"].nominal_value.ep_costs == 800
+    assert energysystem.sinks[0].inputs["el"].fix == [0.75, 1.5]
+    assert constraints == [{"type": "emission_limit", "enabled": True, "values": {"limit": 1000.0}}]
+
+    assert base.sources[0].outputs["el"].nominal_value.ep_costs == 600
+    assert base.sinks[0].inputs["el"].fix == [0.5, 1.0]
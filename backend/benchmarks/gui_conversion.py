@@ -0,0 +1,53 @@
+"""
+GUI Conversion Benchmark
+========================
+
+Measures `convert_gui_json_to_ensys` against the size of the drawflow sent by
+the GUI. The drawflow of the sample district is replicated until it has
+about the requested number of nodes; the conversion is timed after the JSON
+of the scenario has been parsed.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.gui_conversion [--nodes 10 100 500 2000] [--time-steps N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from backend.app.auxillary import convert_gui_json_to_ensys
+from .samples import sample_drawflow
+
+# nodes of a district in the sample drawflow
+DISTRICT_NODES = 8
+
+
+def best_of(repeat: int, flowchart_data: dict) -> float:
+    """Return the shortest wall time of `repeat` conversions of the drawflow."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert_gui_json_to_ensys(flowchart_data=flowchart_data)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--time-steps", type=int, default=8760)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.time_steps} time steps, best of {args.repeat}")
+    print(f"{'nodes':<10}{'convert':>12}{'per node':>12}")
+
+    for nodes in args.nodes:
+        flowchart_data = sample_drawflow(args.time_steps, max(1, round(nodes / DISTRICT_NODES)))
+        duration = best_of(args.repeat, flowchart_data)
+
+        print(f"{len(flowchart_data):<10}{duration * 1e3:>10.1f}ms{duration / len(flowchart_data) * 1e6:>10.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Model Validation Benchmark
+========================
+
+Measures the cost of reading a converted model against the model size: parsing
+the JSON, validating it with `EnModel.model_validate` (as for user input),
+constructing it with `EnModel.construct_trusted` (as for data written by the
+backend) and reading it from the compact input snapshot of a run.
+
+The sample energy system with unit commitment is replicated into more and more
+districts over a year of hourly time steps.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.model_validation [--districts 1 4 16 64] [--repeat N]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+from backend.app.simulation.snapshot import read_converted_model, write_snapshot
+from ensys.components import EnModel
+from .samples import sample_energysystem
+
+TIME_STEPS = 8760
+
+STAGES = ("parse", "validate", "trusted", "snapshot")
+
+
+def best_of(repeat: int, function) -> float:
+    """Return the shortest wall time of `repeat` calls of `function`."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--districts", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{TIME_STEPS} time steps, best of {args.repeat}")
+    print(f"{'districts':<10}{'JSON':>10}" + "".join(f"{stage:>10}" for stage in STAGES))
+
+    for districts in args.districts:
+        model = EnModel(energysystem=sample_energysystem(TIME_STEPS, districts, unit_commitment=True))
+        document = model.model_dump_json()
+        data = json.loads(document)
+
+        with tempfile.TemporaryDirectory() as folder:
+            write_snapshot(folder, {}, model)
+
+            durations = {
+                "parse": best_of(args.repeat, lambda: json.loads(document)),
+                "validate": best_of(args.repeat, lambda: EnModel.model_validate(data)),
+                "trusted": best_of(args.repeat, lambda: EnModel.construct_trusted(data)),
+                "snapshot": best_of(args.repeat, lambda: read_converted_model(folder)),
+            }
+
+        print(
+            f"{districts:<10}{len(document) / 1e6:>8.1f}MB"
+            + "".join(f"{durations[stage] * 1e3:>8.1f}ms" for stage in STAGES)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Benchmark Sample Models
+=====================
+
+Sample energy systems of the benchmarks, built from the example profiles of
+the repository: a district with PV, a grid connection, a battery, a heat pump
+and electricity and heat demand. The sample can be replicated into several
+independent districts to scale the model size. With unit commitment, every
+district gets a CHP with minimum load and start-up costs, which makes the
+model a MIP that takes the solvers much longer to prove than to find a first
+solution.
+
+The sample is also available as drawflow of the GUI, the input of
+`convert_gui_json_to_ensys`.
+"""
+
+import os
+
+from ensys.components import (
+    EnBus,
+    EnConverter,
+    EnEnergysystem,
+    EnFlow,
+    EnGenericStorage,
+    EnInvestment,
+    EnNonConvex,
+    EnSink,
+    EnSource,
+)
+
+PROFILE_FOLDER = os.path.join(os.path.dirname(__file__), "..", "..", "example", "profiles")
+
+
+def load_profile(name: str, time_steps: int) -> list[float]:
+    """Return the first `time_steps` values of an example profile, repeated if too short."""
+    with open(os.path.join(PROFILE_FOLDER, name), "rt") as f:
+        values = [float(line) for line in f if line.strip()]
+
+    return [values[step % len(values)] for step in range(time_steps)]
+
+
+def sample_energysystem(
+    time_steps: int = 8760, districts: int = 1, unit_commitment: bool = False
+) -> EnEnergysystem:
+    """Return the sample energy system.
+
+    - param time_steps: number of hourly time steps
+    - param districts: number of independent copies of the district
+    - param unit_commitment: add a CHP with on/off decisions per time step
+    - returns: EnEnergysystem with investment decisions for PV and battery
+    """
+    demand = load_profile("demandprofile.csv", time_steps)
+    feedin = load_profile("feedinprofile.csv", time_steps)
+    # the demand profile is normalized to an annual sum of 1
+    peak = max(demand)
+
+    energysystem = EnEnergysystem()
+    for district in range(districts):
+        el = f"electricity {district}"
+        heat = f"heat {district}"
+
+        energysystem.add(EnBus(label=el))
+        energysystem.add(EnBus(label=heat))
+        energysystem.add(
+            EnSource(label=f"pv {district}", outputs={el: EnFlow(nominal_value=EnInvestment(ep_costs=60), max=feedin)})
+        )
+        energysystem.add(EnSource(label=f"grid {district}", outputs={el: EnFlow(variable_costs=0.3)}))
+        energysystem.add(
+            EnSink(label=f"el demand {district}", inputs={el: EnFlow(nominal_value=1.0, fix=[v / peak for v in demand])})
+        )
+        energysystem.add(
+            EnSink(label=f"heat demand {district}", inputs={heat: EnFlow(nominal_value=0.8, fix=[v / peak for v in demand])})
+        )
+        energysystem.add(
+            EnConverter(
+                label=f"heat pump {district}",
+                inputs={el: EnFlow()},
+                outputs={heat: EnFlow(nominal_value=2.0)},
+                conversion_factors={heat: 3.0},
+            )
+        )
+        energysystem.add(
+            EnGenericStorage(
+                label=f"battery {district}",
+                inputs={el: EnFlow()},
+                outputs={el: EnFlow()},
+                nominal_storage_capacity=EnInvestment(ep_costs=40),
+                inflow_conversion_factor=0.95,
+                outflow_conversion_factor=0.95,
+                loss_rate=0.001,
+            )
+        )
+        if unit_commitment:
+            energysystem.add(
+                EnSource(
+                    label=f"chp {district}",
+                    outputs={
+                        el: EnFlow(
+                            nominal_value=1.0,
+                            min=0.4,
+                            variable_costs=0.1,
+                            nonconvex=EnNonConvex(startup_costs=2.0, minimum_uptime=3),
+                        )
+                    },
+                )
+            )
+
+    return energysystem
+
+
+# fields of the flow form of a connection in the GUI
+FLOW_FORM_FIELDS = (
+    "investment", "nominal_value", "maximum", "minimum", "ep_costs", "existing", "nonconvex",
+    "offset", "overall_maximum", "overall_minimum", "interest_rate", "lifetime", "variable_costs",
+    "max", "min", "fix", "positive_gradient_limit", "negative_gradient_limit", "fixed_costs",
+    "full_load_time_max", "full_load_time_min", "integer", "_nonconvex", "_lifetime", "age",
+)
+
+# fields of the form of a generic storage in the GUI
+STORAGE_FORM_FIELDS = (
+    "investment", "maximum", "minimum", "offset", "ep_costs", "existing", "nonconvex",
+    "overall_maximum", "overall_minimum", "nominal_storage_capacity", "invest_relation_input_capacity",
+    "invest_relation_output_capacity", "initial_storage_level", "balanced", "loss_rate",
+    "fixed_losses_relative", "fixed_losses_absolute", "inflow_conversion_factor",
+    "outflow_conversion_factor", "min_storage_level", "max_storage_level", "storage_costs",
+)
+
+
+class SampleDrawflow:
+    """Drawflow nodes and connections in the format stored by the GUI.
+
+    Like the GUI, the flow form of a connection is stored on its component
+    node, the node that is not a bus.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def add(self, name: str, node_class: str, inputs: int = 0, outputs: int = 0, **data) -> str:
+        """Add a node with numbered ports and return its id.
+
+        - param name: name of the node, the label of the component
+        - param node_class: e.g. "bus", "source" or "converter"
+        - param inputs: number of input ports
+        - param outputs: number of output ports
+        - param data: further form data of the node
+        - returns: the node id
+        """
+        node_id = str(len(self.data) + 1)
+        self.data[node_id] = {
+            "id": int(node_id),
+            "name": name,
+            "class": node_class,
+            "data": {
+                "name": name,
+                "ports": {
+                    "inputs": [{"id": i, "name": name, "code": f"input_{i + 1}", "timeSeries": None} for i in range(inputs)],
+                    "outputs": [{"id": i, "name": name, "code": f"output_{i + 1}", "timeSeries": None} for i in range(outputs)],
+                },
+                "connections": {"inputs": [], "outputs": []},
+                **data,
+            },
+            "inputs": {f"input_{i + 1}": {"connections": []} for i in range(inputs)},
+            "outputs": {f"output_{i + 1}": {"connections": []} for i in range(outputs)},
+        }
+
+        return node_id
+
+    def connect(self, output_node: str, output_port: str, input_node: str, input_port: str, **flow):
+        """Connect an output port to an input port with the given flow form values."""
+        self.data[output_node]["outputs"][output_port]["connections"].append({"node": input_node, "output": input_port})
+        self.data[input_node]["inputs"][input_port]["connections"].append({"node": output_node, "input": output_port})
+
+        form_info = dict.fromkeys(FLOW_FORM_FIELDS)
+        form_info.update(flow)
+        connection = {
+            "baseInfo": {
+                "input_node": input_node,
+                "input_port": input_port,
+                "output_node": output_node,
+                "output_port": output_port,
+            },
+            "formInfo": form_info,
+        }
+        if self.data[output_node]["class"] != "bus":
+            self.data[output_node]["data"]["connections"]["outputs"].append(connection)
+        else:
+            self.data[input_node]["data"]["connections"]["inputs"].append(connection)
+
+
+def sample_drawflow(time_steps: int = 8760, districts: int = 1) -> dict:
+    """Return the drawflow of the sample energy system without unit commitment.
+
+    The values are entered as the GUI sends them, numbers partly as strings.
+
+    - param time_steps: number of hourly time steps
+    - param districts: number of independent copies of the district
+    - returns: drawflow node data converting to `sample_energysystem`
+    """
+    demand = load_profile("demandprofile.csv", time_steps)
+    feedin = load_profile("feedinprofile.csv", time_steps)
+    peak = max(demand)
+
+    drawflow = SampleDrawflow()
+    for district in range(districts):
+        el = drawflow.add(f"electricity {district}", "bus", inputs=1, outputs=1)
+        heat = drawflow.add(f"heat {district}", "bus", inputs=1, outputs=1)
+
+        pv = drawflow.add(f"pv {district}", "source", outputs=1)
+        drawflow.connect(pv, "output_1", el, "input_1", investment=True, ep_costs="60", max=feedin)
+        grid = drawflow.add(f"grid {district}", "source", outputs=1)
+        drawflow.connect(grid, "output_1", el, "input_1", investment=False, variable_costs="0.3")
+
+        el_demand = drawflow.add(f"el demand {district}", "sink", inputs=1)
+        drawflow.connect(el, "output_1", el_demand, "input_1", nominal_value="1", fix=[v / peak for v in demand])
+        heat_demand = drawflow.add(f"heat demand {district}", "sink", inputs=1)
+        drawflow.connect(heat, "output_1", heat_demand, "input_1", nominal_value=0.8, fix=[v / peak for v in demand])
+
+        heat_pump = drawflow.add(f"heat pump {district}", "converter", inputs=1, outputs=1)
+        drawflow.data[heat_pump]["data"]["ports"]["outputs"][0]["timeSeries"] = 3.0
+        drawflow.connect(el, "output_1", heat_pump, "input_1")
+        drawflow.connect(heat_pump, "output_1", heat, "input_1", nominal_value="2")
+
+        storage = dict.fromkeys(STORAGE_FORM_FIELDS)
+        storage.update(
+            investment=True, ep_costs=40, inflow_conversion_factor=0.95, outflow_conversion_factor=0.95, loss_rate=0.001
+        )
+        battery = drawflow.add(f"battery {district}", "genericStorage", inputs=1, outputs=1, **storage)
+        drawflow.connect(el, "output_1", battery, "input_1")
+        drawflow.connect(battery, "output_1", el, "input_1")
+
+    return drawflow.data
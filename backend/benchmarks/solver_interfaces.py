@@ -0,0 +1,91 @@
+"""
+Solver Interface Benchmark
+========================
+
+Compares the build-to-solution wall time of the shell interface of Gurobi
+(LP file round-trip) with the in-memory interfaces of Gurobi and HiGHS on the
+sample models.
+
+Every run converts the sample energy system, builds the oemof model, solves it
+and processes the results; interfaces whose solver is not installed are
+skipped.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.solver_interfaces [--districts 1 4 16] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from pyomo.opt import SolverFactory
+
+from backend.app.simulation.pipeline import collect_results, create_oemof_energysystem, create_oemof_model
+from backend.app.simulation.solvers import solver_options
+from ensys.common.solver import pyomo_solver_name, solve_model
+from ensys.common.types import Solver
+from ensys.components import EnEnergysystem
+from .samples import sample_energysystem
+
+TIME_STEPS = 8760
+
+INTERFACES = (Solver.gurobi, Solver.gurobi_direct, Solver.gurobi_persistent, Solver.highs)
+
+
+def run(energysystem: EnEnergysystem, time_steps: int, solver: Solver, log_file: str) -> dict[str, float]:
+    """Build and solve the energy system once and return the stage durations."""
+    durations = {}
+
+    start = time.perf_counter()
+    oemof_es = create_oemof_energysystem(energysystem, datetime(2025, 1, 1), time_steps, 1.0)
+    oemof_model = create_oemof_model(oemof_es, None, logging.getLogger(__name__))
+    durations["build"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    solve_model(oemof_model, solver=solver.value, cmdline_options=solver_options(solver, log_file))
+    durations["solve"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    collect_results(oemof_es, oemof_model, None)
+    durations["results"] = time.perf_counter() - start
+
+    durations["total"] = sum(durations.values())
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--districts", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    interfaces = [
+        solver for solver in INTERFACES
+        if SolverFactory(pyomo_solver_name(solver)).available(exception_flag=False)
+    ]
+    if not interfaces:
+        print("No solver available, nothing to compare.")
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        log_file = os.path.join(workdir, "solver.log")
+
+        for districts in args.districts:
+            energysystem = sample_energysystem(TIME_STEPS, districts)
+
+            print(f"{districts} district(s), {TIME_STEPS} time steps, best of {args.repeat}")
+            print(f"{'interface':<20}{'build':>10}{'solve':>10}{'results':>10}{'total':>10}")
+            for solver in interfaces:
+                runs = [run(energysystem, TIME_STEPS, solver, log_file) for _ in range(args.repeat)]
+                best = min(runs, key=lambda durations: durations["total"])
+                print(
+                    f"{solver.value:<20}"
+                    + "".join(f"{best[stage]:>9.2f}s" for stage in ("build", "solve", "results", "total"))
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from sqlmodel import SQLModel
 from app.project.model import EnProjectDB
 from app.scenario.model import EnScenarioDB
 from app.simulation.model import EnSimulationDB
+from app.sweep.model import EnSweepDB
 from app.templates.model import EnTemplateDB, EnTemplateScenarioDB
 from app.user.model import EnUserDB
 
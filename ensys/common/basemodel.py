@@ -1,6 +1,72 @@
+import functools
+import types
+from enum import Enum
+from typing import Union, get_args, get_origin
+
+import numpy as np
 from oemof import solph
 from pydantic import BaseModel, model_validator, ConfigDict
 
+from .timeseries import TimeSeries
+
+
+def _members(annotation) -> list:
+    if get_origin(annotation) in (Union, types.UnionType):
+        return list(get_args(annotation))
+
+    return [annotation]
+
+
+def _trusted_converter(annotation):
+    """
+    Returns a function restoring a value of the given annotation from its serialized form without
+    validating it, or `None` if the serialized form is used as it is.
+
+    The conversion is chosen by the type of the value: dicts become models, lists and arrays
+    time series, enum values their members and integers floats for float fields.
+    """
+    members = _members(annotation)
+    by_type = {}
+
+    for member in members:
+        origin = get_origin(member)
+        if isinstance(member, type) and issubclass(member, EnBaseModel):
+            by_type.setdefault(dict, member.construct_trusted)
+        elif isinstance(member, type) and issubclass(member, BaseModel):
+            by_type.setdefault(dict, member.model_validate)
+        elif member is TimeSeries:
+            by_type.setdefault(list, TimeSeries.validate)
+            # e.g. profiles memory-mapped from a file, used without copying
+            by_type.setdefault(np.ndarray, TimeSeries.validate)
+            by_type.setdefault(np.memmap, TimeSeries.validate)
+            if str not in members:
+                by_type.setdefault(str, TimeSeries.from_base64)
+        elif isinstance(member, type) and issubclass(member, Enum):
+            for value_type in {type(item.value) for item in member}:
+                by_type.setdefault(value_type, member)
+        elif origin is list and (item := _trusted_converter(get_args(member)[0])) is not None:
+            by_type.setdefault(list, lambda value, item=item: [item(entry) for entry in value])
+        elif origin is dict and (item := _trusted_converter(get_args(member)[1])) is not None:
+            by_type.setdefault(dict, lambda value, item=item: {key: item(entry) for key, entry in value.items()})
+
+    if float in members and int not in members:
+        by_type.setdefault(int, float)
+
+    if not by_type:
+        return None
+
+    def convert(value):
+        converter = by_type.get(type(value))
+        return value if converter is None else converter(value)
+
+    return convert
+
+
+@functools.cache
+def _trusted_plan(cls: type[BaseModel]) -> dict:
+    """Returns the converters of the fields of a model, see `_trusted_converter`."""
+    return {name: _trusted_converter(field.annotation) for name, field in cls.model_fields.items()}
+
 
 ## Container for a configuration
 class EnBaseModel(BaseModel):
@@ -8,8 +74,9 @@ class EnBaseModel(BaseModel):
     Pydantic subclass for special configurations and utility methods.
 
     This class extends the functionality of the BaseModel provided by Pydantic. It incorporates
-    additional configurations and utility methods, such as cleaning up empty attributes and
-    building keyword arguments for an oemof energy system component.
+    additional configurations and utility methods, such as cleaning up empty attributes,
+    constructing models from trusted data without validation and building keyword arguments
+    for an oemof energy system component.
 
     :ivar model_config: Configuration dictionary that allows arbitrary types and specifies
         how additional attributes are handled.
@@ -20,30 +87,57 @@ class EnBaseModel(BaseModel):
     model_config = ConfigDict(extra="ignore", arbitrary_types_allowed=True)  # 'allow'
 
     @model_validator(mode="before")
-    def remove_empty(self):
+    @classmethod
+    def remove_empty(cls, data):
         """
-        Removes attributes with `None` values from the object.
+        Removes attributes with `None` values from the raw input, so they take their default
+        value, e.g. a `balanced` of `None` or the `maximum` of an investment, which is
+        serialized as `null` for infinity.
 
-        This method iterates through all attributes of the object and identifies
-        those with a value of `None`. It collects these attributes into a list
-        and then removes them from the object. This helps in cleaning up empty
-        or irrelevant data within the object's state.
+        Only dicts are cleaned up in place; model instances, e.g. an energy system passed to
+        `EnModel`, are not validated again and pass unchanged. Models constructed with
+        `construct_trusted` skip the validator altogether.
 
-        :raises AttributeError: If an attribute cannot be deleted for any reason.
-        :return: The modified object with `None` value attributes removed.
+        :param data: The raw input of the model.
+        :return: The input without `None` values.
         :rtype: object
         """
-        items_to_remove = []
+        if isinstance(data, dict):
+            for name in [key for key, value in data.items() if value is None]:
+                del data[name]
+
+        return data
+
+    @classmethod
+    def construct_trusted(cls, data: dict):
+        """
+        Constructs a model from trusted data without validating it.
+
+        The data must have been produced by serializing a validated model of the same
+        class, e.g. by `model_dump` or `model_dump_json` (with or without base64 time series)
+        of a converted model written to disk by the backend. Nested models, time series and
+        enums are restored from their serialized form and `None` values replaced by defaults
+        like in `remove_empty`, but no validator runs and no value is checked. Data from
+        users or other external sources must be validated with the constructor or
+        `model_validate` instead, as invalid data leads to errors only later, e.g. in
+        `to_oemof`.
+
+        :param data: Serialized attributes of the model.
+        :type data: dict
+        :return: The constructed model.
+        :rtype: EnBaseModel
+        """
+        plan = _trusted_plan(cls)
+        values = {}
 
-        if isinstance(self, dict):
-            for attribute in self:
-                if self[attribute] is None:
-                    items_to_remove.append(attribute)
+        for name, value in data.items():
+            if value is None or name not in plan:
+                continue
 
-            for item in items_to_remove:
-                del self[item]
+            converter = plan[name]
+            values[name] = value if converter is None else converter(value)
 
-        return self
+        return cls.model_construct(**values)
 
     def build_kwargs(self, energysystem: solph.EnergySystem) -> dict[str, dict]:
         """
@@ -77,7 +171,9 @@ class EnBaseModel(BaseModel):
 
                     for io_key in io_keys:
                         bus = energysystem.groups[io_key]
-                        if isinstance(attr_value[io_key], float) or isinstance(
+                        if isinstance(attr_value[io_key], TimeSeries):
+                            oemof_io[bus] = attr_value[io_key].array
+                        elif isinstance(attr_value[io_key], float) or isinstance(
                             attr_value[io_key], list
                         ):
                             oemof_io[bus] = attr_value[io_key]
@@ -92,6 +188,8 @@ class EnBaseModel(BaseModel):
                     "nominal_storage_capacity",
                 ] and not isinstance(attr_value, float):
                     kwargs[attr_key] = attr_value.to_oemof(energysystem)
+                elif isinstance(attr_value, TimeSeries):
+                    kwargs[attr_key] = attr_value.array
                 else:
                     kwargs[attr_key] = attr_value
 
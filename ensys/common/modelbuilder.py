@@ -6,6 +6,7 @@ import time
 import pandas as pd
 from oemof import solph, tools
 
+from .solver import normalize_solver_options, solve_model
 from .types import Constraints, Solver, Interval
 from ..components import EnEnergysystem, EnModel
 
@@ -43,7 +44,8 @@ class ModelBuilder:
                  wdir: str,
                  logdir: str,
                  dumpdir: str,
-                 only_lp: bool = False
+                 only_lp: bool = False,
+                 trusted: bool = False
                  ) -> None:
         """
         Initializes an instance with specified configuration and directory settings. This constructor also handles the loading
@@ -62,6 +64,9 @@ class ModelBuilder:
         :type dumpdir: str
         :param only_lp: Indicator for whether only linear programming should be used in the energy system solver.
         :type only_lp: bool, optional
+        :param trusted: Indicator for a configuration file written from a validated model, e.g. a converted model of
+            the backend, which is constructed without validation (see `EnBaseModel.construct_trusted`).
+        :type trusted: bool, optional
         """
 
         self.WORKING_DIRECTORY = os.path.join(os.getcwd(), wdir)
@@ -84,7 +89,7 @@ class ModelBuilder:
 
             xf = open(ConfigFile, 'rt')
             model_dict = json.load(xf)
-            model = EnModel(**model_dict)
+            model = EnModel.construct_trusted(model_dict) if trusted else EnModel(**model_dict)
             xf.close()
         else:
             raise Exception("Fileformat is not valid!")
@@ -220,7 +225,7 @@ class ModelBuilder:
         ### Set Environmental Variables for the solver
         # map kwargs for pyomo.enviroment and later usage
         solve_kwargs = {"tee": solver_verbose}
-        cmdline_opts["logfile"] = logfile
+        cmdline_opts = normalize_solver_options(solver, {**cmdline_opts, "logfile": logfile})
 
         if not only_lp:
             ##########################################################################
@@ -229,9 +234,7 @@ class ModelBuilder:
             self.logger.info("Solve the optimization problem.")
 
             t_start = time.time()
-            model.solve(solver=solver.value,
-                        solve_kwargs=solve_kwargs,
-                        cmdline_options=cmdline_opts)
+            solve_model(model, solver=solver, solve_kwargs=solve_kwargs, cmdline_options=cmdline_opts)
 
             t_end = time.time()
 
@@ -0,0 +1,240 @@
+import logging
+
+from pydantic import BaseModel, Field
+
+from .timeseries import TimeSeries
+from ..components import EnConverter, EnEnergysystem, EnFlow, EnGenericStorage, EnInvestment, EnSink, EnSource
+
+
+class PresolveReport(BaseModel):
+    """
+    Describes what the presolve removed from an energy system.
+
+    :ivar removed_flows: Flows which are zero in every time step, as "source -> target".
+    :type removed_flows: list[str]
+    :ivar removed_components: Labels of the removed busses and components.
+    :type removed_components: list[str]
+    :ivar merged_busses: Removed bus -> bus it was merged into.
+    :type merged_busses: dict[str, str]
+    """
+    removed_flows: list[str] = Field(default_factory=list)
+    removed_components: list[str] = Field(default_factory=list)
+    merged_busses: dict[str, str] = Field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.removed_flows)} zero flows and {len(self.removed_components)} components removed, "
+            f"{len(self.merged_busses)} busses merged"
+        )
+
+
+def _all_equal(value: float | TimeSeries | None, expected: float) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, TimeSeries):
+        return len(value) > 0 and bool((value.array == expected).all())
+    if isinstance(value, list):
+        return len(value) > 0 and all(v == expected for v in value)
+
+    return value == expected
+
+
+def _is_zero_flow(flow: EnFlow) -> bool:
+    """
+    Returns True if the flow is zero in every time step regardless of the solution and
+    carries no decision besides its value (no investment, status or minimum energy).
+    """
+    if isinstance(flow.nominal_value, EnInvestment) or flow.nominal_value is None:
+        return False
+    if flow.nonconvex is not None or flow.full_load_time_min:
+        return False
+
+    return (
+        flow.nominal_value == 0
+        or _all_equal(flow.fix, 0)
+        or _all_equal(flow.max, 0)
+    )
+
+
+def _is_plain_flow(flow: EnFlow) -> bool:
+    """
+    Returns True if the flow has neither bounds, costs nor any other attribute.
+    """
+    for name, value in flow:
+        if name == "variable_costs" and (value is None or _all_equal(value, 0)):
+            continue
+        if value is not None:
+            return False
+
+    return True
+
+
+def _components(energysystem: EnEnergysystem) -> list[EnSink | EnSource | EnConverter | EnGenericStorage]:
+    return [
+        *energysystem.sinks,
+        *energysystem.sources,
+        *energysystem.converters,
+        *energysystem.generic_storages,
+    ]
+
+
+def _inflows(energysystem: EnEnergysystem, bus: str) -> list[tuple[object, EnFlow]]:
+    return [
+        (component, component.outputs[bus])
+        for component in _components(energysystem)
+        if bus in getattr(component, "outputs", {})
+    ]
+
+
+def _outflows(energysystem: EnEnergysystem, bus: str) -> list[tuple[object, EnFlow]]:
+    return [
+        (component, component.inputs[bus])
+        for component in _components(energysystem)
+        if bus in getattr(component, "inputs", {})
+    ]
+
+
+def _remove_zero_flows(energysystem: EnEnergysystem, report: PresolveReport) -> bool:
+    changed = False
+
+    for sink in energysystem.sinks:
+        for bus, flow in list(sink.inputs.items()):
+            if _is_zero_flow(flow):
+                del sink.inputs[bus]
+                report.removed_flows.append(f"{bus} -> {sink.label}")
+                changed = True
+
+    for source in energysystem.sources:
+        for bus, flow in list(source.outputs.items()):
+            if _is_zero_flow(flow):
+                del source.outputs[bus]
+                report.removed_flows.append(f"{source.label} -> {bus}")
+                changed = True
+
+    return changed
+
+
+def _remove_dead_components(energysystem: EnEnergysystem, report: PresolveReport) -> bool:
+    dead_sinks = [sink for sink in energysystem.sinks if not sink.inputs]
+    dead_sources = [source for source in energysystem.sources if not source.outputs]
+    dead_converters = [
+        converter for converter in energysystem.converters if not converter.inputs and not converter.outputs
+    ]
+    connected = {
+        bus
+        for component in _components(energysystem)
+        for bus in [*getattr(component, "inputs", {}), *getattr(component, "outputs", {})]
+    }
+    dead_busses = [bus for bus in energysystem.busses if bus.label not in connected]
+
+    for dead, container in (
+        (dead_sinks, energysystem.sinks),
+        (dead_sources, energysystem.sources),
+        (dead_converters, energysystem.converters),
+        (dead_busses, energysystem.busses),
+    ):
+        for component in dead:
+            container.remove(component)
+            report.removed_components.append(component.label)
+
+    return any((dead_sinks, dead_sources, dead_converters, dead_busses))
+
+
+def _mergeable_busses(energysystem: EnEnergysystem, converter: EnConverter) -> tuple[str, str] | None:
+    """
+    Returns the input and output bus of a lossless 1:1 converter whose busses can be merged
+    without changing the optimum, otherwise None.
+
+    Merging lets energy flow in both directions, so it is only exact if everything entering
+    the input bus leaves through the converter or everything entering the output bus comes
+    through it.
+    """
+    if len(converter.inputs) != 1 or len(converter.outputs) != 1:
+        return None
+
+    (source_bus, inflow), (target_bus, outflow) = *converter.inputs.items(), *converter.outputs.items()
+    if source_bus == target_bus or not _is_plain_flow(inflow) or not _is_plain_flow(outflow):
+        return None
+    if not all(_all_equal(factor, 1) for factor in converter.conversion_factors.values()):
+        return None
+
+    busses = {bus.label: bus for bus in energysystem.busses}
+    if not busses[source_bus].balanced or not busses[target_bus].balanced:
+        return None
+
+    # another component between both busses would be connected to one bus twice
+    for component in _components(energysystem):
+        connected = {*getattr(component, "inputs", {}), *getattr(component, "outputs", {})}
+        if component is not converter and {source_bus, target_bus} <= connected:
+            return None
+
+    if len(_outflows(energysystem, source_bus)) == 1 or len(_inflows(energysystem, target_bus)) == 1:
+        return source_bus, target_bus
+
+    return None
+
+
+def _rename_bus(component, old: str, new: str):
+    for name in ("inputs", "outputs", "conversion_factors"):
+        connections = getattr(component, name, None)
+        if connections is not None and old in connections:
+            setattr(component, name, {new if key == old else key: value for key, value in connections.items()})
+
+
+def _merge_busses(energysystem: EnEnergysystem, report: PresolveReport) -> bool:
+    for converter in energysystem.converters:
+        busses = _mergeable_busses(energysystem, converter)
+        if busses is None:
+            continue
+
+        kept, merged = busses
+        energysystem.converters.remove(converter)
+        energysystem.busses = [bus for bus in energysystem.busses if bus.label != merged]
+        for component in _components(energysystem):
+            _rename_bus(component, merged, kept)
+        for removed, into in report.merged_busses.items():
+            if into == merged:
+                report.merged_busses[removed] = kept
+
+        report.removed_components.extend([converter.label, merged])
+        report.merged_busses[merged] = kept
+        return True
+
+    return False
+
+
+def presolve(energysystem: EnEnergysystem) -> tuple[EnEnergysystem, PresolveReport]:
+    """
+    Simplifies the structure of an energy system before the oemof model is built, without
+    changing its optimum:
+
+    - flows of sinks and sources which are zero in every time step are removed,
+    - sinks, sources and converters without flows and busses without any connection are
+      removed,
+    - busses joined only by a lossless 1:1 converter without bounds or costs are merged.
+
+    Flows with a nonzero `fix` profile need no presolve, oemof fixes their variables and the
+    solver interfaces substitute them as constants. Energy systems with constraints are
+    returned unchanged, as the constraints may refer to any component.
+
+    :param energysystem: The energy system to presolve, it is not modified.
+    :type energysystem: EnEnergysystem
+    :return: The presolved copy of the energy system and the report of the removed elements.
+    :rtype: tuple[EnEnergysystem, PresolveReport]
+    """
+    report = PresolveReport()
+    if energysystem.constraints:
+        return energysystem, report
+
+    energysystem = energysystem.model_copy(deep=True)
+
+    changed = True
+    while changed:
+        changed = _remove_zero_flows(energysystem, report)
+        changed = _remove_dead_components(energysystem, report) or changed
+        changed = _merge_busses(energysystem, report) or changed
+
+    if report.removed_flows or report.removed_components:
+        logging.info(f"Presolve: {report}")
+
+    return energysystem, report
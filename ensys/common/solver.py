@@ -0,0 +1,341 @@
+import contextlib
+import logging
+import math
+import signal
+import threading
+
+from oemof import solph
+from pyomo.core import maximize, minimize
+from pyomo.opt import SolverFactory, SolverResults, SolverStatus, TerminationCondition
+
+from .types import Solver
+
+# Pyomo interfaces of solvers whose name differs from the `Solver` value.
+PYOMO_SOLVER_NAMES = {
+    Solver.highs: "appsi_highs",
+}
+
+# Termination conditions of a solve that stopped at one of its limits.
+LIMIT_TERMINATIONS = (
+    TerminationCondition.maxTimeLimit,
+    TerminationCondition.maxIterations,
+    TerminationCondition.maxEvaluations,
+)
+
+_GUROBI_OPTIONS = {
+    "gap": "MIPGap",
+    "mipgap": "MIPGap",
+    "threads": "Threads",
+    "timelimit": "TimeLimit",
+    "logfile": "LogFile",
+    "logtoconsole": "LogToConsole",
+    "outputflag": "OutputFlag",
+    "method": "Method",
+    "seed": "Seed",
+}
+
+_HIGHS_OPTIONS = {
+    "gap": "mip_rel_gap",
+    "mipgap": "mip_rel_gap",
+    "threads": "threads",
+    "timelimit": "time_limit",
+    "logfile": "log_file",
+    "logtoconsole": "log_to_console",
+    "outputflag": "output_flag",
+    "seed": "random_seed",
+}
+
+# Lower case option names without underscores -> parameter names of the solver.
+SOLVER_OPTION_NAMES = {
+    Solver.gurobi: _GUROBI_OPTIONS,
+    Solver.gurobi_direct: _GUROBI_OPTIONS,
+    Solver.gurobi_persistent: _GUROBI_OPTIONS,
+    Solver.highs: _HIGHS_OPTIONS,
+}
+
+
+def pyomo_solver_name(solver: Solver) -> str:
+    """
+    Returns the name of the Pyomo interface of a solver.
+
+    :param solver: The solver to look up.
+    :type solver: Solver
+    :return: Name to pass to the Pyomo `SolverFactory`.
+    :rtype: str
+    """
+    return PYOMO_SOLVER_NAMES.get(solver, solver.value)
+
+
+def solver_available(solver: Solver | str) -> bool:
+    """
+    Returns whether the Pyomo interface of a solver and the solver itself are available,
+    e.g. the `highspy` package for HiGHS.
+
+    :param solver: The solver or its value.
+    :type solver: Solver | str
+    :return: True if the solver can be used.
+    :rtype: bool
+    """
+    return bool(SolverFactory(pyomo_solver_name(Solver(solver))).available(exception_flag=False))
+
+
+def normalize_solver_options(solver: Solver, options: dict | None) -> dict:
+    """
+    Maps common option names (e.g. `MIP_GAP`, `threads`, `timelimit`) onto the parameter
+    names of the solver. Unknown options are passed through unchanged.
+
+    :param solver: The solver the options are meant for.
+    :type solver: Solver
+    :param options: The options to normalize, may be None.
+    :type options: dict | None
+    :return: The options with the parameter names of the solver.
+    :rtype: dict
+    """
+    names = SOLVER_OPTION_NAMES.get(solver, {})
+
+    return {
+        names.get(key.lower().replace("_", ""), key): value
+        for key, value in (options or {}).items()
+    }
+
+
+class SolverStoppedError(RuntimeError):
+    """
+    The solver stopped before it proved optimality, e.g. after an interrupt or at its time
+    limit, but found a feasible solution. The solution is loaded into the model.
+
+    :param message: Description of the termination.
+    :type message: str
+    :param solver_results: The Pyomo solver results.
+    :param gap: Relative gap of the solution, None if no bound is known.
+    :type gap: float | None
+    """
+
+    def __init__(self, message: str, solver_results, gap: float | None):
+        super().__init__(message)
+        self.solver_results = solver_results
+        self.gap = gap
+
+    @property
+    def limit_reached(self) -> bool:
+        """
+        True if the solver stopped at its time or iteration limit.
+        """
+        return self.solver_results.solver.termination_condition in LIMIT_TERMINATIONS
+
+
+def _finite(value) -> float | None:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+
+    return value if math.isfinite(value) else None
+
+
+def solution_objective(solver_results) -> tuple[float | None, float | None]:
+    """
+    Returns the objective of the best solution found and the best bound of the solver.
+
+    :param solver_results: The Pyomo solver results.
+    :return: Objective of the incumbent and best bound, None where unknown.
+    :rtype: tuple[float | None, float | None]
+    """
+    problem = solver_results.problem
+    lower_bound, upper_bound = _finite(problem.lower_bound), _finite(problem.upper_bound)
+
+    if problem.sense == maximize:
+        return lower_bound, upper_bound
+    return upper_bound, lower_bound
+
+
+def solution_gap(solver_results) -> float | None:
+    """
+    Returns the relative gap between the best solution found and the best bound, as
+    `|bound - objective| / |objective|` like Gurobi and HiGHS report it.
+
+    :param solver_results: The Pyomo solver results.
+    :return: The relative gap, None if the solution or the bound is unknown.
+    :rtype: float | None
+    """
+    objective, bound = solution_objective(solver_results)
+    if objective is None or bound is None:
+        return None
+    if objective == bound:
+        return 0.0
+
+    return abs(bound - objective) / max(abs(objective), 1e-10)
+
+
+def _check_solver_results(solver_results):
+    status = solver_results.Solver.Status
+    termination_condition = solver_results.Solver.Termination_condition
+
+    if status != "ok" or termination_condition != "optimal":
+        message = (
+            "The solver did not return an optimal solution. Instead the "
+            f"optimization ended with status {status} and termination "
+            f"condition {termination_condition}."
+        )
+        if status == "aborted" and solution_objective(solver_results)[0] is not None:
+            raise SolverStoppedError(message, solver_results, solution_gap(solver_results))
+        raise RuntimeError(message)
+
+    logging.info("Optimization successful...")
+
+
+def _load_solution(model: solph.Model, solver_results):
+    """
+    Loads the solution of a solve with `load_solutions=False` into the model: an optimal
+    solution or the incumbent of a solve that stopped, e.g. at its time limit. Nothing is
+    loaded if the solver found no feasible solution.
+
+    :param model: The solved model.
+    :type model: solph.Model
+    :param solver_results: The Pyomo solver results holding the solution.
+    """
+    optimal = solver_results.solver.termination_condition == TerminationCondition.optimal
+    if len(solver_results.solution) == 0 or not (optimal or solution_objective(solver_results)[0] is not None):
+        return
+
+    model.solutions.load_from(solver_results)
+
+
+def _highs_incumbent(opt, model: solph.Model) -> SolverResults | None:
+    """
+    Loads the best solution of an interrupted APPSI HiGHS solve into the model.
+
+    :param opt: The APPSI HiGHS interface after the solve.
+    :param model: The solved model.
+    :type model: solph.Model
+    :return: Solver results with the bounds of the solve, None without a feasible solution.
+    :rtype: SolverResults | None
+    """
+    info = opt._solver_model.getInfo()
+    # 2 = feasible
+    if info.primal_solution_status != 2:
+        return None
+
+    opt.load_vars()
+
+    objective = info.objective_function_value
+    # mip_node_count is -1 for LPs, which have no bound besides their solution
+    bound = info.mip_dual_bound if info.mip_node_count != -1 else None
+
+    solver_results = SolverResults()
+    solver_results.solver.status = SolverStatus.aborted
+    solver_results.solver.termination_condition = TerminationCondition.userInterrupt
+    solver_results.solver.termination_message = "The solve was interrupted."
+    solver_results.problem.sense = model.objective.sense
+    if model.objective.sense == minimize:
+        solver_results.problem.upper_bound, solver_results.problem.lower_bound = objective, bound
+    else:
+        solver_results.problem.lower_bound, solver_results.problem.upper_bound = objective, bound
+
+    return solver_results
+
+
+@contextlib.contextmanager
+def _cancel_on_interrupt(cancel):
+    """
+    Lets SIGINT stop the running solve through `cancel` instead of raising a
+    KeyboardInterrupt, so the solver returns its best solution found so far.
+
+    :param cancel: Callable stopping the solve, returns False if the solver has not started
+        yet, in which case the KeyboardInterrupt is raised as usual.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handler(signum, frame):
+        if not cancel():
+            signal.default_int_handler(signum, frame)
+
+    previous = signal.signal(signal.SIGINT, handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+def solve_model(model: solph.Model, solver: Solver | str, solve_kwargs: dict | None = None,
+                cmdline_options: dict | None = None):
+    """
+    Solves an oemof model with the Pyomo interface of the solver.
+
+    Unlike `solph.Model.solve`, which raises on any solve that is not optimal, the results
+    are checked after the solution was loaded. Persistent interfaces have to be bound to the
+    model first, and the APPSI interfaces (e.g. HiGHS) build the model in memory and do not
+    accept a file format.
+
+    A solve stopped by an interrupt (SIGINT) or at a limit, e.g. the time limit of Gurobi,
+    HiGHS or CBC, raises a `SolverStoppedError` with the best solution found so far loaded
+    into the model.
+
+    :param model: The built oemof model.
+    :type model: solph.Model
+    :param solver: The solver or its value.
+    :type solver: Solver | str
+    :param solve_kwargs: Arguments of the solve call, e.g. `warmstart` or `tee`.
+    :type solve_kwargs: dict | None
+    :param cmdline_options: Options passed to the solver.
+    :type cmdline_options: dict | None
+    :return: The Pyomo solver results.
+    :raises SolverStoppedError: If the solver stopped with a feasible, not proven optimal
+        solution.
+    :raises RuntimeError: If no optimal solution was found.
+    """
+    solver = Solver(solver)
+    name = pyomo_solver_name(solver)
+    solve_kwargs = solve_kwargs or {}
+
+    if name.startswith("appsi_"):
+        opt = SolverFactory(name)
+        opt.options.update(cmdline_options or {})
+
+        # the legacy APPSI interface imports duals and reduced costs into any
+        # `dual` and `rc` attribute, solph sets them to None if not requested
+        unset_suffixes = [
+            suffix for suffix in ("dual", "rc") if hasattr(model, suffix) and getattr(model, suffix) is None
+        ]
+        for suffix in unset_suffixes:
+            delattr(model, suffix)
+
+        interrupted = False
+
+        def cancel() -> bool:
+            nonlocal interrupted
+            # the highspy model exists once the solver builds the instance
+            solver_model = getattr(opt, "_solver_model", None)
+            if solver_model is None or not hasattr(solver_model, "cancelSolve"):
+                return False
+            solver_model.cancelSolve()
+            interrupted = True
+            return True
+
+        try:
+            with _cancel_on_interrupt(cancel):
+                solver_results = opt.solve(model, **solve_kwargs)
+        except RuntimeError:
+            # APPSI discards the incumbent of an interrupted solve
+            if not interrupted or (solver_results := _highs_incumbent(opt, model)) is None:
+                raise
+        finally:
+            for suffix in unset_suffixes:
+                setattr(model, suffix, None)
+    else:
+        opt = SolverFactory(name)
+        if solver == Solver.gurobi_persistent:
+            opt.set_instance(model)
+        opt.options.update(cmdline_options or {})
+
+        # the results of a stopped solve are checked below instead of raising on load
+        solver_results = opt.solve(model, load_solutions=False, **solve_kwargs)
+        _load_solution(model, solver_results)
+
+    model.es.results = solver_results
+    model.solver_results = solver_results
+    _check_solver_results(solver_results)
+
+    return solver_results
@@ -0,0 +1,300 @@
+import base64
+import contextvars
+import weakref
+
+import numpy as np
+from pydantic import BaseModel, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import core_schema
+
+# Key of the table of shared time series in a serialized energy system and of a reference to it.
+SHARED_TIMESERIES_KEY = "timeseries"
+TIMESERIES_REFERENCE_KEY = "$timeseries"
+
+# Interned time series by length and hash of their values, see `TimeSeries.intern`.
+_interned: "weakref.WeakValueDictionary[tuple[int, int], TimeSeries]" = weakref.WeakValueDictionary()
+# Set while an energy system is serialized, see `SharedTimeSeries`.
+_shared: contextvars.ContextVar = contextvars.ContextVar("shared_timeseries", default=None)
+
+
+class TimeSeries:
+    """
+    Represents a sequence of values over the time steps of an energy system, backed by a
+    contiguous, read-only NumPy float64 array.
+
+    Time series are validated from lists, NumPy arrays or base64 encoded little-endian
+    float64 bytes in a single vectorized conversion instead of validating each element. They
+    serialize to a list of floats, or to the base64 string if the serialization context holds
+    ``{"timeseries": "base64"}``. As the values can not be changed, copies of a component share
+    the array of their time series and ``to_oemof`` hands it to oemof as it is.
+
+    A time series compares equal to any sequence with the same values, so it can be used like
+    the list it replaces. Validated time series are interned: identical profiles, e.g. the same
+    demand profile of many sinks, are held once and shared by reference.
+
+    :ivar array: The values of the time series.
+    :type array: numpy.ndarray
+    """
+    __slots__ = ("array", "_hash", "__weakref__")
+
+    def __init__(self, values):
+        if isinstance(values, (list, tuple)):
+            # a single pass over the items, without the shape discovery of np.asarray
+            array = np.fromiter(values, dtype=np.float64, count=len(values))
+        else:
+            array = np.ascontiguousarray(values, dtype=np.float64)
+        if array.ndim != 1:
+            raise ValueError(f"A time series must be one-dimensional, got {array.ndim} dimensions.")
+        if array.flags.writeable:
+            # read-only view, the array of the caller stays writeable
+            array = array.view()
+            array.flags.writeable = False
+
+        self.array = array
+        self._hash = None
+
+    @classmethod
+    def intern(cls, series: "TimeSeries") -> "TimeSeries":
+        """
+        Returns the interned time series with the values of the given one.
+
+        The first time series with some values is interned and returned for all later ones with
+        the same values as long as it is in use. Time series are looked up by a hash of their
+        values, which is computed once per time series.
+
+        :param series: The time series to intern.
+        :type series: TimeSeries
+        :return: The interned time series, possibly `series` itself.
+        :rtype: TimeSeries
+        """
+        if series._hash is None:
+            series._hash = hash(series.array.tobytes())
+
+        key = (len(series.array), series._hash)
+        interned = _interned.get(key)
+        if interned is None:
+            _interned[key] = series
+        elif interned is not series and np.array_equal(interned.array, series.array):
+            return interned
+
+        return series
+
+    @classmethod
+    def from_base64(cls, data: str) -> "TimeSeries":
+        """
+        Creates a time series from base64 encoded little-endian float64 bytes.
+
+        :param data: The encoded values.
+        :type data: str
+        :return: The decoded time series.
+        :rtype: TimeSeries
+        :raises ValueError: If the data is no valid encoding of float64 values.
+        """
+        raw = base64.b64decode(data, validate=True)
+        if len(raw) % 8:
+            raise ValueError("The base64 data of a time series must hold a multiple of 8 bytes.")
+
+        return cls(np.frombuffer(raw, dtype="<f8"))
+
+    def to_base64(self) -> str:
+        """
+        Encodes the values as base64 string of little-endian float64 bytes.
+
+        :return: The encoded values.
+        :rtype: str
+        """
+        return base64.b64encode(self.array.astype("<f8", copy=False).tobytes()).decode("ascii")
+
+    def tolist(self) -> list[float]:
+        return self.array.tolist()
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.array.tolist())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return TimeSeries.intern(TimeSeries(self.array[item]))
+
+        return float(self.array[item])
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return self.array.astype(dtype or self.array.dtype)
+
+        return self.array if dtype is None else self.array.astype(dtype, copy=False)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimeSeries):
+            other = other.array
+        elif not isinstance(other, (list, tuple, np.ndarray)):
+            return NotImplemented
+
+        try:
+            return np.array_equal(self.array, np.asarray(other, dtype=np.float64))
+        except (TypeError, ValueError):
+            return False
+
+    __hash__ = None
+
+    def __copy__(self) -> "TimeSeries":
+        return self
+
+    def __deepcopy__(self, memo) -> "TimeSeries":
+        return self
+
+    def __repr__(self) -> str:
+        return f"TimeSeries({np.array2string(self.array, threshold=8, separator=', ')})"
+
+    @classmethod
+    def validate(cls, value) -> "TimeSeries":
+        """
+        Validates a time series from a list, a NumPy array or a base64 string.
+
+        :param value: The values to validate.
+        :return: The validated time series.
+        :rtype: TimeSeries
+        :raises ValueError: If the value is a scalar or can not be converted to float64 values.
+        """
+        if isinstance(value, TimeSeries):
+            return cls.intern(value)
+        if isinstance(value, str):
+            try:
+                return cls.intern(cls.from_base64(value))
+            except ValueError as error:
+                raise ValueError(f"Invalid base64 time series: {error}") from error
+        if not isinstance(value, (list, tuple, np.ndarray)):
+            raise ValueError("A time series must be a list, an array or a base64 string.")
+
+        try:
+            series = cls(value)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Invalid time series: {error}") from error
+
+        # None converts to NaN, the items are only looked at if there is any
+        if not isinstance(value, np.ndarray) and np.isnan(series.array).any():
+            if any(item is None for item in value):
+                raise ValueError("A time series must not contain missing values.")
+
+        return cls.intern(series)
+
+    @staticmethod
+    def _encode(value: "TimeSeries", info: core_schema.SerializationInfo):
+        if info.mode_is_json() and info.context and info.context.get("timeseries") == "base64":
+            return value.to_base64()
+
+        return value.tolist()
+
+    @classmethod
+    def _serialize(cls, value, info: core_schema.SerializationInfo):
+        if not isinstance(value, TimeSeries):
+            return value
+
+        shared = _shared.get()
+        if shared is not None and info.mode_is_json():
+            return shared.reference(value, lambda: cls._encode(value, info))
+
+        return cls._encode(value, info)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls._serialize, info_arg=True),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler: GetJsonSchemaHandler) -> dict:
+        return {
+            "anyOf": [
+                {"type": "array", "items": {"type": "number"}},
+                {"type": "string", "contentEncoding": "base64"},
+            ]
+        }
+
+
+def iter_timeseries(node):
+    """
+    Yields the time series of a model and of all models, dicts and lists below it.
+
+    :param node: The model, dict or list to search.
+    """
+    if isinstance(node, TimeSeries):
+        yield node
+    elif isinstance(node, BaseModel):
+        for name in type(node).model_fields:
+            yield from iter_timeseries(getattr(node, name))
+    elif isinstance(node, dict):
+        for value in node.values():
+            yield from iter_timeseries(value)
+    elif isinstance(node, list) and node and not isinstance(node[0], (int, float)):
+        for value in node:
+            yield from iter_timeseries(value)
+
+
+def resolve_timeseries_references(node, table: list):
+    """
+    Returns the serialized data `node` with the references ``{"$timeseries": <index>}`` replaced
+    by the time series of the table.
+
+    :param node: The serialized data, e.g. of an energy system.
+    :param table: The time series referenced by their index.
+    :type table: list[TimeSeries]
+    """
+    if isinstance(node, dict):
+        if len(node) == 1 and TIMESERIES_REFERENCE_KEY in node:
+            return table[node[TIMESERIES_REFERENCE_KEY]]
+
+        return {key: resolve_timeseries_references(value, table) for key, value in node.items()}
+
+    if isinstance(node, list) and node and not isinstance(node[0], (int, float)):
+        return [resolve_timeseries_references(value, table) for value in node]
+
+    return node
+
+
+class SharedTimeSeries:
+    """
+    Shares the time series occurring more than once while an energy system is serialized.
+
+    Within the context, time series of the given ids are written once to `values` and
+    serialized as reference ``{"$timeseries": <index of the values>}``; all other time series
+    are serialized in place.
+
+    :ivar repeated: The ids of the time series to share.
+    :type repeated: set[int]
+    :ivar values: The serialized values of the shared time series.
+    :type values: list
+    """
+
+    def __init__(self, repeated: set[int]):
+        self.repeated = repeated
+        self.values = []
+        self._indices: dict[int, int] = {}
+        self._token = None
+
+    def reference(self, series: TimeSeries, encode):
+        """
+        Returns the reference to a shared time series or its values if it is not shared.
+
+        :param series: The serialized time series.
+        :type series: TimeSeries
+        :param encode: Function returning the serialized values of the time series.
+        """
+        if id(series) not in self.repeated:
+            return encode()
+
+        index = self._indices.get(id(series))
+        if index is None:
+            index = self._indices[id(series)] = len(self.values)
+            self.values.append(encode())
+
+        return {TIMESERIES_REFERENCE_KEY: index}
+
+    def __enter__(self) -> "SharedTimeSeries":
+        self._token = _shared.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _shared.reset(self._token)
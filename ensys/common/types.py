@@ -92,6 +92,8 @@ class Solver(Enum):
     :type cplex: str
     :ivar kiwi: Kiwisolver from PyPI.
     :type kiwi: str
+    :ivar highs: HiGHS LP/MILP Solver (in-memory APPSI interface, no license required).
+    :type highs: str
     """
     cbc = 'cbc'
     gurobi = 'gurobi'
@@ -100,3 +102,4 @@ class Solver(Enum):
     glpk = 'glpk'
     cplex = 'cplex'
     kiwi = 'kiwi'
+    highs = 'highs'
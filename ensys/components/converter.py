@@ -3,6 +3,7 @@ from pydantic import Field
 
 from .flow import EnFlow
 from ..common.basemodel import EnBaseModel
+from ..common.timeseries import TimeSeries
 
 
 class EnConverter(EnBaseModel):
@@ -25,7 +26,7 @@ class EnConverter(EnBaseModel):
         corresponds to connected nodes and values can be a scalar or a list of
         conversion factors for time-dependent variations. If unspecified, defaults
         to 1 for all flows.
-    :type conversion_factors: dict[str, float | list[float]]
+    :type conversion_factors: dict[str, float | TimeSeries]
     """
     label: str = Field(
         "Default Converter",
@@ -45,7 +46,7 @@ class EnConverter(EnBaseModel):
         description='Dictionary with outflows. Keys must be the ending node(s) of the outflow(s)'
     )
 
-    conversion_factors: dict[str, float | list[float]] = Field(
+    conversion_factors: dict[str, float | TimeSeries] = Field(
         ...,
         title='Conversion Factors',
         description='Dictionary containing conversion factors for conversion of each flow. Keys must be the connected nodes (typically Buses). The dictionary values can either be a scalar or an iterable with individual conversion factors for each time step. Default: 1. If no conversion_factor is given for an in- or outflow, the conversion_factor is set to 1'
@@ -1,5 +1,7 @@
+from collections import Counter
+
 from oemof import solph
-from pydantic import Field
+from pydantic import Field, SerializationInfo, model_serializer, model_validator
 
 from .bus import EnBus
 from .constraints import EnConstraints
@@ -8,6 +10,13 @@ from .genericstorage import EnGenericStorage
 from .sink import EnSink
 from .source import EnSource
 from ..common.basemodel import EnBaseModel
+from ..common.timeseries import (
+    SHARED_TIMESERIES_KEY,
+    SharedTimeSeries,
+    TimeSeries,
+    iter_timeseries,
+    resolve_timeseries_references,
+)
 
 
 class EnEnergysystem(EnBaseModel):
@@ -20,6 +29,12 @@ class EnEnergysystem(EnBaseModel):
     into a format suitable for oemof energy systems, enabling seamless integration
     with oemof's modeling and analysis tools.
 
+    Time series used by several components, e.g. the same demand profile of many sinks, are
+    shared by reference and serialized once in JSON: their values are stored in the table
+    "timeseries" of the serialized energy system, referenced by ``{"$timeseries": <index>}``.
+    Set ``{"shared_timeseries": False}`` in the serialization context to write all values in
+    place.
+
     :ivar busses: List of all busses in the energy system.
     :type busses: list[EnBus]
     :ivar sinks: List of all sinks in the energy system.
@@ -60,6 +75,57 @@ class EnEnergysystem(EnBaseModel):
         default=[], title="Constraints", description="List of all constraints."
     )
 
+    @classmethod
+    def _resolve_shared_timeseries(cls, data):
+        if not isinstance(data, dict) or SHARED_TIMESERIES_KEY not in data:
+            return data
+
+        data = dict(data)
+        table = [TimeSeries.validate(values) for values in data.pop(SHARED_TIMESERIES_KEY)]
+
+        return resolve_timeseries_references(data, table)
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_shared_timeseries(cls, data):
+        """
+        Replaces the references to shared time series of a serialized energy system by the
+        time series of its table "timeseries".
+
+        :param data: The raw input of the energy system.
+        :return: The input without references.
+        :rtype: object
+        """
+        return cls._resolve_shared_timeseries(data)
+
+    @classmethod
+    def construct_trusted(cls, data: dict):
+        return super().construct_trusted(cls._resolve_shared_timeseries(data))
+
+    @model_serializer(mode="wrap")
+    def share_timeseries(self, handler, info: SerializationInfo):
+        """
+        Serializes time series used more than once to the table "timeseries" in JSON mode.
+
+        :param handler: The default serializer of the energy system.
+        :param info: The serialization info, whose context may disable the sharing.
+        :return: The serialized energy system.
+        :rtype: dict
+        """
+        if not info.mode_is_json() or (info.context and info.context.get("shared_timeseries") is False):
+            return handler(self)
+
+        counts = Counter(id(series) for series in iter_timeseries(self))
+        repeated = {series for series, count in counts.items() if count > 1}
+        if not repeated:
+            return handler(self)
+
+        with SharedTimeSeries(repeated) as shared:
+            data = handler(self)
+        data[SHARED_TIMESERIES_KEY] = shared.values
+
+        return data
+
     def add(
         self,
         elem: (
@@ -4,6 +4,7 @@ from pydantic import Field
 from .investment import EnInvestment
 from .nonconvex import EnNonConvex
 from ..common.basemodel import EnBaseModel
+from ..common.timeseries import TimeSeries
 
 
 class EnFlow(EnBaseModel):
@@ -23,15 +24,15 @@ class EnFlow(EnBaseModel):
     :type nominal_value: float | EnInvestment
     :ivar variable_costs: The costs associated with one unit of the flow per hour. These costs
         for each timestep will be added to the objective expression of the optimization problem.
-    :type variable_costs: float | list[float] | None
+    :type variable_costs: float | TimeSeries | None
     :ivar min: Normed minimum value of the flow.
-    :type min: float | list[float] | None
+    :type min: float | TimeSeries | None
     :ivar max: Normed maximum value of the flow. The absolute maximum flow will be calculated
         by multiplying nominal_value with max.
-    :type max: float | list[float] | None
+    :type max: float | TimeSeries | None
     :ivar fix: Normed fixed value for the flow variable. It will be multiplied with
         nominal_value to get the absolute value.
-    :type fix: float | list[float] | None
+    :type fix: float | TimeSeries | None
     :ivar positive_gradient_limit: Normed upper bound on the positive difference
         (flow[t-1] < flow[t]) of two consecutive flow values.
     :type positive_gradient_limit: dict | None
@@ -51,7 +52,7 @@ class EnFlow(EnBaseModel):
     :type nonconvex: EnNonConvex | None
     :ivar fixed_costs: Fixed costs associated with a flow, provided on a yearly basis.
         Applicable only for a multi-period model.
-    :type fixed_costs: float | list[float] | None
+    :type fixed_costs: float | TimeSeries | None
     :ivar lifetime: Lifetime of a flow (in years). When reached (considering the initial age),
         the flow is forced to 0. Applicable only for a multi-period model.
     :type lifetime: int | None
@@ -69,28 +70,28 @@ class EnFlow(EnBaseModel):
                     'the flow object will be bounded by this value multiplied with min(lower bound)/max(upper bound).'
     )
 
-    variable_costs: float | list[float] | None = Field(
+    variable_costs: float | TimeSeries | None = Field(
         default=None,
         title='Variable Costs',
         description='The costs associated with one unit of the flow per hour. The costs for each timestep will be added to the objective expression of the optimization problem.'
     )
 
     # numeric or sequence
-    min: float | list[float] | None = Field(
+    min: float | TimeSeries | None = Field(
         default=None,
         title='Minimum',
         description='Normed minimum value of the flow (see max).'
     )
 
     # numeric or sequence
-    max: float | list[float] | None = Field(
+    max: float | TimeSeries | None = Field(
         default=None,
         title='Maximum',
         description='Normed maximum value of the flow. The flow absolute maximum will be calculated by multiplying nominal_value with max'
     )
 
     # numeric or sequence or None
-    fix: float | list[float] | None = Field(
+    fix: float | TimeSeries | None = Field(
         default=None,
         title='Fix',
         description='Normed fixed value for the flow variable. '
@@ -134,7 +135,7 @@ class EnFlow(EnBaseModel):
                     'will be used instead of Flow. '
     )
 
-    fixed_costs: float | list[float] | None = Field(
+    fixed_costs: float | TimeSeries | None = Field(
         default=None,
         title='Fixed Costs',
         description='The fixed costs associated with a flow. Note: These are only applicable for a multi-period model and given on a yearly basis.'
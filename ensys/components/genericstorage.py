@@ -4,6 +4,7 @@ from pydantic import Field
 from .flow import EnFlow
 from .investment import EnInvestment
 from ..common.basemodel import EnBaseModel
+from ..common.timeseries import TimeSeries
 
 
 class EnGenericStorage(EnBaseModel):
@@ -116,43 +117,43 @@ class EnGenericStorage(EnBaseModel):
         description=' Couple storage level of first and last time step. (Total inflow and total outflow are balanced.)'
     )
 
-    loss_rate: float | list[float] | None = Field(
+    loss_rate: float | TimeSeries | None = Field(
         default=None,
         title='loss rate',
         description='The relative loss of the storage content per hour.'
     )
 
-    fixed_losses_relative: float | list[float] | None = Field(
+    fixed_losses_relative: float | TimeSeries | None = Field(
         default=None,
         title='fixed losses relative',
         description='Losses per hour that are independent of the storage content but proportional to nominal storage capacity. Note: Fixed losses are not supported in investment mode.'
     )
 
-    fixed_losses_absolute: float | list[float] | None = Field(
+    fixed_losses_absolute: float | TimeSeries | None = Field(
         default=None,
         title='Fixed losses absolute',
         description='Losses per hour that are independent of storage content and independent of nominal storage capacity. Note: Fixed losses are not supported in investment mode.'
     )
 
-    inflow_conversion_factor: float | list[float] = Field(
+    inflow_conversion_factor: float | TimeSeries = Field(
         ...,
         title='Conversion factor: Inflow',
         description='The relative conversion factor, i.e. efficiency associated with the inflow of the storage.'
     )
 
-    outflow_conversion_factor: float | list[float] = Field(
+    outflow_conversion_factor: float | TimeSeries = Field(
         ...,
         title='Conversion factor: Outflow',
         description='The relative conversion factor, i.e. efficiency associated with the outflow of the storage.'
     )
 
-    min_storage_level: float | list[float] = Field(
+    min_storage_level: float | TimeSeries = Field(
         default=0,
         title='Minimum storage level',
         description='The normed minimum storage content as fraction of the nominal storage capacity or the capacity that has been invested into (between 0 and 1). To set different values in every time step use a sequence.'
     )
 
-    max_storage_level: float | list[float] = Field(
+    max_storage_level: float | TimeSeries = Field(
         default=1,
         title='Maximum storage level',
         description='The normed maximum storage content as fraction of the nominal storage capacity or the capacity that has been invested into (between 0 and 1). To set different values in every time step use a sequence.'
@@ -164,7 +165,7 @@ class EnGenericStorage(EnBaseModel):
     #     description='Object indicating if a nominal_value of the flow is determined by the optimization problem. Note: This will refer all attributes to an investment variable instead of to the nominal_storage_capacity. The nominal_storage_capacity should not be set (or set to None) if an investment object is used.'
     # )
 
-    storage_costs: float | list[float] | None = Field(
+    storage_costs: float | TimeSeries | None = Field(
         default=None,
         title='storage costs',
         description='Cost (per energy) for having energy in the storage.'
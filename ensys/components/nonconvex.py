@@ -2,6 +2,7 @@ from oemof import solph
 from pydantic import Field
 
 from ..common.basemodel import EnBaseModel
+from ..common.timeseries import TimeSeries
 
 
 class EnNonConvex(EnBaseModel):
@@ -13,13 +14,13 @@ class EnNonConvex(EnBaseModel):
     purposes in an energy system optimization context.
 
     :ivar startup_costs: Costs associated with a start of the flow (representing a unit).
-    :type startup_costs: float | list[float] | None
+    :type startup_costs: float | TimeSeries | None
     :ivar shutdown_costs: Costs associated with the shutdown of the flow (representing a unit).
-    :type shutdown_costs: float | list[float] | None
+    :type shutdown_costs: float | TimeSeries | None
     :ivar activity_costs: Costs associated with the active operation of the flow, independently from the actual output.
-    :type activity_costs: float | list[float] | None
+    :type activity_costs: float | TimeSeries | None
     :ivar inactivity_costs: Costs associated with not operating the flow.
-    :type inactivity_costs: float | list[float] | None
+    :type inactivity_costs: float | TimeSeries | None
     :ivar minimum_uptime: Minimum number of time steps that a flow must be greater than its minimum flow after startup. Be aware that minimum up and downtimes can contradict each other and may lead to infeasible problems.
     :type minimum_uptime: int | list[int] | None
     :ivar minimum_downtime: Minimum number of time steps a flow is forced to zero after shutting down. Be aware that minimum up and downtimes can contradict each other and may lead to infeasible problems.
@@ -35,25 +36,25 @@ class EnNonConvex(EnBaseModel):
     :ivar negative_gradient_limit: The normed upper bound on the negative difference (flow[t-1] > flow[t]) of two consecutive flow values.
     :type negative_gradient_limit: dict | None
     """
-    startup_costs: float | list[float] | None = Field(
+    startup_costs: float | TimeSeries | None = Field(
         default=None,
         title='Startups Costs',
         description='Costs associated with a start of the flow (representing a unit).'
     )
 
-    shutdown_costs: float | list[float] | None = Field(
+    shutdown_costs: float | TimeSeries | None = Field(
         default=None,
         title='Shutdown Costs',
         description='Costs associated with the shutdown of the flow (representing a unit).'
     )
 
-    activity_costs: float | list[float] | None = Field(
+    activity_costs: float | TimeSeries | None = Field(
         default=None,
         title='Activity Costs',
         description='Costs associated with the active operation of the flow, independently from the actual output.'
     )
 
-    inactivity_costs: float | list[float] | None = Field(
+    inactivity_costs: float | TimeSeries | None = Field(
         default=None,
         title='Inactivity Costs',
         description='Costs associated with not operating the flow.'
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from oemof import solph
 
@@ -5,6 +7,7 @@ from ensys.components.bus import EnBus
 from ensys.components.constraints import EnConstraints
 from ensys.components.converter import EnConverter
 from ensys.components.energysystem import EnEnergysystem
+from ensys.components.flow import EnFlow
 from ensys.components.genericstorage import EnGenericStorage
 from ensys.components.sink import EnSink
 from ensys.components.source import EnSource
@@ -82,3 +85,32 @@ def test_to_oemof(mock_ensys_enerygysystem):
     assert isinstance(oemof_system, solph.EnergySystem)
     assert len(oemof_system.nodes) == 1
     assert "Bus Oemof Test" in oemof_system.groups
+
+
+def test_identical_timeseries_are_shared(mock_ensys_enerygysystem):
+    profile = [0.2, 0.5, 0.8, 0.4]
+    mock_ensys_enerygysystem.add(EnBus(label="el"))
+    for index in range(3):
+        mock_ensys_enerygysystem.add(
+            EnSink(label=f"demand {index}", inputs={"el": EnFlow(nominal_value=1.0, fix=list(profile))})
+        )
+    mock_ensys_enerygysystem.add(EnSource(label="grid", outputs={"el": EnFlow(max=[1.0, 1.0, 0.5, 0.5])}))
+
+    fixes = [sink.inputs["el"].fix for sink in mock_ensys_enerygysystem.sinks]
+    assert fixes[0] is fixes[1] is fixes[2]
+
+    data = json.loads(mock_ensys_enerygysystem.model_dump_json())
+    assert data["timeseries"] == [profile]
+    assert [sink["inputs"]["el"]["fix"] for sink in data["sinks"]] == [{"$timeseries": 0}] * 3
+    assert data["sources"][0]["outputs"]["el"]["max"] == [1.0, 1.0, 0.5, 0.5]
+
+    for restored in (
+        EnEnergysystem.model_validate_json(mock_ensys_enerygysystem.model_dump_json()),
+        EnEnergysystem.construct_trusted(data),
+    ):
+        assert restored == mock_ensys_enerygysystem
+        assert restored.sinks[0].inputs["el"].fix is restored.sinks[2].inputs["el"].fix
+
+    inline = json.loads(mock_ensys_enerygysystem.model_dump_json(context={"shared_timeseries": False}))
+    assert "timeseries" not in inline
+    assert inline["sinks"][1]["inputs"]["el"]["fix"] == profile
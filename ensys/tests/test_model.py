@@ -0,0 +1,88 @@
+import json
+
+import numpy as np
+import pytest
+
+from ensys.common.timeseries import TimeSeries
+from ensys.common.types import Constraints, Solver
+from ensys.components import (
+    EnBus,
+    EnConstraints,
+    EnEnergysystem,
+    EnFlow,
+    EnGenericStorage,
+    EnInvestment,
+    EnModel,
+    EnNonConvex,
+    EnSink,
+    EnSource,
+)
+
+DEMAND = [0.2, 0.5, 0.8, 0.4]
+
+
+@pytest.fixture
+def mock_ensys_model() -> EnModel:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="el"))
+    energysystem.add(
+        EnSource(
+            label="pv",
+            outputs={"el": EnFlow(nominal_value=EnInvestment(ep_costs=60), max=[0, 0.5, 1, 0.5])},
+        )
+    )
+    energysystem.add(
+        EnSource(
+            label="chp",
+            outputs={"el": EnFlow(nominal_value=5, min=0.4, nonconvex=EnNonConvex(startup_costs=[1, 2, 3, 4]))},
+        )
+    )
+    energysystem.add(EnSink(label="demand", inputs={"el": EnFlow(nominal_value=1, fix=DEMAND)}))
+    energysystem.add(
+        EnGenericStorage(
+            label="battery",
+            inputs={"el": EnFlow()},
+            outputs={"el": EnFlow()},
+            nominal_storage_capacity=EnInvestment(ep_costs=40),
+            inflow_conversion_factor=1,
+            outflow_conversion_factor=0.9,
+        )
+    )
+    energysystem.add(EnConstraints(typ=Constraints.emission_limit, keyword="emission_factor", limit=100))
+
+    return EnModel(energysystem=energysystem, solver=Solver.highs, solver_kwargs={"mip_gap": 0.01})
+
+
+@pytest.mark.parametrize("context", [None, {"timeseries": "base64"}])
+def test_construct_trusted_equals_validation(mock_ensys_model, context):
+    data = json.loads(mock_ensys_model.model_dump_json(context=context))
+
+    trusted = EnModel.construct_trusted(data)
+
+    assert trusted == EnModel.model_validate(json.loads(mock_ensys_model.model_dump_json(context=context)))
+    assert trusted == mock_ensys_model
+    assert trusted.solver is Solver.highs
+    assert trusted.energysystem.constraints[0].typ is Constraints.emission_limit
+    # infinity is serialized as null and restored as default
+    assert trusted.energysystem.sources[0].outputs["el"].nominal_value.maximum == float("inf")
+    assert isinstance(trusted.energysystem.sinks[0].inputs["el"].fix, TimeSeries)
+    assert isinstance(trusted.energysystem.sources[1].outputs["el"].nonconvex.startup_costs, TimeSeries)
+
+
+def test_construct_trusted_uses_arrays_without_copy():
+    profile = np.array(DEMAND)
+    profile.flags.writeable = False
+
+    flow = EnFlow.construct_trusted({"nominal_value": 1.0, "fix": profile})
+
+    assert flow.fix.array is profile
+    assert flow.nominal_value == 1.0
+
+
+def test_remove_empty_restores_defaults():
+    bus = EnBus.model_validate({"label": "el", "balanced": None})
+    investment = EnInvestment.model_validate({"maximum": None, "ep_costs": 10})
+
+    assert bus.balanced is True
+    assert investment.maximum == float("inf")
+    assert EnBus.construct_trusted({"label": "el", "balanced": None}) == bus
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+from oemof import solph
+
+from ensys.common.presolve import presolve
+from ensys.common.solver import solve_model, solver_available
+from ensys.common.types import Solver
+from ensys.components.bus import EnBus
+from ensys.components.constraints import EnConstraints
+from ensys.components.converter import EnConverter
+from ensys.components.energysystem import EnEnergysystem
+from ensys.components.flow import EnFlow
+from ensys.components.investment import EnInvestment
+from ensys.components.sink import EnSink
+from ensys.components.source import EnSource
+
+DEMAND = [0.2, 0.5, 0.8, 0.4]
+
+requires_highs = pytest.mark.skipif(not solver_available(Solver.highs), reason="HiGHS is not available")
+
+
+@pytest.fixture
+def sample_ensys_energysystem() -> EnEnergysystem:
+    energysystem = EnEnergysystem()
+    energysystem.add(EnBus(label="grid"))
+    energysystem.add(EnBus(label="house"))
+    energysystem.add(EnBus(label="heat"))
+    energysystem.add(EnSource(label="import", outputs={"grid": EnFlow(variable_costs=0.3)}))
+    energysystem.add(EnSource(label="pv", outputs={"grid": EnFlow(nominal_value=0.0, variable_costs=0.1)}))
+    energysystem.add(
+        EnSource(label="wind", outputs={"house": EnFlow(nominal_value=EnInvestment(ep_costs=0.5), max=0.0)})
+    )
+    energysystem.add(
+        EnConverter(
+            label="meter",
+            inputs={"grid": EnFlow()},
+            outputs={"house": EnFlow()},
+            conversion_factors={"house": 1.0},
+        )
+    )
+    energysystem.add(EnSink(label="demand", inputs={"house": EnFlow(nominal_value=1.0, fix=DEMAND)}))
+    energysystem.add(EnSink(label="heating", inputs={"heat": EnFlow(nominal_value=1.0, fix=[0.0] * 4)}))
+
+    return energysystem
+
+
+def _objective(energysystem: EnEnergysystem) -> float:
+    oemof_es = solph.EnergySystem(
+        timeindex=pd.date_range("2025-01-01", periods=len(DEMAND), freq="h"),
+        infer_last_interval=True,
+    )
+    energysystem.to_oemof(oemof_es)
+    model = solph.Model(oemof_es)
+    solve_model(model, Solver.highs)
+
+    return model.objective()
+
+
+def test_presolve_removes_zero_flows_and_dead_components(sample_ensys_energysystem):
+    presolved, report = presolve(sample_ensys_energysystem)
+
+    assert report.removed_flows == ["heat -> heating", "pv -> grid"]
+    assert {"pv", "heating", "heat"} <= set(report.removed_components)
+    assert [source.label for source in presolved.sources] == ["import", "wind"]
+    assert [sink.label for sink in presolved.sinks] == ["demand"]
+    # investment flows are a decision of the model even if their maximum is zero
+    assert presolved.sources[1].outputs
+
+
+@requires_highs
+def test_presolve_merges_busses_of_lossless_converters(sample_ensys_energysystem):
+    presolved, report = presolve(sample_ensys_energysystem)
+
+    assert report.merged_busses == {"house": "grid"}
+    assert [bus.label for bus in presolved.busses] == ["grid"]
+    assert presolved.converters == []
+    assert "grid" in presolved.sinks[0].inputs
+    # the input is not modified
+    assert len(sample_ensys_energysystem.busses) == 3
+    assert _objective(presolved) == pytest.approx(_objective(sample_ensys_energysystem))
+
+
+def test_presolve_keeps_lossy_converters(sample_ensys_energysystem):
+    sample_ensys_energysystem.converters[0].conversion_factors["house"] = 0.9
+
+    presolved, report = presolve(sample_ensys_energysystem)
+
+    assert report.merged_busses == {}
+    assert [converter.label for converter in presolved.converters] == ["meter"]
+
+
+def test_presolve_skips_energysystems_with_constraints(sample_ensys_energysystem):
+    sample_ensys_energysystem.add(EnConstraints(limit=10.0, keyword="emission_factor"))
+
+    presolved, report = presolve(sample_ensys_energysystem)
+
+    assert presolved is sample_ensys_energysystem
+    assert report.removed_components == []
@@ -0,0 +1,66 @@
+import copy
+
+import numpy as np
+import pytest
+from oemof import solph
+from pydantic import ValidationError
+
+from ensys.common.timeseries import TimeSeries
+from ensys.components import EnConverter, EnFlow
+
+PROFILE = [0.0, 0.25, 1, 0.5]
+
+
+def test_timeseries_validates_lists_arrays_and_base64():
+    from_list = EnFlow(fix=PROFILE)
+    from_array = EnFlow(fix=np.array(PROFILE))
+    from_base64 = EnFlow(fix=TimeSeries(PROFILE).to_base64())
+
+    assert isinstance(from_list.fix, TimeSeries)
+    assert from_list.fix.array.dtype == np.float64
+    assert from_list == from_array == from_base64
+    assert from_list.fix == PROFILE
+    assert EnFlow(fix=0.5).fix == 0.5
+
+
+@pytest.mark.parametrize("value", [[1.0, None], [[1.0, 2.0]], "no base64!", ["a", "b"]])
+def test_timeseries_rejects_invalid_values(value):
+    with pytest.raises(ValidationError):
+        EnFlow(fix=value)
+
+
+def test_timeseries_serialization():
+    flow = EnFlow(max=PROFILE, variable_costs=0.1)
+
+    assert flow.model_dump()["max"] == PROFILE
+    assert EnFlow.model_validate_json(flow.model_dump_json()) == flow
+
+    compact = flow.model_dump_json(context={"timeseries": "base64"})
+    assert isinstance(EnFlow.model_validate_json(compact).max, TimeSeries)
+    assert EnFlow.model_validate_json(compact) == flow
+
+
+def test_timeseries_is_shared_and_read_only():
+    flow = EnFlow(fix=PROFILE)
+
+    assert copy.deepcopy(flow).fix is flow.fix
+    with pytest.raises(ValueError):
+        flow.fix.array[0] = 1.0
+    assert flow.fix[1:3] == [0.25, 1.0]
+    assert flow.fix[2] == 1.0
+
+
+def test_timeseries_to_oemof():
+    energysystem = solph.EnergySystem()
+    energysystem.add(solph.Bus(label="el"), solph.Bus(label="heat"))
+
+    converter = EnConverter(
+        label="heatpump",
+        inputs={"el": EnFlow()},
+        outputs={"heat": EnFlow(nominal_value=1.0, max=PROFILE)},
+        conversion_factors={"heat": [3.0, 3.5, 4.0, 3.0]},
+    ).to_oemof(energysystem)
+
+    heat = energysystem.groups["heat"]
+    assert list(converter.outputs[heat].maximum) == PROFILE
+    assert list(converter.conversion_factors[heat]) == [3.0, 3.5, 4.0, 3.0]
@@ -6,6 +6,8 @@ export interface SimulationResModel {
     status_message: string;
     status: SimulationStatus;
     scenario_id: number;
+    partial?: boolean;
+    gap?: number | null;
 }
 
 export enum SimulationStatus {
@@ -13,4 +15,6 @@ export enum SimulationStatus {
     FINISHED = 2,
     FAILED = 3,
     STOPPED = 4,
+    QUEUED = 5,
+    LIMIT_REACHED = 6,
 }
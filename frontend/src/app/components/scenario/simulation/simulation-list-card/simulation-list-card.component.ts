@@ -33,8 +33,16 @@ export class SimulationListCardComponent {
         return item.id;
     }
 
+    hasResults(simItem: SimulationResModel): boolean {
+        return (
+            simItem.status === SimulationStatus.FINISHED ||
+            simItem.status === SimulationStatus.LIMIT_REACHED ||
+            (simItem.status === SimulationStatus.STOPPED && !!simItem.partial)
+        );
+    }
+
     openSimulation(simItem: SimulationResModel) {
-        if (simItem.status === SimulationStatus.FINISHED) {
+        if (this.hasResults(simItem)) {
             if (environment.dev_on_server_build) {
                 const url = this.router.serializeUrl(
                     this.router.createUrlTree(['/dev/simulation', simItem.id]),